@@ -10,14 +10,19 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import importlib
 import json
 import logging
+import os
 
 import click
 
 
 from .. import __version__
-from ..doc import Document
+from ..doc import BinaryCacher, Document, SqliteCacheStore
+from ..doc.reextract import RecordCache, Reextractor
+from ..nlp.tag_cache import TagCache
+from ..parse.parse_cache import ParseCache
 
 
 log = logging.getLogger(__name__)
@@ -79,9 +84,91 @@ def read(ctx, input, output):
         output.write("%s : %s\n=====\n" % (element.__class__.__name__, str(element)))
 
 
-from . import cluster, config, data, tokenize, pos, chemdner, cem, dict, evaluate
+def _import_model(name):
+    """Import a model given by its name in chemdataextractor.model, or by its full dotted path."""
+    module_name, _, class_name = name.rpartition(".")
+    try:
+        module = importlib.import_module(module_name or "chemdataextractor.model")
+        return getattr(module, class_name)
+    except (ImportError, AttributeError) as e:
+        raise click.BadParameter(
+            "Can't import model %s: %s" % (name, e), param_hint="--model"
+        )
 
 
+def _format_cache_report(counts):
+    if counts is None:
+        return "-"
+    return "%s hits, %s misses" % (counts["hits"], counts["misses"])
+
+
+@cli.command()
+@click.option(
+    "--model",
+    "-m",
+    "model_names",
+    multiple=True,
+    required=True,
+    help="Model to extract, by name or full dotted path. May be given more than once.",
+)
+@click.option(
+    "--cache",
+    "cache_dir",
+    type=click.Path(file_okay=False),
+    required=True,
+    help="Directory of the document, tag, parse and record caches.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w", encoding="utf8"),
+    help="Output file.",
+    default=click.get_text_stream("stdout"),
+)
+@click.argument("inputs", nargs=-1, required=True, type=click.Path(exists=True))
+@click.pass_obj
+def reextract(ctx, model_names, cache_dir, output, inputs):
+    """Extract records, only running models that changed since the last run."""
+    log.info("chemdataextractor.reextract")
+    models = [_import_model(name) for name in model_names]
+    reextractor = Reextractor(
+        models,
+        RecordCache(SqliteCacheStore(os.path.join(cache_dir, "records.sqlite"))),
+        document_cacher=BinaryCacher(
+            store=SqliteCacheStore(os.path.join(cache_dir, "documents.sqlite"))
+        ),
+        tag_cache=TagCache(os.path.join(cache_dir, "tag_cache.sqlite")),
+        parse_cache=ParseCache(os.path.join(cache_dir, "parse_cache.sqlite")),
+    )
+    results = {}
+    for path in inputs:
+
+        def read_document(path=path):
+            log.info("Reading %s" % path)
+            with open(path, "rb") as f:
+                return Document.from_file(f, fname=path)
+
+        records, report = reextractor.reextract(read_document, path)
+        results[path] = records
+        click.echo(
+            "%s\treused: %s\textracted: %s\tdocument cache: %s\ttag cache: %s\tparse cache: %s"
+            % (
+                path,
+                ", ".join(report["reused"]) or "-",
+                ", ".join(report["extracted"]) or "-",
+                report["document_cache"] or "-",
+                _format_cache_report(report["tag_cache"]),
+                _format_cache_report(report["parse_cache"]),
+            ),
+            err=True,
+        )
+    output.write(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+from . import cache, cluster, config, data, tokenize, pos, chemdner, cem, dict, evaluate
+
+
+cli.add_command(cache.cache_cli)
 cli.add_command(cluster.cluster_cli)
 cli.add_command(config.config_cli)
 cli.add_command(data.data_cli)
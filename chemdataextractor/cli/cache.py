@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Document cache store management interface.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+import datetime
+import logging
+
+import click
+
+from ..doc.cache_store import SqliteCacheStore
+
+
+log = logging.getLogger(__name__)
+
+
+def _open_store(path):
+    try:
+        return SqliteCacheStore.open(path)
+    except IOError as e:
+        raise click.BadParameter(str(e), param_hint="path")
+
+
+def _format_time(timestamp):
+    if timestamp is None:
+        return "-"
+    return datetime.datetime.fromtimestamp(timestamp).isoformat(
+        sep=" ", timespec="seconds"
+    )
+
+
+@click.group(name="cache")
+@click.pass_context
+def cache_cli(ctx):
+    """Document cache store commands."""
+    pass
+
+
+@cache_cli.command()
+@click.argument("path", type=click.Path(exists=True))
+@click.pass_obj
+def stats(ctx, path):
+    """Print statistics for a cache store."""
+    log.debug("chemdataextractor.cache.stats")
+    store = _open_store(path)
+    store_stats = store.stats()
+    click.echo("Shards\t%s" % store_stats["shards"])
+    click.echo("Entries\t%s" % store_stats["entries"])
+    click.echo("Size\t%s" % store_stats["size"])
+    click.echo("File size\t%s" % store_stats["file_size"])
+    click.echo("Least recently used\t%s" % _format_time(store_stats["oldest"]))
+    click.echo("Most recently used\t%s" % _format_time(store_stats["newest"]))
+    store.close()
+
+
+@cache_cli.command()
+@click.argument("path", type=click.Path(exists=True))
+@click.pass_obj
+def compact(ctx, path):
+    """Reclaim the disk space of removed entries."""
+    log.debug("chemdataextractor.cache.compact")
+    store = _open_store(path)
+    before = store.stats()["file_size"]
+    store.compact()
+    after = store.stats()["file_size"]
+    click.echo("Compacted %s from %s to %s bytes" % (path, before, after))
+    store.close()
+
+
+@cache_cli.command()
+@click.argument("path", type=click.Path(exists=True))
+@click.option(
+    "--max-size",
+    type=int,
+    help="Remove least recently used entries down to this many bytes.",
+)
+@click.option(
+    "--older-than", type=float, help="Remove entries not used for this many days."
+)
+@click.option(
+    "--compact/--no-compact", default=True, help="Compact the store afterwards."
+)
+@click.pass_obj
+def prune(ctx, path, max_size, older_than, compact):
+    """Remove old entries from a cache store."""
+    log.debug("chemdataextractor.cache.prune")
+    if max_size is None and older_than is None:
+        raise click.UsageError("Give --max-size, --older-than, or both.")
+    store = _open_store(path)
+    removed = store.prune(
+        max_size=max_size,
+        max_age=older_than * 86400 if older_than is not None else None,
+    )
+    if compact:
+        store.compact()
+    click.echo("Removed %s entries from %s" % (removed, path))
+    store.close()
@@ -24,4 +24,7 @@ from .text import (
 )
 from .figure import Figure
 from .table import Table
-from .document_cacher import PlainTextCacher
+from .cache_store import BaseCacheStore, SqliteCacheStore
+from .document_cacher import BinaryCacher, PlainTextCacher
+from .document_serializer import DocumentSerializer
+from .reextract import RecordCache, Reextractor
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Key-value stores for document caches.
+
+Rather than keeping a file or directory for every cached document, a
+:class:`~chemdataextractor.doc.document_cacher.BinaryCacher` can keep its documents in a store, which holds many
+documents in a few files.
+
+Usage::
+
+    from chemdataextractor.doc import BinaryCacher, SqliteCacheStore
+
+    cacher = BinaryCacher(store=SqliteCacheStore('path/to/document_cache', shards=8))
+    cacher.cache_document(doc, doc_id)
+
+The stores can be inspected, compacted and pruned with ``cde cache``.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from abc import ABCMeta, abstractmethod
+import glob
+import logging
+import os
+import sqlite3
+import time
+import zlib
+
+
+log = logging.getLogger(__name__)
+
+
+class BaseCacheStore(metaclass=ABCMeta):
+    """
+    Abstract key-value store, mapping string keys to bytes values.
+
+    Subclasses must implement :meth:`get_many`, :meth:`set_many`, :meth:`delete_many`, :meth:`keys`, :meth:`stats`,
+    :meth:`prune` and :meth:`compact`.
+    """
+
+    def get(self, key):
+        """
+        Get the value stored under a key.
+
+        :param str key: The key.
+        :returns: The value, or None if the key is not in the store.
+        :rtype: bytes or None
+        """
+        return self.get_many([key])[0]
+
+    @abstractmethod
+    def get_many(self, keys):
+        """
+        Get the values stored under each of the keys.
+
+        :param list(str) keys: The keys.
+        :returns: The value for each of the keys, with None for any key not in the store.
+        :rtype: list(bytes or None)
+        """
+
+    def set(self, key, value):
+        """
+        Store a value under a key, replacing any previous value.
+
+        :param str key: The key.
+        :param bytes value: The value.
+        """
+        self.set_many([(key, value)])
+
+    @abstractmethod
+    def set_many(self, items):
+        """
+        Store each of the values under its key, replacing any previous values.
+
+        :param list((str, bytes)) items: The key and value pairs.
+        """
+
+    def delete(self, key):
+        """
+        Remove a key from the store.
+
+        :param str key: The key.
+        """
+        self.delete_many([key])
+
+    @abstractmethod
+    def delete_many(self, keys):
+        """
+        Remove each of the keys from the store.
+
+        :param list(str) keys: The keys.
+        """
+
+    @abstractmethod
+    def keys(self):
+        """
+        All the keys in the store.
+
+        :rtype: list(str)
+        """
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    @abstractmethod
+    def stats(self):
+        """
+        Statistics for this store.
+
+        :rtype: dict
+        """
+
+    @abstractmethod
+    def prune(self, max_size=None, max_age=None):
+        """
+        Remove the least recently used entries.
+
+        :param int max_size: (Optional) Remove entries until the total size of the values is at most this many bytes.
+        :param float max_age: (Optional) Remove entries that have not been used for this many seconds.
+        :returns: The number of entries removed.
+        :rtype: int
+        """
+
+    @abstractmethod
+    def compact(self):
+        """Reclaim the space left on disk by removed entries."""
+
+    def close(self):
+        """Release any resources held by the store."""
+        pass
+
+
+class _SqliteShard(object):
+    """A single SQLite file of a :class:`SqliteCacheStore`."""
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._connection_pid = None
+
+    def __getstate__(self):
+        # SQLite connections can't be pickled or shared between processes
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    @property
+    def connection(self):
+        """The :class:`sqlite3.Connection` to the shard file, opened lazily once per process."""
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)"
+            )
+            connection.commit()
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def size(self):
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
+
+
+class SqliteCacheStore(BaseCacheStore):
+    """
+    A key-value store backed by SQLite files on the local disk.
+
+    With a single shard, the store is the single SQLite file at ``path``. With several shards, ``path`` is a directory
+    holding a SQLite file for each shard, and each key is stored in the shard chosen by a hash of the key. Writers
+    only lock the shards they write to, so worker processes sharing a store rarely wait for each other.
+
+    When the total size of the stored values exceeds ``max_size``, the least recently used entries are evicted. The
+    store can safely be shared by multiple processes.
+    """
+
+    #: The fraction of ``max_size`` to which the store is reduced when entries are evicted.
+    evict_to = 0.9
+
+    def __init__(self, path, max_size=2**34, shards=1):
+        """
+        :param str path: Path to the SQLite file, or with several shards, to the directory of SQLite files.
+        :param int max_size: (Optional) The maximum total size, in bytes, of the stored values. Default 16 GiB.
+        :param int shards: (Optional) The number of SQLite files the entries are spread across. Default 1.
+        """
+        if shards < 1:
+            raise ValueError("A store must have at least one shard")
+        self.path = path
+        self.max_size = max_size
+        if shards == 1:
+            directory = os.path.dirname(os.path.abspath(path))
+            shard_paths = [path]
+        else:
+            directory = path
+            shard_paths = [
+                os.path.join(path, "shard-%03d.sqlite" % i) for i in range(shards)
+            ]
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.shards = [_SqliteShard(shard_path) for shard_path in shard_paths]
+        self._written = 0
+
+    @classmethod
+    def open(cls, path, max_size=2**34):
+        """
+        Open an existing store, with the number of shards it was created with.
+
+        :param str path: Path to the SQLite file, or to the directory of SQLite files.
+        :param int max_size: (Optional) The maximum total size, in bytes, of the stored values. Default 16 GiB.
+        :rtype: SqliteCacheStore
+        """
+        if os.path.isdir(path):
+            shards = len(glob.glob(os.path.join(path, "shard-*.sqlite")))
+            if shards == 0:
+                raise IOError("No cache store shards found in %s" % path)
+            return cls(path, max_size=max_size, shards=shards)
+        if not os.path.isfile(path):
+            raise IOError("No cache store found at %s" % path)
+        return cls(path, max_size=max_size)
+
+    def __repr__(self):
+        return "<%s: %s>" % (self.__class__.__name__, self.path)
+
+    def _shard_for(self, key):
+        if len(self.shards) == 1:
+            return 0
+        return zlib.crc32(key.encode("utf-8")) % len(self.shards)
+
+    def _group(self, keys):
+        """The positions of the keys, grouped by the index of the shard each key is stored in."""
+        groups = {}
+        for i, key in enumerate(keys):
+            groups.setdefault(self._shard_for(key), []).append(i)
+        return groups
+
+    def get_many(self, keys):
+        keys = list(keys)
+        results = [None] * len(keys)
+        now = time.time()
+        for shard_index, positions in self._group(keys).items():
+            connection = self.shards[shard_index].connection
+            found = {}
+            shard_keys = list(set(keys[i] for i in positions))
+            # Stay well within SQLite's limit on the number of parameters in a query
+            for i in range(0, len(shard_keys), 500):
+                chunk = shard_keys[i : i + 500]
+                rows = connection.execute(
+                    "SELECT key, value FROM entries WHERE key IN (%s)"
+                    % ",".join("?" * len(chunk)),
+                    chunk,
+                )
+                for key, value in rows:
+                    found[key] = value
+            if found:
+                connection.executemany(
+                    "UPDATE entries SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                connection.commit()
+            for i in positions:
+                results[i] = found.get(keys[i])
+        return results
+
+    def set_many(self, items):
+        items = list(items)
+        now = time.time()
+        for shard_index, positions in self._group([key for key, _ in items]).items():
+            rows = [
+                (items[i][0], items[i][1], len(items[i][1]), now) for i in positions
+            ]
+            connection = self.shards[shard_index].connection
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            connection.commit()
+            self._written += sum(row[2] for row in rows)
+        # Only count the stored size once enough has been written since the last count that the limit might be passed
+        if self._written > self.max_size * (1 - self.evict_to):
+            self._written = 0
+            if self._stored_size() > self.max_size:
+                self.prune(max_size=int(self.max_size * self.evict_to))
+
+    def delete_many(self, keys):
+        keys = list(keys)
+        for shard_index, positions in self._group(keys).items():
+            connection = self.shards[shard_index].connection
+            connection.executemany(
+                "DELETE FROM entries WHERE key = ?", [(keys[i],) for i in positions]
+            )
+            connection.commit()
+
+    def keys(self):
+        keys = []
+        for shard in self.shards:
+            keys.extend(
+                key for (key,) in shard.connection.execute("SELECT key FROM entries")
+            )
+        return keys
+
+    def __contains__(self, key):
+        connection = self.shards[self._shard_for(key)].connection
+        row = connection.execute(
+            "SELECT 1 FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        return row is not None
+
+    def _stored_size(self):
+        return sum(shard.size() for shard in self.shards)
+
+    def stats(self):
+        """
+        Statistics for this store.
+
+        :returns: A dictionary containing the number of shards, the number of entries, the total size in bytes of the
+            stored values and of the files on disk, and the time each entry was least and most recently used.
+        :rtype: dict
+        """
+        entries = 0
+        size = 0
+        oldest = None
+        newest = None
+        file_size = 0
+        for shard in self.shards:
+            row = shard.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(last_used), MAX(last_used) FROM entries"
+            ).fetchone()
+            shard_entries, shard_size, shard_oldest, shard_newest = row
+            entries += shard_entries
+            size += shard_size
+            if shard_oldest is not None:
+                oldest = shard_oldest if oldest is None else min(oldest, shard_oldest)
+                newest = shard_newest if newest is None else max(newest, shard_newest)
+            for suffix in ("", "-wal"):
+                if os.path.isfile(shard.path + suffix):
+                    file_size += os.path.getsize(shard.path + suffix)
+        return {
+            "shards": len(self.shards),
+            "entries": entries,
+            "size": size,
+            "file_size": file_size,
+            "max_size": self.max_size,
+            "oldest": oldest,
+            "newest": newest,
+        }
+
+    def prune(self, max_size=None, max_age=None):
+        removed = 0
+        if max_age is not None:
+            cutoff = time.time() - max_age
+            for shard in self.shards:
+                connection = shard.connection
+                removed += connection.execute(
+                    "DELETE FROM entries WHERE last_used < ?", (cutoff,)
+                ).rowcount
+                connection.commit()
+        if max_size is not None:
+            # Entries are removed from each shard in proportion to its size, since keys are spread evenly by hash
+            shard_max_size = max_size / len(self.shards)
+            for shard in self.shards:
+                connection = shard.connection
+                size = shard.size()
+                to_delete = []
+                for key, entry_size in connection.execute(
+                    "SELECT key, size FROM entries ORDER BY last_used ASC"
+                ):
+                    if size <= shard_max_size:
+                        break
+                    to_delete.append((key,))
+                    size -= entry_size
+                connection.executemany("DELETE FROM entries WHERE key = ?", to_delete)
+                connection.commit()
+                removed += len(to_delete)
+        log.debug("Pruned %d entries from %s" % (removed, self))
+        return removed
+
+    def compact(self):
+        for shard in self.shards:
+            connection = shard.connection
+            connection.execute("VACUUM")
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        """Close the connections to the SQLite files."""
+        for shard in self.shards:
+            shard.close()
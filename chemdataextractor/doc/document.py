@@ -17,10 +17,12 @@ import io
 import json
 import logging
 import copy
+import multiprocessing
 
 
 from ..utils import memoized_property
 from .text import (
+    Text,
     Paragraph,
     Citation,
     Footnote,
@@ -47,6 +49,62 @@ from ..parse.cem import chemical_name
 log = logging.getLogger(__name__)
 
 
+#: In a worker process started by :meth:`Document._start_table_workers`, the copy of the Document whose tables it processes.
+_table_worker_document = None
+
+#: In a worker process, the state that is updated for each element of the Document when finding its records, as it
+#: was when the worker was started: the updatable parse expressions of the models, whether each model has been
+#: updated, and the parsers to skip.
+_table_worker_state = None
+
+#: In a worker process, the index of the first element of the Document that the models have not been updated for.
+_table_worker_position = 0
+
+
+def _init_table_worker(document):
+    """Set the Document whose tables are processed in this worker process. It is inherited when the worker is forked."""
+    global _table_worker_document, _table_worker_state, _table_worker_position
+    _table_worker_document = document
+    expressions = {}
+    updated = {}
+    for el in document.elements:
+        for model in el._streamlined_models:
+            updated[model] = model._updated
+            for field in model.fields.values():
+                if field.updatable:
+                    expressions[field] = field.parse_expression
+    _table_worker_state = (expressions, updated, list(document.skip_parsers))
+    _table_worker_position = 0
+
+
+def _find_table_records(index):
+    """
+    Find the records of the table at the given index of the elements of :data:`_table_worker_document`, in a worker
+    process.
+
+    The models are only updated for the elements after those already updated for by this worker. The tables are
+    handed out in order, so this is usually all that is needed, but if a table comes before the last one processed,
+    the updates are undone and made again from the start of the document.
+    """
+    global _table_worker_position
+    document = _table_worker_document
+    if index < _table_worker_position:
+        expressions, updated, skip_parsers = _table_worker_state
+        for field, parse_expression in expressions.items():
+            field.parse_expression = parse_expression
+        for model, model_updated in updated.items():
+            model._updated = model_updated
+        document.skip_parsers = list(skip_parsers)
+        _table_worker_position = 0
+    for el in document.elements[_table_worker_position:index]:
+        if type(el) not in document.skip_elements:
+            document._update_models_for_element(el)
+    table = document.elements[index]
+    document._update_models_for_element(table)
+    _table_worker_position = index + 1
+    return table.records
+
+
 class BaseDocument(collections.abc.Sequence, metaclass=ABCMeta):
     """Abstract base class for a Document."""
 
@@ -89,6 +147,10 @@ class Document(BaseDocument):
         :keyword list[(list[str], list[str])] adjacent_sections_for_merging: (Optional) Sections that will be treated as
             though they are adjacent for the purpose of contextual merging. All elements should be in lowercase.
         :keyword list[chemdataextractor.doc.element.BaseElement subclass] skip_elements: (Optional) Element types to be skipped in parsing
+        :keyword chemdataextractor.nlp.tag_cache.TagCache tag_cache: (Optional) Tag cache consulted before tagging the sentences in this Document.
+        :keyword chemdataextractor.parse.parse_cache.ParseCache parse_cache: (Optional) Parse cache consulted before parsing the sentences in this Document.
+        :keyword int table_workers: (Optional) Number of worker processes in which to find the records of the tables in this Document,
+            alongside those of the other elements. Needs worker processes to be forked, so is not supported on Windows. Default None.
         """
         self._elements = []
         for element in elements:
@@ -123,6 +185,18 @@ class Document(BaseDocument):
             self.skip_elements = kwargs["skip_elements"]
         else:
             self.skip_elements = []
+        if "tag_cache" in kwargs:
+            self.tag_cache = kwargs["tag_cache"]
+        else:
+            self.tag_cache = None
+        if "parse_cache" in kwargs:
+            self.parse_cache = kwargs["parse_cache"]
+        else:
+            self.parse_cache = None
+        if "table_workers" in kwargs:
+            self.table_workers = kwargs["table_workers"]
+        else:
+            self.table_workers = None
         if "_should_remove_subrecord_if_merged_in" in kwargs:
             self._should_remove_subrecord_if_merged_in = kwargs[
                 "should_remove_subrecord_if_merged_in"
@@ -215,32 +289,56 @@ class Document(BaseDocument):
 
         :param bytes fstring: A byte string containing the contents of a file.
         :param str fname: (Optional) The filename. Used to help determine file format.
-        :param list[chemdataextractor.reader.base.BaseReader] readers: (Optional) List of readers to use. If not set, Document will try all default readers,
+        :param list[chemdataextractor.reader.base.BaseReader] readers: (Optional) List of readers to use, or a
+            :class:`~chemdataextractor.reader.registry.ReaderRegistry`. If not set, Document will try all default readers,
             which are :class:`~chemdataextractor.reader.acs.AcsHtmlReader`, :class:`~chemdataextractor.reader.rsc.RscHtmlReader`,
             :class:`~chemdataextractor.reader.nlm.NlmXmlReader`, :class:`~chemdataextractor.reader.uspto.UsptoXmlReader`,
             :class:`~chemdataextractor.reader.cssp.CsspHtmlReader`, :class:`~chemdataextractor.elsevier.ElsevierXmlReader`,
             :class:`~chemdataextractor.reader.markup.XmlReader`, :class:`~chemdataextractor.reader.markup.HtmlReader`,
             :class:`~chemdataextractor.reader.pdf.PdfReader`, and :class:`~chemdataextractor.reader.plaintext.PlainTextReader`.
+            Readers whose markers are found near the start of the file are tried before generic readers.
         """
-        if readers is None:
-            from ..reader import DEFAULT_READERS
+        from ..reader import DEFAULT_READERS, ReaderRegistry
 
+        if readers is None:
             readers = DEFAULT_READERS
 
         if isinstance(fstring, str):
             raise ReaderError("from_string expects a byte string, not a unicode string")
 
-        for reader in readers:
-            # Skip reader if we don't think it can read file
-            if not reader.detect(fstring, fname=fname):
-                continue
-            try:
-                d = reader.readstring(fstring)
-                log.debug("Parsed document with %s" % reader.__class__.__name__)
-                return d
-            except ReaderError:
-                pass
-        raise ReaderError("Unable to read document")
+        if not isinstance(readers, ReaderRegistry):
+            readers = ReaderRegistry(readers)
+        return readers.read(fstring, fname=fname)
+
+    @classmethod
+    def from_bytes(cls, data, **kwargs):
+        """Create a Document from bytes written by :meth:`to_bytes`, without reading the original file again.
+
+        Usage::
+
+            data = Document.from_file('paper.html').to_bytes()
+            doc = Document.from_bytes(data)
+
+        :param bytes data: The serialized document.
+        :param kwargs: Any other keyword arguments, such as ``models``, are passed on to the Document.
+        :rtype: Document
+        """
+        from .document_serializer import DocumentSerializer
+
+        return DocumentSerializer().loads(data, document_class=cls, **kwargs)
+
+    def to_bytes(self, compression_level=6):
+        """Convert the elements of this Document to a compact binary form, which can be read with :meth:`from_bytes`.
+
+        The text, ids and references of each element are kept, along with the captions, labels and links of figures,
+        the table data of tables, and metadata. See :class:`~chemdataextractor.doc.document_serializer.DocumentSerializer`.
+
+        :param int compression_level: (Optional) The zlib compression level, from 0 to 9. Default 6.
+        :rtype: bytes
+        """
+        from .document_serializer import DocumentSerializer
+
+        return DocumentSerializer(compression_level=compression_level).dumps(self)
 
     @property
     def elements(self):
@@ -276,167 +374,157 @@ class Document(BaseDocument):
         el_records = []
 
         self._batch_parse_sentences()
+        table_pool, pending_table_records = self._start_table_workers()
 
-        # Main loop, over all elements in the document
-        for i, el in enumerate(self.elements):
+        try:
+            # Main loop, over all elements in the document
+            for i, el in enumerate(self.elements):
 
-            if type(el) in self.skip_elements:
-                continue
+                if type(el) in self.skip_elements:
+                    continue
 
-            log.debug("Element %d, type %s" % (i, str(type(el))))
-            last_id_record = None
+                log.debug("Element %d, type %s" % (i, str(type(el))))
+                last_id_record = None
 
-            # FORWARD INTERDEPENDENCY RESOLUTION -- Updated model parsers to reflect defined entities
-            # 1. Find any defined entities in the element e.g. "Curie Temperature, Tc"
-            # 2. Update the relevant models
-            element_definitions = el.definitions
-            chemical_defs = el.chemical_definitions
+                self._update_models_for_element(el)
 
-            for model in el._streamlined_models:
-                if hasattr(model, "is_id_only"):
-                    model.update(chemical_defs)
-                # TODO(ti250): Why is this an if-else? Shouldn't we be updating this for any model?
-                # - it was this way before I changed this...
+                prev_records = el_records
+                if i in pending_table_records:
+                    el_records = self._table_worker_records(el, pending_table_records.pop(i))
                 else:
-                    model.update(element_definitions)
-
-            # Check any parsers that should be skipped
-            if isinstance(el, Title) or isinstance(el, Heading):
-                self.skip_parsers = []
-                for model in el._streamlined_models:
-                    for parser in model.parsers:
-                        if hasattr(
-                            parser, "should_read_section"
-                        ) and not parser.should_read_section(el):
-                            self.skip_parsers.append(parser)
-                # print(f"\nElement: {el.text}")
-                # print(f"SKIP_PARSERS: {self.skip_parsers}")
-
-            prev_records = el_records
-            el_records = el.records
-            # Save the title compound
-            if isinstance(el, Title):
-                if (
-                    len(el_records) == 1
-                    and isinstance(el_records[0], Compound)
-                    and el_records[0].is_id_only
-                ):
-                    title_record = el_records[0]  # TODO: why the first only?
-
-            # Reset head_def_record unless consecutive heading with no records
-            if isinstance(el, Heading) and head_def_record is not None:
-                if not (i == head_def_record_i + 1 and len(el_records) == 0):
-                    head_def_record = None
-                    head_def_record_i = None
-
-            # Paragraph with single sentence with single ID record considered a head_def_record
-            if isinstance(el, Paragraph) and len(el.sentences) == 1:
-                if (
-                    len(el_records) == 1
-                    and isinstance(el_records[0], Compound)
-                    and el_records[0].is_id_only
-                ):
-                    head_def_record = el_records[0]
-                    head_def_record_i = i
-
-            # Paragraph with multiple sentences
-            # We assume that if the first sentence of a paragraph contains only 1 ID Record, we can treat it as a header definition record, unless directly proceeding a header def record
-            elif isinstance(el, Paragraph) and len(el.sentences) > 0:
-                if not (
-                    isinstance(self.elements[i - 1], Heading)
-                    and head_def_record_i == i - 1
-                ):
-                    first_sent_records = el.sentences[0].records
+                    el_records = el.records
+                # Save the title compound
+                if isinstance(el, Title):
                     if (
-                        len(first_sent_records) == 1
-                        and isinstance(first_sent_records[0], Compound)
-                        and first_sent_records[0].is_id_only
+                        len(el_records) == 1
+                        and isinstance(el_records[0], Compound)
+                        and el_records[0].is_id_only
                     ):
-                        sent_record = first_sent_records[0]
-                        if sent_record.names:
-                            longest_name = sorted(sent_record.names, key=len)[0]
-                        if sent_record.labels or (
-                            sent_record.names
-                            and len(longest_name) > len(el.sentences[0].text) / 2
-                        ):  # TODO: Why do the length check? Maybe to make sure that the sentence mostly refers to a compound?
-                            head_def_record = sent_record
-                            head_def_record_i = i
+                        title_record = el_records[0]  # TODO: why the first only?
 
-            cleaned_el_records = []
-            #: BACKWARD INTERDEPENDENCY RESOLUTION BEGINS HERE
-            for record in el_records:
-                if isinstance(record, MetaData):
-                    continue
-                if isinstance(record, Compound):
-                    # Keep track of the most recent compound record with labels
-                    if isinstance(el, Paragraph) and record.labels:
-                        last_id_record = record
-                    # # Keep track of the most recent compound 'product' record
-                    if record.roles and "product" in record.roles:
-                        last_product_record = record
-
-                    # Heading records with compound ID's
-                    if isinstance(el, Heading) and (record.labels or record.names):
-                        head_def_record = record
+                # Reset head_def_record unless consecutive heading with no records
+                if isinstance(el, Heading) and head_def_record is not None:
+                    if not (i == head_def_record_i + 1 and len(el_records) == 0):
+                        head_def_record = None
+                        head_def_record_i = None
+
+                # Paragraph with single sentence with single ID record considered a head_def_record
+                if isinstance(el, Paragraph) and len(el.sentences) == 1:
+                    if (
+                        len(el_records) == 1
+                        and isinstance(el_records[0], Compound)
+                        and el_records[0].is_id_only
+                    ):
+                        head_def_record = el_records[0]
                         head_def_record_i = i
-                        # If 2 consecutive headings with compound ID, merge in from previous
-                        if i > 0 and isinstance(self.elements[i - 1], Heading):
-                            prev = self.elements[i - 1]
-                            if (
-                                len(el_records) == 1
-                                and record.is_id_only
-                                and len(prev_records) == 1
-                                and isinstance(prev_records[0], Compound)
-                                and prev_records[0].is_id_only
-                                and not (record.labels and prev_records[0].labels)
-                                and not (record.names and prev_records[0].names)
-                            ):
-                                record.names.update(prev_records[0].names)
-                                record.labels.update(prev_records[0].labels)
-                                record.roles.update(prev_records[0].roles)
-
-                # Unidentified records -- those without compound names or labels
-                if record.is_unidentified:
-                    if hasattr(record, "compound"):
-                        # We have property values but no names or labels... try merge those from previous records
-                        if isinstance(el, Paragraph) and (
-                            head_def_record
-                            or last_product_record
-                            or last_id_record
-                            or title_record
+
+                # Paragraph with multiple sentences
+                # We assume that if the first sentence of a paragraph contains only 1 ID Record, we can treat it as a header definition record, unless directly proceeding a header def record
+                elif isinstance(el, Paragraph) and len(el.sentences) > 0:
+                    if not (
+                        isinstance(self.elements[i - 1], Heading)
+                        and head_def_record_i == i - 1
+                    ):
+                        first_sent_records = el.sentences[0].records
+                        if (
+                            len(first_sent_records) == 1
+                            and isinstance(first_sent_records[0], Compound)
+                            and first_sent_records[0].is_id_only
                         ):
-                            # head_def_record from heading takes priority if the heading directly precedes the paragraph ( NOPE: or the last_id_record has no name)
-                            if (
-                                head_def_record_i and head_def_record_i + 1 == i
-                            ):  # or (last_id_record and not last_id_record.names)):
-                                if head_def_record:
-                                    record.compound = head_def_record
-                                elif last_id_record:
-                                    record.compound = last_id_record
-                                elif last_product_record:
-                                    record.compound = last_product_record
-                                elif title_record:
-                                    record.compound = title_record
+                            sent_record = first_sent_records[0]
+                            if sent_record.names:
+                                longest_name = sorted(sent_record.names, key=len)[0]
+                            if sent_record.labels or (
+                                sent_record.names
+                                and len(longest_name) > len(el.sentences[0].text) / 2
+                            ):  # TODO: Why do the length check? Maybe to make sure that the sentence mostly refers to a compound?
+                                head_def_record = sent_record
+                                head_def_record_i = i
+
+                cleaned_el_records = []
+                #: BACKWARD INTERDEPENDENCY RESOLUTION BEGINS HERE
+                for record in el_records:
+                    if isinstance(record, MetaData):
+                        continue
+                    if isinstance(record, Compound):
+                        # Keep track of the most recent compound record with labels
+                        if isinstance(el, Paragraph) and record.labels:
+                            last_id_record = record
+                        # # Keep track of the most recent compound 'product' record
+                        if record.roles and "product" in record.roles:
+                            last_product_record = record
+
+                        # Heading records with compound ID's
+                        if isinstance(el, Heading) and (record.labels or record.names):
+                            head_def_record = record
+                            head_def_record_i = i
+                            # If 2 consecutive headings with compound ID, merge in from previous
+                            if i > 0 and isinstance(self.elements[i - 1], Heading):
+                                prev = self.elements[i - 1]
+                                if (
+                                    len(el_records) == 1
+                                    and record.is_id_only
+                                    and len(prev_records) == 1
+                                    and isinstance(prev_records[0], Compound)
+                                    and prev_records[0].is_id_only
+                                    and not (record.labels and prev_records[0].labels)
+                                    and not (record.names and prev_records[0].names)
+                                ):
+                                    record.names.update(prev_records[0].names)
+                                    record.labels.update(prev_records[0].labels)
+                                    record.roles.update(prev_records[0].roles)
+
+                    # Unidentified records -- those without compound names or labels
+                    if record.is_unidentified:
+                        if hasattr(record, "compound"):
+                            # We have property values but no names or labels... try merge those from previous records
+                            if isinstance(el, Paragraph) and (
+                                head_def_record
+                                or last_product_record
+                                or last_id_record
+                                or title_record
+                            ):
+                                # head_def_record from heading takes priority if the heading directly precedes the paragraph ( NOPE: or the last_id_record has no name)
+                                if (
+                                    head_def_record_i and head_def_record_i + 1 == i
+                                ):  # or (last_id_record and not last_id_record.names)):
+                                    if head_def_record:
+                                        record.compound = head_def_record
+                                    elif last_id_record:
+                                        record.compound = last_id_record
+                                    elif last_product_record:
+                                        record.compound = last_product_record
+                                    elif title_record:
+                                        record.compound = title_record
+                                else:
+                                    if last_id_record:
+                                        record.compound = last_id_record
+                                    elif head_def_record:
+                                        record.compound = head_def_record
+                                    elif last_product_record:
+                                        record.compound = last_product_record
+                                    elif title_record:
+                                        record.compound = title_record
                             else:
-                                if last_id_record:
-                                    record.compound = last_id_record
-                                elif head_def_record:
-                                    record.compound = head_def_record
-                                elif last_product_record:
-                                    record.compound = last_product_record
-                                elif title_record:
-                                    record.compound = title_record
-                        else:
-                            # Consider continue here to filter records missing name/label...
-                            pass
-                if record not in records:
-                    log.debug(record.serialize())
-                    cleaned_el_records.append(record)
-
-            records.extend(cleaned_el_records)
-            records_by_el.append(cleaned_el_records)
-            for record in cleaned_el_records:
-                record_id_el_map[id(record)] = el
+                                # Consider continue here to filter records missing name/label...
+                                pass
+                    if record not in records:
+                        log.debug(record.serialize())
+                        cleaned_el_records.append(record)
+
+                records.extend(cleaned_el_records)
+                records_by_el.append(cleaned_el_records)
+                for record in cleaned_el_records:
+                    record_id_el_map[id(record)] = el
+        except BaseException:
+            # Stop the workers rather than waiting for the tables left
+            if table_pool is not None:
+                table_pool.terminate()
+            raise
+        finally:
+            if table_pool is not None:
+                table_pool.close()
+                table_pool.join()
 
         # for record in records:
         #     for contextual_record in contextual_records:
@@ -762,6 +850,95 @@ class Document(BaseDocument):
         html_lines.append("</div>")
         return "\n".join(html_lines)
 
+    def _update_models_for_element(self, el):
+        """
+        Update the models and the parsers to skip for the given element, before its records are found.
+        This is done for each element in turn when finding the records of this Document.
+
+        :param BaseElement el: The element
+        """
+        # FORWARD INTERDEPENDENCY RESOLUTION -- Updated model parsers to reflect defined entities
+        # 1. Find any defined entities in the element e.g. "Curie Temperature, Tc"
+        # 2. Update the relevant models
+        element_definitions = el.definitions
+        chemical_defs = el.chemical_definitions
+
+        for model in el._streamlined_models:
+            if hasattr(model, "is_id_only"):
+                model.update(chemical_defs)
+            # TODO(ti250): Why is this an if-else? Shouldn't we be updating this for any model?
+            # - it was this way before I changed this...
+            else:
+                model.update(element_definitions)
+
+        # Check any parsers that should be skipped
+        if isinstance(el, Title) or isinstance(el, Heading):
+            self.skip_parsers = []
+            for model in el._streamlined_models:
+                for parser in model.parsers:
+                    if hasattr(
+                        parser, "should_read_section"
+                    ) and not parser.should_read_section(el):
+                        self.skip_parsers.append(parser)
+
+    def _start_table_workers(self):
+        """
+        Start finding the records of the tables in this Document in a pool of :attr:`table_workers` worker processes,
+        so that they are found alongside the records of the other elements.
+
+        The workers are forked from this process, so each starts with a copy of this Document, including any tags
+        already assigned. For each table, a worker first updates the models for the elements up to the table that it
+        has not yet updated them for, as is done when finding the records of this Document, so the records are the
+        same as those found serially.
+
+        :return: The pool, or None if no workers were started, and a dictionary of the indices of the tables in
+            :attr:`elements` to the pending results for their records.
+        :rtype: (multiprocessing.pool.Pool or None, dict(int, multiprocessing.pool.AsyncResult))
+        """
+        if not self.table_workers or self.table_workers < 2:
+            return None, {}
+        indices = [
+            i
+            for i, el in enumerate(self.elements)
+            if isinstance(el, Table) and type(el) not in self.skip_elements
+        ]
+        if len(indices) < 2:
+            return None, {}
+        if "fork" not in multiprocessing.get_all_start_methods():
+            log.warning(
+                "Finding the records of tables serially, as worker processes can not be forked on this platform"
+            )
+            return None, {}
+
+        # Find the definitions now, so that the workers don't each have to find them again
+        for el in self.elements[: indices[-1] + 1]:
+            if type(el) not in self.skip_elements:
+                el.definitions
+                el.chemical_definitions
+
+        pool = multiprocessing.get_context("fork").Pool(
+            min(self.table_workers, len(indices)),
+            initializer=_init_table_worker,
+            initargs=(self,),
+        )
+        pending = {i: pool.apply_async(_find_table_records, (i,)) for i in indices}
+        return pool, pending
+
+    def _table_worker_records(self, table, pending):
+        """
+        The records of a table found by a worker process. If the worker failed, for example because the records
+        could not be pickled, the records are found in this process instead.
+
+        :param Table table: The table
+        :param multiprocessing.pool.AsyncResult pending: The pending result from the worker
+        :rtype: ModelList
+        """
+        try:
+            return pending.get()
+        except Exception as e:
+            log.warning("Finding the records of a table serially, as its worker failed: %s" % e)
+            return table.records
+
     def _batch_assign_tags(self, tagger, tag_type):
         """
         Batch assign all the tags for a certain tag type.
@@ -770,29 +947,89 @@ class Document(BaseDocument):
         tag type implements the `batch_tag` method.
 
         See :ref:`this guide<creating_taggers>` for more details.
+
+        If this Document has a :attr:`tag_cache`, any sentences whose tags are found in the cache
+        are not passed to the tagger, and the tags for the rest are stored in the cache.
         """
+        self._batch_segment_sentences()
         elements = copy.copy(self.elements)
 
         all_tokens = []
+        all_upstream = []
+        seen_sentences = set()
         for element in elements:
-            if element.elements is not None:
+            if isinstance(element, Table):
+                elements.extend(element._elements_for_tagging)
+            elif element.elements is not None:
                 elements.extend(element.elements)
-            if hasattr(element, "tokens") and tagger in element.taggers:
-                if (
-                    len(element.tokens)
-                    and isinstance(element.tokens[0], RichToken)
-                    and tag_type not in element.tokens[0]._tags
-                ):
-                    all_tokens.append(element.tokens)
+            # Table cells share their tokens' tags with the sentences for the text of each of their
+            # cells, which are in turn shared between the cells of a table, so tag those sentences instead
+            if isinstance(element, Cell) and element.is_tde_cell:
+                sentences = element._tagged_sentences
+            else:
+                sentences = [element]
+            for sentence in sentences:
+                if id(sentence) in seen_sentences:
+                    continue
+                seen_sentences.add(id(sentence))
+                if hasattr(sentence, "tokens") and tagger in sentence.taggers:
+                    if (
+                        len(sentence.tokens)
+                        and isinstance(sentence.tokens[0], RichToken)
+                        and tag_type not in sentence.tokens[0]._tags
+                    ):
+                        all_tokens.append(sentence.tokens)
+                        all_upstream.append(
+                            sentence._upstream_cache_identities(tagger)
+                        )
+
+        tag_cache = self.tag_cache
+        if tag_cache is not None and not tag_cache.can_cache(tag_type):
+            tag_cache = None
+
+        if tag_cache is not None:
+            all_cached_tags = tag_cache.get_many(
+                tagger,
+                tag_type,
+                [[token.text for token in tokens] for tokens in all_tokens],
+                all_upstream,
+            )
+            uncached_tokens = []
+            uncached_upstream = []
+            for tokens, upstream, cached_tags in zip(
+                all_tokens, all_upstream, all_cached_tags
+            ):
+                if cached_tags is None:
+                    uncached_tokens.append(tokens)
+                    uncached_upstream.append(upstream)
+                else:
+                    for token, tag in zip(tokens, cached_tags):
+                        token._tags[tag_type] = tag
+            all_tokens = uncached_tokens
+            all_upstream = uncached_upstream
+            if not all_tokens:
+                return
 
         if hasattr(tagger, "batch_tag_for_type"):
             tag_results = tagger.batch_tag_for_type(all_tokens, tag_type)
         else:
             tag_results = tagger.batch_tag(all_tokens)
 
-        for tag_result in tag_results:
+        raw_sents = []
+        all_tags = []
+        cached_upstream = []
+        for tag_result, upstream in zip(tag_results, all_upstream):
+            sent_tags = []
             for token, tag in tag_result:
                 token._tags[tag_type] = tag
+                sent_tags.append((token.text, tag))
+            if sent_tags:
+                raw_sents.append([text for text, tag in sent_tags])
+                all_tags.append([tag for text, tag in sent_tags])
+                cached_upstream.append(upstream)
+
+        if tag_cache is not None:
+            tag_cache.set_many(tagger, tag_type, raw_sents, all_tags, cached_upstream)
 
     def _batch_parse_sentences(self):
         sentences = self.sentences
@@ -822,8 +1059,40 @@ class Document(BaseDocument):
             batch_parser._batch_parsed_records_dict = {}
         self._batch_parsers = []
 
+    def _batch_segment_sentences(self):
+        """
+        Split all the text elements in this Document that have not yet been split into sentences,
+        with one call to each sentence tokenizer, instead of splitting each element separately
+        when its sentences are first needed.
+        """
+        elements = copy.copy(self.elements)
+
+        texts_for_tokenizer = collections.OrderedDict()
+        for element in elements:
+            if isinstance(element, Text):
+                if not hasattr(element, "_sentences"):
+                    tokenizer = element.sentence_tokenizer
+                    if id(tokenizer) not in texts_for_tokenizer:
+                        texts_for_tokenizer[id(tokenizer)] = (tokenizer, [])
+                    texts_for_tokenizer[id(tokenizer)][1].append(element)
+            elif isinstance(element, Table):
+                elements.extend(element._elements_for_tagging)
+            elif element.elements is not None:
+                elements.extend(element.elements)
+
+        for tokenizer, texts in texts_for_tokenizer.values():
+            if hasattr(tokenizer, "batch_get_sentences"):
+                all_sents = tokenizer.batch_get_sentences(texts)
+            else:
+                all_sents = [tokenizer.get_sentences(text) for text in texts]
+            for text, sents in zip(texts, all_sents):
+                for sent in sents:
+                    sent.document = text.document
+                text._sentences = sents
+
     @property
     def sentences(self):
+        self._batch_segment_sentences()
         elements = copy.copy(self.elements)
 
         sentences = []
@@ -1,7 +1,13 @@
 from .text import RichToken, Subsentence
+from array import array
+import ast
+import mmap
 import os
 import shutil
 import json
+import struct
+import sys
+import tempfile
 import unicodedata
 
 
@@ -102,15 +108,6 @@ class PlainTextCacher:
                     indices.append([token.index for token in subsentence.tokens])
                 f.write(str(indices) + "\n")
 
-        with open(
-            self._document_subsentence_cache_path(cache_location_root), "w+"
-        ) as f:
-            for sentence in sentences:
-                indices = []
-                for subsentence in sentence.subsentences:
-                    indices.append([token.index for token in subsentence.tokens])
-                f.write(str(indices) + "\n")
-
     def hydrate_document(self, document, document_id, tags=None):
         # Add in all the tags, tokenisation for a document.
         document_configuration = get_document_configuration(document)
@@ -140,10 +137,7 @@ class PlainTextCacher:
                 cache_location_root, document_configuration["tokenizer"]
             )
         ) as f:
-            # Need to remove the final element as it will be an empty one
-            tokenized_sentences = [sent.split("🙃") for sent in f.read().split("🔥")][
-                :-1
-            ]
+            tokenized_sentences = self._read_delimited(f)
             for sentence, tokenized_sentence in zip(sentences, tokenized_sentences):
                 # TODO(ti250): We currently don't retain spans correctly here; what to do? We can always actually cache this...
                 toks = [
@@ -179,7 +173,7 @@ class PlainTextCacher:
             with open(
                 self._document_tag_cache_path(cache_location_root, tag_type)
             ) as f:
-                all_tags = [sent.split("🙃") for sent in f.read().split("🔥")][:-1]
+                all_tags = self._read_delimited(f)
                 for sentence, sentence_tags in zip(sentences, all_tags):
                     tokens = sentence.tokens
                     for token, tag in zip(tokens, sentence_tags):
@@ -205,6 +199,15 @@ class PlainTextCacher:
 
         return document
 
+    def _read_delimited(self, f):
+        # The file holds the reprs of utf-8 encoded bytes, which are adjacent bytes literals that concatenate
+        contents = f.read().strip()
+        if not contents:
+            return []
+        contents = ast.literal_eval(contents).decode("utf-8")
+        # Need to remove the final element as it will be an empty one
+        return [sent.split("🙃") if sent else [] for sent in contents.split("🔥")][:-1]
+
     def _safe_document_id(self, document_id):
         return document_id.replace(".", "🔥").replace("/", "😅")
 
@@ -219,3 +222,410 @@ class PlainTextCacher:
 
     def _document_tag_cache_path(self, cache_location_root, tag):
         return os.path.join(cache_location_root, "tag__" + tag + ".txt")
+
+
+def _index_typecode(size):
+    # The smallest unsigned array typecode that can index a vocabulary of the given size
+    for typecode in ("B", "H", "I"):
+        if size <= 1 << (8 * array(typecode).itemsize):
+            return typecode
+    return "Q"
+
+
+def _pad(length, alignment=8):
+    return -length % alignment
+
+
+class _CacheFile:
+    """
+    A cached document written by :class:`BinaryCacher`, held in memory or memory mapped from a file. Sections are
+    read in place through typed memoryviews, and the tokens and subsentences of each sentence are only built when the
+    sentence asks for them.
+    """
+
+    def __init__(self, data, name, path=None, tags=None):
+        self.name = name
+        self.path = path
+        self._data = data
+        buf = memoryview(data)
+        magic_length = len(BinaryCacher.MAGIC)
+        if bytes(buf[:magic_length]) != BinaryCacher.MAGIC:
+            raise AttributeError(f"{name} is not a document cache")
+        version, header_length = struct.unpack_from("<HI", buf, magic_length)
+        if version != BinaryCacher.VERSION:
+            raise AttributeError(
+                f"{name} has cache version {version}, expected {BinaryCacher.VERSION}"
+            )
+        header_start = magic_length + struct.calcsize("<HI")
+        self.header = json.loads(
+            bytes(buf[header_start : header_start + header_length]).decode("utf-8")
+        )
+        data_start = header_start + header_length
+        data_start += _pad(data_start)
+        self.configuration = self.header["configuration"]
+        self.sentence_count = self.header["sentences"]
+        self.vocabularies = self.header["tags"]
+        self.tags = list(self.vocabularies) if tags is None else tags
+        missing_tags = set(self.tags) - set(self.vocabularies)
+        if missing_tags:
+            raise AttributeError(
+                f"{name} has no cached values for tags {sorted(missing_tags)}"
+            )
+        swap = self.header["byteorder"] != sys.byteorder
+        self._sections = {}
+        for name, (offset, typecode, length) in self.header["sections"].items():
+            start = data_start + offset
+            if typecode == "s":
+                self._sections[name] = buf[start : start + length]
+                continue
+            view = buf[start : start + length * array(typecode).itemsize]
+            if swap:
+                # Only copy when the file was written on a machine of the other byte order
+                values = array(typecode)
+                values.frombytes(view)
+                values.byteswap()
+                self._sections[name] = values
+            else:
+                self._sections[name] = view.cast(typecode)
+
+    @classmethod
+    def from_path(cls, path, tags=None):
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, path, path=path, tags=tags)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        # Memory maps can't be pickled, so files are mapped again when unpickled
+        state = {"name": self.name, "path": self.path, "tags": self.tags}
+        if self.path is None:
+            state["data"] = bytes(self._data)
+        return state
+
+    def __setstate__(self, state):
+        if state["path"] is None:
+            self.__init__(state["data"], state["name"], tags=state["tags"])
+        else:
+            with open(state["path"], "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__init__(data, state["name"], path=state["path"], tags=state["tags"])
+
+    def sentence_tokens(self, index, sentence):
+        sections = self._sections
+        first = sections["sentence_tokens"][index]
+        last = sections["sentence_tokens"][index + 1]
+        text_offsets = sections["token_text_offsets"]
+        text_start = text_offsets[first]
+        text = bytes(sections["token_text"][text_start : text_offsets[last]])
+        starts = sections["token_starts"]
+        ends = sections["token_ends"]
+        tokens = []
+        for i in range(first, last):
+            tokens.append(
+                RichToken(
+                    text=text[
+                        text_offsets[i] - text_start : text_offsets[i + 1] - text_start
+                    ].decode("utf-8"),
+                    start=starts[i],
+                    end=ends[i],
+                    lexicon=sentence.lexicon,
+                    sentence=sentence,
+                )
+            )
+        for tag_type in self.tags:
+            vocabulary = self.vocabularies[tag_type]
+            indices = sections["tag:" + tag_type]
+            for token, i in zip(tokens, range(first, last)):
+                token._tags[tag_type] = vocabulary[indices[i]]
+        return tokens
+
+    def sentence_subsentences(self, index, sentence):
+        """The subsentences of the sentence as lists of its tokens, or None if they were not cached."""
+        sections = self._sections
+        if "sentence_subsentences" not in sections:
+            return None
+        subsentence_tokens = sections["subsentence_tokens"]
+        offsets = sections["subsentence_token_offsets"]
+        tokens = sentence.tokens
+        subsentences = []
+        for i in range(
+            sections["sentence_subsentences"][index],
+            sections["sentence_subsentences"][index + 1],
+        ):
+            subsentences.append(
+                [
+                    tokens[position]
+                    for position in subsentence_tokens[offsets[i] : offsets[i + 1]]
+                ]
+            )
+        return subsentences
+
+
+class BinaryCacher:
+    """
+    Caches the tokenization, tags and subsentences of documents in a single binary file per document, or as a
+    single value per document in a :class:`~chemdataextractor.doc.cache_store.BaseCacheStore`.
+
+    Each file starts with :attr:`MAGIC`, a version number and a JSON header holding the tokenizer and tagger
+    configuration, the vocabulary of each cached tag and the position of each section. The sections are flat arrays:
+    the token range of each sentence, the utf-8 text and offsets of each token, the start and end of each token, one
+    column of vocabulary indices per tag, and the token positions of each subsentence. Hydrating a document memory maps
+    the file and only builds the tokens of a sentence when they are first used.
+
+    Documents cached by :class:`PlainTextCacher` in the same cache location can still be hydrated. Documents held in
+    a store are read into memory rather than memory mapped.
+
+    Tags must be strings or other JSON values.
+    """
+
+    MAGIC = b"CDEDOC"
+    VERSION = 1
+    EXTENSION = ".cdedoc"
+
+    def __init__(self, cache_location=None, store=None):
+        """
+        :param str cache_location: (Optional) The directory the cache files are written to.
+        :param BaseCacheStore store: (Optional) The store the cached documents are kept in, instead of a directory.
+        """
+        if (cache_location is None) == (store is None):
+            raise ValueError("Exactly one of cache_location and store must be given")
+        self.cache_location = cache_location
+        self.store = store
+        if cache_location is not None and not os.path.isdir(self.cache_location):
+            os.makedirs(self.cache_location)
+
+    def cache_document(
+        self,
+        document,
+        document_id,
+        tags=None,
+        save_subsentences=True,
+        overwrite_cache=False,
+    ):
+        self.cache_documents(
+            [document],
+            [document_id],
+            tags=tags,
+            save_subsentences=save_subsentences,
+            overwrite_cache=overwrite_cache,
+        )
+
+    def cache_documents(
+        self,
+        documents,
+        document_ids,
+        tags=None,
+        save_subsentences=True,
+        overwrite_cache=False,
+    ):
+        """
+        Cache several documents. With a store, the documents are written in a single batch.
+
+        :param list(Document) documents: The documents.
+        :param list(str) document_ids: The identifier of each document.
+        :param list(str) tags: (Optional) The tag types to cache. Defaults to the NER and PoS tags.
+        :param bool save_subsentences: (Optional) Whether to cache the subsentences of each sentence. Default True.
+        :param bool overwrite_cache: (Optional) Whether to replace documents that are already cached. Default False.
+        """
+        document_ids = list(document_ids)
+        if not overwrite_cache:
+            for document_id in document_ids:
+                if self._is_cached(document_id):
+                    raise AttributeError(
+                        f"{document_id} is already cached! Enable overwrite_cache to overwrite the previous cache."
+                    )
+        items = [
+            (document_id, self._serialize(document, tags, save_subsentences))
+            for document, document_id in zip(documents, document_ids)
+        ]
+        if self.store is not None:
+            self.store.set_many(items)
+            return
+        for document_id, data in items:
+            # Write to a temporary file first so that readers never see a partly written cache
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_location, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._document_cache_path(document_id))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+
+    def _is_cached(self, document_id):
+        if self.store is not None:
+            return document_id in self.store
+        return os.path.exists(self._document_cache_path(document_id))
+
+    def _serialize(self, document, tags=None, save_subsentences=True):
+        """The contents of the cache file for a document."""
+        if tags is None:
+            tags = ["ner_tag", "pos_tag"]
+        document_configuration = get_document_configuration(document)
+        sentences = document.sentences
+
+        sentence_tokens = array("I", [0])
+        token_text = bytearray()
+        token_text_offsets = array("I", [0])
+        token_starts = array("i")
+        token_ends = array("i")
+        vocabularies = {tag: {None: 0} for tag in tags}
+        tag_indices = {tag: [] for tag in tags}
+        sentence_subsentences = array("I", [0])
+        subsentence_token_offsets = array("I", [0])
+        subsentence_tokens = array("I")
+
+        for sentence in sentences:
+            tokens = sentence.tokens
+            for token in tokens:
+                token_text += token.text.encode("utf-8")
+                token_text_offsets.append(len(token_text))
+                token_starts.append(token.start)
+                token_ends.append(token.end)
+            sentence_tokens.append(len(token_starts))
+            for tag in tags:
+                vocabulary = vocabularies[tag]
+                indices = tag_indices[tag]
+                for token in tokens:
+                    indices.append(vocabulary.setdefault(token[tag], len(vocabulary)))
+            if save_subsentences:
+                positions = {id(token): i for i, token in enumerate(tokens)}
+                for subsentence in sentence.subsentences:
+                    subsentence_tokens.extend(
+                        positions[id(token)] for token in subsentence.tokens
+                    )
+                    subsentence_token_offsets.append(len(subsentence_tokens))
+                sentence_subsentences.append(len(subsentence_token_offsets) - 1)
+
+        sections = [
+            ("sentence_tokens", sentence_tokens),
+            ("token_text_offsets", token_text_offsets),
+            ("token_text", token_text),
+            ("token_starts", token_starts),
+            ("token_ends", token_ends),
+        ]
+        for tag in tags:
+            sections.append(
+                (
+                    "tag:" + tag,
+                    array(_index_typecode(len(vocabularies[tag])), tag_indices[tag]),
+                )
+            )
+        if save_subsentences:
+            sections.extend(
+                [
+                    ("sentence_subsentences", sentence_subsentences),
+                    ("subsentence_token_offsets", subsentence_token_offsets),
+                    ("subsentence_tokens", subsentence_tokens),
+                ]
+            )
+
+        section_positions = {}
+        offset = 0
+        for name, values in sections:
+            typecode = values.typecode if isinstance(values, array) else "s"
+            section_positions[name] = [offset, typecode, len(values)]
+            length = len(values) * (
+                values.itemsize if isinstance(values, array) else 1
+            )
+            offset += length + _pad(length)
+        header = json.dumps(
+            {
+                "configuration": document_configuration,
+                "byteorder": sys.byteorder,
+                "sentences": len(sentences),
+                "tags": {tag: list(vocabularies[tag]) for tag in tags},
+                "sections": section_positions,
+            }
+        ).encode("utf-8")
+
+        prefix = self.MAGIC + struct.pack("<HI", self.VERSION, len(header)) + header
+        chunks = [prefix, b"\0" * _pad(len(prefix))]
+        for name, values in sections:
+            data = values.tobytes() if isinstance(values, array) else bytes(values)
+            chunks.extend([data, b"\0" * _pad(len(data))])
+        return b"".join(chunks)
+
+    def hydrate_document(self, document, document_id, tags=None):
+        # Tags default to all the tags that were cached
+        return self.hydrate_documents([document], [document_id], tags=tags)[0]
+
+    def hydrate_documents(self, documents, document_ids, tags=None):
+        """
+        Hydrate several documents. With a store, the documents are read in a single batch.
+
+        :param list(Document) documents: The documents.
+        :param list(str) document_ids: The identifier of each document.
+        :param list(str) tags: (Optional) The tag types to restore. Defaults to all the cached tag types.
+        :returns: The documents.
+        :rtype: list(Document)
+        """
+        document_ids = list(document_ids)
+        if self.store is not None:
+            values = self.store.get_many(document_ids)
+            for document_id, data in zip(document_ids, values):
+                if data is None:
+                    raise AttributeError(f"{document_id} is not cached")
+            cache_files = [
+                _CacheFile(data, document_id, tags=tags)
+                for document_id, data in zip(document_ids, values)
+            ]
+        else:
+            cache_files = []
+            for document_id in document_ids:
+                path = self._document_cache_path(document_id)
+                cache_files.append(
+                    _CacheFile.from_path(path, tags=tags)
+                    if os.path.exists(path)
+                    else None
+                )
+
+        for document, document_id, cache_file in zip(
+            documents, document_ids, cache_files
+        ):
+            if cache_file is None:
+                self._hydrate_legacy(document, document_id, tags)
+            else:
+                self._hydrate(document, document_id, cache_file)
+        return list(documents)
+
+    def _hydrate_legacy(self, document, document_id, tags):
+        legacy_cacher = PlainTextCacher(self.cache_location)
+        if not os.path.isdir(
+            os.path.join(
+                self.cache_location, legacy_cacher._safe_document_id(document_id)
+            )
+        ):
+            raise AttributeError(f"{document_id} is not cached")
+        legacy_cacher.hydrate_document(document, document_id, tags=tags)
+
+    def _hydrate(self, document, document_id, cache_file):
+        document_configuration = get_document_configuration(document)
+        if (
+            cache_file.configuration["tokenizer"] != document_configuration["tokenizer"]
+            or cache_file.configuration["taggers"] != document_configuration["taggers"]
+        ):
+            raise AttributeError(
+                f"Cached value for tokenizers and taggers don't match for {document_id}"
+            )
+        sentences = document.sentences
+        if len(sentences) != cache_file.sentence_count:
+            raise AttributeError(
+                f"Cached document has {cache_file.sentence_count} sentences but {document_id} has {len(sentences)}"
+            )
+
+        for index, sentence in enumerate(sentences):
+            for attr_name in ("_tokens", "_subsentences"):
+                if attr_name in sentence.__dict__:
+                    delattr(sentence, attr_name)
+            sentence._cache_entry = (cache_file, index)
+
+    def _safe_document_id(self, document_id):
+        return document_id.replace(".", "🔥").replace("/", "😅")
+
+    def _document_cache_path(self, document_id):
+        return os.path.join(
+            self.cache_location, self._safe_document_id(document_id) + self.EXTENSION
+        )
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary serialization of the elements of documents.
+
+Reading HTML, XML or PDF files is slow, so documents can be read once and passed on as bytes, which are turned back
+into a :class:`~chemdataextractor.doc.document.Document` without parsing any markup.
+
+Usage::
+
+    data = Document.from_file('paper.html').to_bytes()
+    doc = Document.from_bytes(data)
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import json
+import logging
+import struct
+import zlib
+
+from ..errors import ReaderError
+from .element import BaseElement
+from .figure import Figure
+from .meta import MetaData
+from .table import Table
+from .text import (
+    Caption,
+    Cell,
+    Citation,
+    Footnote,
+    Heading,
+    Paragraph,
+    Sentence,
+    Text,
+    Title,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class DocumentSerializer(object):
+    """
+    Converts the elements of documents to and from bytes.
+
+    The bytes start with :attr:`MAGIC`, a version number and flags, followed by a JSON array with an entry for each
+    element, compressed with zlib. Each entry is a list holding the type of the element, its id, its references, and
+    the fields needed to create it again: the text of text elements, the start and end of sentences, the caption and
+    label of figures and tables, the links of figures, the table data and TableDataExtractor options of tables, and the
+    data of metadata. Elements within the TableDataExtractor options, such as the cells given by some readers, are
+    kept as well.
+
+    Only the content of the elements is kept. Elements are created again with the default tokenizers and taggers of
+    their class, and ids, references, links, table data and metadata must be strings or other JSON values.
+    """
+
+    MAGIC = b"CDEELS"
+    VERSION = 1
+    #: Flag set when the JSON is compressed.
+    COMPRESSED = 1
+
+    TEXT_TYPES = {
+        cls.__name__: cls
+        for cls in (Text, Title, Heading, Paragraph, Footnote, Citation, Caption)
+    }
+    SENTENCE_TYPES = {cls.__name__: cls for cls in (Sentence, Cell)}
+    #: The key marking elements within other values.
+    ELEMENT_KEY = "__element__"
+
+    def __init__(self, compression_level=6):
+        """
+        :param int compression_level: (Optional) The zlib compression level, from 0 to 9. With 0, the JSON is not
+            compressed. Default 6.
+        """
+        self.compression_level = compression_level
+
+    def dumps(self, document):
+        """
+        Convert the elements of a document to bytes.
+
+        :param Document document: The document.
+        :rtype: bytes
+        """
+        payload = json.dumps(
+            [self._encode(element) for element in document.elements],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        flags = 0
+        if self.compression_level:
+            payload = zlib.compress(payload, self.compression_level)
+            flags |= self.COMPRESSED
+        return self.MAGIC + struct.pack("<HB", self.VERSION, flags) + payload
+
+    def loads(self, data, document_class=None, **kwargs):
+        """
+        Create a document from bytes written by :meth:`dumps`.
+
+        :param bytes data: The bytes.
+        :param type document_class: (Optional) The class of the document. Default
+            :class:`~chemdataextractor.doc.document.Document`.
+        :param kwargs: Any other keyword arguments are passed on to the document.
+        :rtype: Document
+        """
+        if document_class is None:
+            from .document import Document as document_class
+
+        data = bytes(data)
+        if not data.startswith(self.MAGIC):
+            raise ReaderError("Data is not a serialized document")
+        prefix_length = len(self.MAGIC) + struct.calcsize("<HB")
+        version, flags = struct.unpack_from("<HB", data, len(self.MAGIC))
+        if version != self.VERSION:
+            raise ReaderError(
+                "Serialized document has version %s, expected %s"
+                % (version, self.VERSION)
+            )
+        payload = data[prefix_length:]
+        if flags & self.COMPRESSED:
+            payload = zlib.decompress(payload)
+        elements = [self._decode(entry) for entry in json.loads(payload)]
+        return document_class(*elements, **kwargs)
+
+    def _encode(self, element):
+        element_type = element.__class__.__name__
+        entry = [element_type, element.id, element.references]
+        if self.TEXT_TYPES.get(element_type) is element.__class__:
+            entry.append(element.text)
+        elif self.SENTENCE_TYPES.get(element_type) is element.__class__:
+            entry.extend([element.text, element.start, element.end])
+        elif element.__class__ is Figure:
+            entry.extend([self._encode(element.caption), element.label, element.links])
+        elif element.__class__ is Table:
+            entry.extend(
+                [
+                    self._encode(element.caption),
+                    element.label,
+                    element.table_data,
+                    self._encode_value(element._tde_kwargs),
+                ]
+            )
+        elif element.__class__ is MetaData:
+            entry.append(element._data)
+        else:
+            raise TypeError("Can't serialize elements of type %s" % element_type)
+        return entry
+
+    def _encode_value(self, value):
+        """Encode a JSON value that may contain elements, such as the cells some readers pass on to TableDataExtractor."""
+        if isinstance(value, BaseElement):
+            return {self.ELEMENT_KEY: self._encode(value)}
+        if isinstance(value, (list, tuple)):
+            return [self._encode_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self._encode_value(item) for key, item in value.items()}
+        return value
+
+    def _decode_value(self, value):
+        if isinstance(value, list):
+            return [self._decode_value(item) for item in value]
+        if isinstance(value, dict):
+            if self.ELEMENT_KEY in value:
+                return self._decode(value[self.ELEMENT_KEY])
+            return {key: self._decode_value(item) for key, item in value.items()}
+        return value
+
+    def _decode(self, entry):
+        element_type, id, references = entry[:3]
+        fields = entry[3:]
+        if element_type in self.TEXT_TYPES:
+            element = self.TEXT_TYPES[element_type](fields[0])
+        elif element_type in self.SENTENCE_TYPES:
+            text, start, end = fields
+            element = self.SENTENCE_TYPES[element_type](text, start=start, end=end)
+        elif element_type == "Figure":
+            caption, label, links = fields
+            element = Figure(self._decode(caption), label=label, links=links)
+        elif element_type == "Table":
+            caption, label, table_data, tde_kwargs = fields
+            element = Table(
+                self._decode(caption),
+                label=label,
+                table_data=table_data,
+                **self._decode_value(tde_kwargs),
+            )
+        elif element_type == "MetaData":
+            element = MetaData(fields[0])
+        else:
+            raise ReaderError("Unknown element type %s" % element_type)
+        element.id = id
+        element.references = references
+        return element
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental re-extraction of records when models are added or changed.
+
+The tokens and tags of a document do not depend on the models used to extract records from it, and neither do the
+records found for one model depend on the parsers of unrelated models. A :class:`Reextractor` keeps the records
+extracted from each document in a :class:`RecordCache`, together with a fingerprint of each model they were extracted
+with. When a document is extracted again, the records of unchanged models are reused, and only the new or changed
+models are run, on tokens and tags hydrated from a :class:`~chemdataextractor.doc.document_cacher.BinaryCacher`.
+
+Usage::
+
+    from chemdataextractor.doc import BinaryCacher, SqliteCacheStore
+    from chemdataextractor.doc.reextract import RecordCache, Reextractor
+    from chemdataextractor.parse.parse_cache import ParseCache
+
+    reextractor = Reextractor(
+        [MeltingPoint, GlassTransition],
+        RecordCache(SqliteCacheStore('cache/records.sqlite')),
+        document_cacher=BinaryCacher(store=SqliteCacheStore('cache/documents.sqlite')),
+        parse_cache=ParseCache('cache/parse_cache.sqlite'),
+    )
+    records, report = reextractor.reextract(doc, 'paper.html')
+
+The same workflow is available on the command line as ``cde reextract``.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import json
+import logging
+import operator
+
+from ..parse.parse_cache import fingerprint
+
+
+log = logging.getLogger(__name__)
+
+
+def model_fingerprint(model):
+    """
+    A fingerprint of a model that changes whenever the records extracted for it might change. This is made up of the
+    fields of the model and of each model it contains, and the
+    :attr:`~chemdataextractor.parse.base.BaseParser.cache_identity` of each of their parsers.
+
+    :param type(BaseModel) model: The model.
+    :returns: A hexadecimal digest.
+    :rtype: str
+    """
+    parts = []
+    for submodel in sorted(
+        model.flatten(include_inferred=False), key=operator.attrgetter("__name__")
+    ):
+        for parser in submodel.parsers:
+            parser.model = submodel
+        parts.append(
+            [submodel, [parser.cache_identity for parser in submodel.parsers]]
+        )
+    return fingerprint(parts)
+
+
+class RecordCache(object):
+    """
+    The records extracted from each document, kept as JSON in a
+    :class:`~chemdataextractor.doc.cache_store.BaseCacheStore` together with the fingerprint of each model they were
+    extracted with.
+    """
+
+    def __init__(self, store):
+        """
+        :param BaseCacheStore store: The store to keep the records in.
+        """
+        self.store = store
+
+    def __repr__(self):
+        return "<%s: %r>" % (self.__class__.__name__, self.store)
+
+    def get(self, document_id):
+        """
+        Get the records extracted from a document.
+
+        :param str document_id: The identifier of the document.
+        :returns: The fingerprint of each model, by model name, and the serialized records, or None if no records have
+            been stored for the document.
+        :rtype: (dict(str, str), list(dict)) or None
+        """
+        value = self.store.get(document_id)
+        if value is None:
+            return None
+        entry = json.loads(value.decode("utf-8"))
+        return entry["models"], entry["records"]
+
+    def set(self, document_id, model_fingerprints, records):
+        """
+        Store the records extracted from a document, replacing any records stored before.
+
+        :param str document_id: The identifier of the document.
+        :param dict(str, str) model_fingerprints: The fingerprint of each model the records were extracted with, by
+            model name.
+        :param list(dict) records: The records, serialized with ``primitive=True``.
+        """
+        value = json.dumps(
+            {"models": model_fingerprints, "records": records}, ensure_ascii=False
+        )
+        self.store.set(document_id, value.encode("utf-8"))
+
+    def close(self):
+        """Close the store."""
+        self.store.close()
+
+
+class Reextractor(object):
+    """
+    Extracts records from documents, only running the models that are new or have changed since the records of a
+    document were last stored.
+
+    Records are attributed to models by the model name they are serialized under. The records of a changed model are
+    found as if the document had been extracted with only the changed models, so they are not merged with the
+    records of unchanged models. Changes to document-level merging, or to the document itself, are not detected, so
+    the record cache should be cleared after such changes.
+    """
+
+    def __init__(
+        self,
+        models,
+        record_cache,
+        document_cacher=None,
+        tag_cache=None,
+        parse_cache=None,
+    ):
+        """
+        :param list(type(BaseModel)) models: The models to extract records for.
+        :param RecordCache record_cache: The cache of the records previously extracted from each document.
+        :param BinaryCacher document_cacher: (Optional) The cache of the tokens and tags of each document. Documents
+            that are not yet cached are added to it.
+        :param TagCache tag_cache: (Optional) Tag cache consulted when tagging documents that are not in the
+            document cache.
+        :param ParseCache parse_cache: (Optional) Parse cache consulted when parsing the sentences of documents.
+        """
+        self.models = list(models)
+        self.record_cache = record_cache
+        self.document_cacher = document_cacher
+        self.tag_cache = tag_cache
+        self.parse_cache = parse_cache
+        self._model_fingerprints = None
+
+    @property
+    def model_fingerprints(self):
+        """The fingerprint of each model, by model name, worked out once."""
+        if self._model_fingerprints is None:
+            self._model_fingerprints = {
+                model.__name__: model_fingerprint(model) for model in self.models
+            }
+        return self._model_fingerprints
+
+    def reextract(self, document, document_id):
+        """
+        Extract the records of a document, reusing the stored records of unchanged models.
+
+        The report has the following keys:
+
+        - ``document_cache``: ``"hit"`` if the tokens and tags were hydrated from the document cache, ``"miss"`` if the
+          document had to be tokenized and tagged, or None if no models needed to be run or there is no document cache.
+        - ``reused``: The names of the models whose stored records were reused.
+        - ``extracted``: The names of the models that were run.
+        - ``tag_cache`` and ``parse_cache``: The number of ``hits`` and ``misses`` in each cache for this document, or
+          None if there is no such cache.
+
+        :param document: The document, or a function returning the document, which is only called if any models
+            need to be run.
+        :type document: Document or callable
+        :param str document_id: The identifier of the document.
+        :returns: The records, serialized with ``primitive=True`` and ordered by model, and the report.
+        :rtype: (list(dict), dict)
+        """
+        model_fingerprints = self.model_fingerprints
+        entry = self.record_cache.get(document_id)
+        previous_fingerprints, previous_records = {}, []
+        if entry is not None:
+            previous_fingerprints, previous_records = entry
+        changed = [
+            model
+            for model in self.models
+            if previous_fingerprints.get(model.__name__)
+            != model_fingerprints[model.__name__]
+        ]
+        changed_names = set(model.__name__ for model in changed)
+        report = {
+            "document_cache": None,
+            "reused": [
+                model.__name__
+                for model in self.models
+                if model.__name__ not in changed_names
+            ],
+            "extracted": [model.__name__ for model in changed],
+            "tag_cache": None,
+            "parse_cache": None,
+        }
+
+        records_by_model = {}
+        for record in previous_records:
+            name = next(iter(record))
+            if name not in changed_names:
+                records_by_model.setdefault(name, []).append(record)
+        if changed:
+            if callable(document):
+                document = document()
+            extracted = self._extract(document, document_id, changed, report)
+            for name, record in extracted:
+                records_by_model.setdefault(name, []).append(record)
+
+        records = []
+        for model in self.models:
+            records.extend(records_by_model.get(model.__name__, []))
+        if changed or set(previous_fingerprints) != set(model_fingerprints):
+            self.record_cache.set(document_id, model_fingerprints, records)
+        log.debug(
+            "Re-extracted %s: reused %s, extracted %s"
+            % (document_id, report["reused"], report["extracted"])
+        )
+        return records, report
+
+    def _extract(self, document, document_id, models, report):
+        """Run the given models on a document, returning the model name and serialized form of each of its records."""
+        counters = {}
+        for name in ("tag_cache", "parse_cache"):
+            cache = getattr(self, name)
+            if cache is not None:
+                setattr(document, name, cache)
+                counters[name] = (cache, cache.hits, cache.misses)
+
+        # Models must be set before hydrating, since they are only passed on to sentences when these are created
+        names = set(model.__name__ for model in models)
+        document.models = models
+        cached = False
+        if self.document_cacher is not None:
+            try:
+                self.document_cacher.hydrate_document(document, document_id)
+                cached = True
+            except AttributeError as e:
+                log.debug("Tokenizing and tagging %s: %s" % (document_id, e))
+            report["document_cache"] = "hit" if cached else "miss"
+
+        records = [
+            (record.__class__.__name__, record.serialize(primitive=True))
+            for record in document.records
+            if record.__class__.__name__ in names
+        ]
+
+        if self.document_cacher is not None and not cached:
+            self.document_cacher.cache_document(
+                document, document_id, overwrite_cache=True
+            )
+        for name, (cache, hits, misses) in counters.items():
+            report[name] = {"hits": cache.hits - hits, "misses": cache.misses - misses}
+        return records
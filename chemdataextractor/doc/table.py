@@ -21,9 +21,10 @@ from .element import CaptionedElement
 from tabledataextractor import Table as TdeTable
 from tabledataextractor import TrivialTable as TrivialTdeTable
 from tabledataextractor.exceptions import TDEError
-from ..doc.text import Cell
+from ..doc.text import Cell, Sentence
 from ..model.model import Compound
-from ..model.base import ModelList, ModelType
+from ..model.base import ModelList, ModelType, StringType, FloatType
+from ..parse.auto import AutoTableParser
 from ..utils import memoized_property
 from pprint import pprint
 
@@ -64,9 +65,31 @@ class Table(CaptionedElement):
         super(Table, self).__init__(
             caption=caption, label=label, models=models, **kwargs
         )
+        self.table_data = table_data
+        self._tde_kwargs = kwargs
+        # The sentences for the text of each cell, keyed by text. These are shared between the check for
+        # whether the table could contain any records and the cells of the CDE tables.
+        self._cell_sentences = {}
+        self._may_contain_records_found = False
+        # Whether the last check found that none of the models could find a record in this table
+        self._skipped = False
+        # Set while the check is running, as tagging the sentences for the check can lead back to this table
+        self._checking_records = False
+
+    @memoized_property
+    def tde_table(self):
+        """
+        TableDataExtractor `Table` object, or `TrivialTable` if the table could not be analysed as a `Table`.
+        None if the table could not be interpreted at all.
+
+        The analysis is only run the first time this is accessed, which happens when the records of the table
+        are first requested.
+        """
+        table_data = self.table_data
+        kwargs = self._tde_kwargs
         try:
             #: TableDataExtractor `Table` object. Can pass any kwargs into TDE directly.
-            self.tde_table = TdeTable(table_data, **kwargs)
+            return TdeTable(table_data, **kwargs)
 
         except (TDEError, TypeError) as e:
             log.error("TableDataExtractor 'Table' error: {}".format(e))
@@ -74,14 +97,14 @@ class Table(CaptionedElement):
 
             try:
                 #: TableDataExtractor `TrivialTable` object. Can pass any kwargs into TDE directly.
-                self.tde_table = TrivialTdeTable(
+                return TrivialTdeTable(
                     table_data, standardize_empty_data=True, **kwargs
                 )
             except (TDEError, TypeError) as e:
                 log.error("TableDataExtractor 'TrivialTable' error: {}".format(e))
                 self.tde_subtables = []
-                self.tde_table = None
                 self.heading = None
+                return None
 
     @memoized_property
     def cde_tables(self):
@@ -98,28 +121,46 @@ class Table(CaptionedElement):
                 self.tde_table.title_row if self.tde_table.title_row is not None else []
             )
 
+            # The sentences for the text of each cell, shared so that each distinct header is only
+            # tokenized and tagged once, rather than once for every cell under it
+            cell_sentences = self._cell_sentences
             if self.tde_subtables:
                 for table in self.tde_subtables:
-                    cde_tables.append(self._create_cde_table(table))
+                    cde_tables.append(
+                        self._create_cde_table(table, cell_sentences=cell_sentences)
+                    )
 
             else:
-                cde_tables = [self._create_cde_table(self.tde_table)]
+                cde_tables = [
+                    self._create_cde_table(
+                        self.tde_table, cell_sentences=cell_sentences
+                    )
+                ]
         return cde_tables
 
-    def _create_cde_table(self, tde_table, assign_document=True):
+    def _create_cde_table(self, tde_table, assign_document=True, cell_sentences=None):
         """
         Creates a CDE Table from a TDE table. A CDE table is a list of cells, so this returns a list
         of list of Cell objects, which is then used for parsing.
+
+        :param dict cell_sentences: (Optional) The sentences for the text of each cell, keyed by text,
+            shared between the cells so that each distinct text is only tokenized and tagged once.
+            See :meth:`~chemdataextractor.doc.text.Cell.from_tdecell`.
         """
         cde_tables = []
         document = None
         if assign_document:
             document = self.document
+        if cell_sentences is None:
+            cell_sentences = {}
         for category_table in self._category_tables(tde_table):
             cde_table = []
             for cell in category_table:
                 cde_cell = Cell.from_tdecell(
-                    cell, models=self.models, document=document
+                    cell,
+                    models=self.models,
+                    document=document,
+                    cell_sentences=cell_sentences,
                 )
                 cde_table.append(cde_cell)
             cde_tables.append(cde_table)
@@ -141,30 +182,189 @@ class Table(CaptionedElement):
     def definitions(self):
         return self.caption.definitions
 
-    def _parse_table(self, parser, cde_table):
+    def _parse_cde_tables(self, parsers, cde_tables):
         """
-        Parses a table. The model and the category table have to be provided.
+        Parses the category tables with each of the parsers, one cell at a time.
+
+        The trigger phrase of each parser is only matched against each cell once, however many parsers share it,
+        and only parsers whose trigger phrase is found in a cell, or which have none, go on to parse the cell.
 
-        :param parser: parser to use for parsing of one row of the category table
-        :param cde_table: list of Cell objects
-        :return: Yields one result at a time
+        :param list parsers: parsers to use for parsing of one row of the category table
+        :param list cde_tables: list of category tables, each of which is a list of Cell objects
+        :return: The non-empty records found, in the order of the parsers, then of the cells
+        :rtype: list(BaseModel)
         """
-        if hasattr(parser, "parse_cell"):
+        parsers = [parser for parser in parsers if hasattr(parser, "parse_cell")]
+        records_for_parser = [[] for _ in parsers]
+        for cde_table in cde_tables:
             for cde_cell in cde_table:
-                # print(cde_cell.tagged_tokens)
-                log.debug(parser)
-                results = parser.parse_cell(cde_cell)
-                for result in results:
-                    if result.serialize() != {}:
-                        # yield {parser.model.__name__: result.serialize()}
-                        # adding of the row/column header categories to the record for potential merging later
-                        result.table_row_categories = " ".join(cde_cell.row_categories)
-                        result.table_col_categories = " ".join(cde_cell.col_categories)
-                        yield result
+                # Whether each trigger phrase is found in this cell, keyed by the id of the trigger phrase
+                trigger_phrase_found = {}
+                for parser, parser_records in zip(parsers, records_for_parser):
+                    trigger_phrase = parser.trigger_phrase
+                    if trigger_phrase is not None:
+                        if id(trigger_phrase) not in trigger_phrase_found:
+                            found = (
+                                next(
+                                    trigger_phrase.scan(cde_cell.tokens, max_matches=1),
+                                    None,
+                                )
+                                is not None
+                            )
+                            trigger_phrase_found[id(trigger_phrase)] = (
+                                trigger_phrase,
+                                found,
+                            )
+                        if not trigger_phrase_found[id(trigger_phrase)][1]:
+                            continue
+                    log.debug(parser)
+                    for result in parser.parse_cell(cde_cell):
+                        if not result.is_empty:
+                            # adding of the row/column header categories to the record for potential merging later
+                            result.table_row_categories = " ".join(
+                                cde_cell.row_categories
+                            )
+                            result.table_col_categories = " ".join(
+                                cde_cell.col_categories
+                            )
+                            parser_records.append(result)
+        return [
+            record for parser_records in records_for_parser for record in parser_records
+        ]
+
+    def _may_contain_records(self):
+        """
+        Whether any of the models of this table could find a record in it. This is a cheap check that is made
+        on the raw text of the cells, before the table is analysed by TableDataExtractor.
+
+        A parser can only find a record in a cell if its trigger phrase is found there. An :class:`AutoTableParser`
+        only finds records where all the required, non-contextual fields of its model are found, so the parse expression
+        of any of those fields is used in the same way. If every parser of the models has such a phrase, and none of
+        these are found in the text of any cell or of the caption, the table is skipped. Models that are only
+        part of these models, such as :class:`~chemdataextractor.model.model.Compound`, do not keep the table
+        from being skipped unless they are one of the models themselves. A table with no table parsers is not
+        skipped, so its cells are still in :attr:`elements`.
+
+        :return: False if the table cannot contain any records, True otherwise.
+        :rtype: bool
+        """
+        if self._may_contain_records_found or self._checking_records:
+            return True
+        self._checking_records = True
+        try:
+            may_contain_records = self._find_required_phrases()
+        finally:
+            self._checking_records = False
+        self._may_contain_records_found = may_contain_records is True
+        self._skipped = may_contain_records is False
+        if self._skipped:
+            log.debug("Skipping table, as none of its models could find a record in it")
+        return bool(may_contain_records)
+
+    def _find_required_phrases(self):
+        """
+        Look for the required phrase of each table parser of the models in the text of the cells and the caption.
+
+        :return: True if a phrase is found or a parser has no required phrase, False if none of the phrases are
+            found, or None if none of the models have a table parser.
+        :rtype: bool or None
+        """
+        phrases = self._required_phrases()
+        if phrases is None:
+            return True
+        if not phrases:
+            return None
+        sentences = self._check_sentences() + self.caption.sentences
+        for phrase in phrases:
+            for sentence in sentences:
+                if next(phrase.scan(sentence.tokens, max_matches=1), None) is not None:
+                    return True
+        return False
+
+    def _required_phrases(self):
+        """
+        The required phrase of each table parser of the models.
+
+        :return: The phrases, which are empty if none of the models have a table parser, or None if the table can't
+            be skipped, as a parser has no required phrase or the text of the cells can only be read by TableDataExtractor.
+        :rtype: list(BaseParserElement) or None
+        """
+        phrases = []
+        for model in self.models:
+            for parser in model.parsers:
+                if not hasattr(parser, "parse_cell"):
+                    continue
+                parser.model = model
+                phrase = self._required_phrase(parser)
+                if phrase is None:
+                    return None
+                phrases.append(phrase)
+        if phrases and not isinstance(self.table_data, (list, tuple)):
+            # A path or URL, which is only read by TableDataExtractor
+            return None
+        return phrases
+
+    def _check_sentences(self):
+        """The sentences for the text of each cell, which the required phrases are looked for in."""
+        sentences = []
+        seen_texts = set()
+        for row in self.table_data:
+            for text in row:
+                text = str(text)
+                if not text.strip() or text in seen_texts:
+                    continue
+                seen_texts.add(text)
+                sentence = self._cell_sentences.get(text)
+                if sentence is None:
+                    sentence = Sentence(text, document=self.document, taggers=Cell.taggers)
+                    self._cell_sentences[text] = sentence
+                sentences.append(sentence)
+        return sentences
+
+    @property
+    def _elements_for_tagging(self):
+        """
+        The elements of this table that are tagged along with the rest of the document.
+
+        Until the check for whether any of the models could find a record in this table has been made, these are
+        the sentences for the check and the caption, so that the check doesn't lead to the table being analysed by
+        TableDataExtractor, and the text of the cells of every table is tagged in the same batch.
+        """
+        if (
+            not self._skipped
+            and not self._may_contain_records_found
+            and self._required_phrases()
+        ):
+            return self._check_sentences() + [self.caption]
+        return self.elements
+
+    @staticmethod
+    def _required_phrase(parser):
+        """
+        The phrase that has to be found in a cell for the parser to find a record in it, or None if there is none.
+
+        :param BaseTableParser parser: The parser
+        :rtype: BaseParserElement or None
+        """
+        if parser.trigger_phrase is not None:
+            return parser.trigger_phrase
+        if isinstance(parser, AutoTableParser):
+            for field_name, field in parser.model.fields.items():
+                if (
+                    field_name not in ["raw_value", "raw_units", "value", "units", "error"]
+                    and field.required
+                    and field.requiredness == 1.0
+                    and not field.contextual
+                    and field.parse_expression is not None
+                ):
+                    return field.parse_expression
+        return None
 
     @property
     def records(self):
         table_records = ModelList()
+        if not self._may_contain_records():
+            return table_records
         caption_records = self.caption.records
         for table in self.cde_tables:
             table_records.extend(self._records_for_cde_tables(table, caption_records))
@@ -192,13 +392,10 @@ class Table(CaptionedElement):
             caption_records = ModelList()
 
         # Step 1
-        table_records = ModelList()
-        for model in self._streamlined_models:
-            for parser in model.parsers:
-                for cde_table in cde_tables:
-                    for record in self._parse_table(parser, cde_table):
-                        if not record.is_empty:
-                            table_records.append(record)
+        parsers = [
+            parser for model in self._streamlined_models for parser in model.parsers
+        ]
+        table_records = ModelList(*self._parse_cde_tables(parsers, cde_tables))
 
         # Step 2
         self._consolidate_by_row_col(table_records)
@@ -300,7 +497,6 @@ class Table(CaptionedElement):
                     segmented_records[root_model][1].append(record)
 
         # Do all the actual merging
-        record_set = set()
         for model_type, segment in segmented_records.items():
             # Merge all records of the parent type with all records of the child type
             for record_of_type in segment[0]:
@@ -310,20 +506,102 @@ class Table(CaptionedElement):
                             record_of_subtype._merged_in.append(model_type)
 
             # Merge all records of the parent type with other records of the parent type
-            i = 0
             records_of_type = segment[0]
-            while i < len(records_of_type):
-                j = 0
-                while j < len(records_of_type):
-                    if i != j and not records_of_type[i].is_subset(records_of_type[j]):
-                        getattr(records_of_type[i], function_name)(records_of_type[j])
-                    j += 1
-                i += 1
-            record_set.update(records_of_type)
-
-        final_records = ModelList(*list(record_set))
-        final_records.remove_subsets()
-        return final_records
+            if contextual:
+                candidates = None
+            else:
+                candidates = self._merge_candidates(records_of_type)
+            for i, record in enumerate(records_of_type):
+                if candidates is None or candidates[i] is None:
+                    for j, other in enumerate(records_of_type):
+                        if i != j and not record.is_subset(other):
+                            getattr(record, function_name)(other)
+                    continue
+                # Any record skipped between two candidates conflicts with this one, so
+                # merging it in would only have consolidated the binding properties.
+                previous = -1
+                consolidated = False
+                for j in candidates[i] + [len(records_of_type)]:
+                    skipped = j - previous - 1 - (previous < i < j)
+                    if skipped and not consolidated:
+                        record._consolidate_binding()
+                        consolidated = True
+                    if j == len(records_of_type):
+                        break
+                    other = records_of_type[j]
+                    if not record.is_subset(other):
+                        record.merge_all(other)
+                        consolidated = (
+                            type(other) == type(record)
+                            or type(other) in type(record).flatten()
+                            or not record._binding_compatible(other)
+                        )
+                    previous = j
+
+    def _merge_candidates(self, records):
+        """
+        Index records of the parent type so that each is only merged with records it could be compatible with.
+
+        Records of the same type are bucketed by the value of a scalar field that is not binding and not
+        ignored when merging. Two records with different, non-empty values for this field always conflict,
+        so a record is only compared against records in its own bucket, records with no value for the field,
+        and records of other types.
+
+        :param ModelList(BaseModel) records: The records of the parent type
+        :return: For each record, the sorted indices of the records it could merge with, or None if it has
+            to be compared against every record.
+        :rtype: list(list(int) or None)
+        """
+        records_by_type = {}
+        for index, record in enumerate(records):
+            records_by_type.setdefault(type(record), []).append(index)
+
+        keys = [None] * len(records)
+        for model_type, indices in records_by_type.items():
+            best_field, best_values = None, {}
+            for field_name, field in model_type.fields.items():
+                if (
+                    not isinstance(field, (StringType, FloatType))
+                    or field.binding
+                    or field.ignore_when_merging
+                ):
+                    continue
+                values = {}
+                for index in indices:
+                    value = records[index][field_name]
+                    if value and isinstance(value, (str, float)):
+                        values.setdefault(value, []).append(index)
+                if len(values) > len(best_values):
+                    best_field, best_values = field_name, values
+            for value, bucket in best_values.items():
+                for index in bucket:
+                    keys[index] = (model_type, value)
+
+        buckets = {}
+        unkeyed = []
+        for index, key in enumerate(keys):
+            if key is None:
+                unkeyed.append(index)
+            else:
+                buckets.setdefault(key, []).append(index)
+        if not buckets:
+            return None
+
+        candidates = []
+        for index, key in enumerate(keys):
+            if key is None:
+                candidates.append(None)
+                continue
+            other_types = [
+                other_index
+                for other_type, indices in records_by_type.items()
+                if other_type is not key[0]
+                for other_index in indices
+            ]
+            others = set(unkeyed + other_types + buckets[key])
+            others.discard(index)
+            candidates.append(sorted(others))
+        return candidates
 
     def _merge(self, records_1, records_2):
         """
@@ -360,6 +638,13 @@ class Table(CaptionedElement):
 
     @property
     def elements(self):
+        if self._checking_records:
+            # The sentences made for the check, so that they are tagged along with the rest of the document
+            return list(self._cell_sentences.values()) + [self.caption]
+        # Don't analyse the table if none of the models could find a record in it
+        self._may_contain_records()
+        if self._skipped:
+            return [self.caption]
         elements = []
         for table in self.cde_tables:
             for subtable in table:
@@ -39,6 +39,7 @@ from ..nlp.tokenize import (
     ChemSentenceTokenizer,
     regex_span_tokenize,
     SentenceTokenizer,
+    TokenizationCache,
     WordTokenizer,
 )
 from ..nlp.subsentence import SubsentenceExtractor, NoneSubsentenceExtractor
@@ -519,20 +520,36 @@ class Text(collections.abc.Sequence, BaseText):
 
     def __add__(self, other):
         if type(self) == type(other):
-            merged = self.__class__(
-                text=self.text + other.text,
-                id=self.id or other.id,
-                references=self.references + other.references,
-                sentence_tokenizer=self.sentence_tokenizer,
-                word_tokenizer=self.word_tokenizer,
-                lexicon=self.lexicon,
-                abbreviation_detector=self.abbreviation_detector,
-                pos_tagger=self.pos_tagger,
-                ner_tagger=self.ner_tagger,
-            )
-            return merged
+            return self._extended([(other.text, other.id, other.references)])
         return NotImplemented
 
+    def _extended(self, fragments):
+        """Return a new element with the given fragments appended, as adding an element per fragment would.
+
+        Creating a single element keeps joining many inline fragments linear in their number.
+
+        :param fragments: The ``(text, id, references)`` of each fragment to append.
+        :type fragments: list[(str, Any, list)]
+        """
+        texts = [self.text]
+        id = self.id
+        references = list(self.references)
+        for fragment_text, fragment_id, fragment_references in fragments:
+            texts.append(fragment_text)
+            id = id or fragment_id
+            references.extend(fragment_references)
+        return self.__class__(
+            text="".join(texts),
+            id=id,
+            references=references,
+            sentence_tokenizer=self.sentence_tokenizer,
+            word_tokenizer=self.word_tokenizer,
+            lexicon=self.lexicon,
+            abbreviation_detector=self.abbreviation_detector,
+            pos_tagger=self.pos_tagger,
+            ner_tagger=self.ner_tagger,
+        )
+
 
 class Title(Text):
 
@@ -620,6 +637,27 @@ class Sentence(BaseText):
     subsentence_extractor = SubsentenceExtractor()
     taggers = [ChemCrfPosTagger(), cem_tagger, dep_tagger]
     specifier_definition = specifier_definition
+    tag_cache = None
+    """
+    (Optional) A :class:`~chemdataextractor.nlp.tag_cache.TagCache` that is consulted before tagging this sentence.
+    If None, the tag cache of the containing document, if any, is used.
+    """
+    parse_cache = None
+    """
+    (Optional) A :class:`~chemdataextractor.parse.parse_cache.ParseCache` that is consulted before parsing this
+    sentence. If None, the parse cache of the containing document, if any, is used.
+    """
+    tokenization_cache = TokenizationCache()
+    """
+    The :class:`~chemdataextractor.nlp.tokenize.TokenizationCache` shared by all sentences, used when the
+    word tokenizer is a :class:`~chemdataextractor.nlp.tokenize.WordTokenizer`. Set to None to disable.
+    """
+    _cache_entry = None
+    """
+    The ``(cache_file, index)`` of this sentence in a :class:`~chemdataextractor.doc.document_cacher.BinaryCacher`
+    cache file that the document was hydrated from. Its tokens, tags and subsentences are read from the file when
+    first needed.
+    """
 
     def __init__(
         self,
@@ -695,7 +733,15 @@ class Sentence(BaseText):
 
     @memoized_property
     def tokens(self):
-        tokens = self.word_tokenizer.get_word_tokens(self)
+        if self._cache_entry is not None:
+            cache_file, index = self._cache_entry
+            return cache_file.sentence_tokens(index, self)
+        if self.tokenization_cache is not None and isinstance(
+            self.word_tokenizer, WordTokenizer
+        ):
+            tokens = self.tokenization_cache.get_word_tokens(self.word_tokenizer, self)
+        else:
+            tokens = self.word_tokenizer.get_word_tokens(self)
         for token in tokens:
             token.text = "".join(
                 ch for ch in token.text if unicodedata.category(ch)[0] != "C"
@@ -1004,26 +1050,78 @@ class Sentence(BaseText):
                 ):
                     self.document._batch_assign_tags(tagger, tag_type)
                 elif hasattr(tagger, "tag_for_type"):
-                    tags = tagger.tag_for_type(self.tokens, tag_type)
+                    tags = self._tag_with_cache(
+                        tagger,
+                        tag_type,
+                        lambda: tagger.tag_for_type(self.tokens, tag_type),
+                    )
                 elif hasattr(tagger, "batch_tag") and self.document is not None:
                     self.document._batch_assign_tags(tagger, tag_type)
                 else:
                     if hasattr(tagger, "tag"):
-                        tags = tagger.tag(self.tokens)
+                        tags = self._tag_with_cache(
+                            tagger, tag_type, lambda: tagger.tag(self.tokens)
+                        )
                     else:
-                        tags = tagger.legacy_tag(self.raw_tokens)
+                        tags = self._tag_with_cache(
+                            tagger,
+                            tag_type,
+                            lambda: tagger.legacy_tag(self.raw_tokens),
+                        )
                 if tags is not None:
                     for index, tag in enumerate(tags):
                         self.tokens[index]._tags[tag_type] = tag[1]
                 break
 
+    def _tag_with_cache(self, tagger, tag_type, tag_function):
+        """
+        Get the (token, tag) pairs for this sentence from the active tag cache if possible, otherwise
+        call ``tag_function`` to tag the sentence and store the result in the cache.
+        """
+        tag_cache = self.tag_cache
+        if tag_cache is None and self.document is not None:
+            tag_cache = getattr(self.document, "tag_cache", None)
+        if tag_cache is None or not tag_cache.can_cache(tag_type):
+            return tag_function()
+        raw_tokens = self.raw_tokens
+        upstream = self._upstream_cache_identities(tagger)
+        cached_tags = tag_cache.get(tagger, tag_type, raw_tokens, upstream)
+        if cached_tags is not None:
+            return list(zip(self.tokens, cached_tags))
+        tags = list(tag_function())
+        tag_cache.set(
+            tagger, tag_type, raw_tokens, [tag[1] for tag in tags], upstream
+        )
+        return tags
+
+    def _upstream_cache_identities(self, tagger):
+        """
+        The :attr:`~chemdataextractor.nlp.tag.BaseTagger.cache_identity` of the taggers in this sentence that assign
+        each of the :attr:`~chemdataextractor.nlp.tag.BaseTagger.upstream_tag_types` of the given tagger, so that
+        cached tags aren't used once those taggers change.
+        """
+        identities = []
+        for upstream_tag_type in getattr(tagger, "upstream_tag_types", ()):
+            identity = None
+            for upstream_tagger in reversed(self.taggers):
+                if upstream_tagger.can_tag(upstream_tag_type):
+                    identity = getattr(upstream_tagger, "cache_identity", None)
+                    break
+            identities.append(identity)
+        return identities
+
     @property
     def quantity_re(self):
         return construct_quantity_re(*self._streamlined_models)
 
     @memoized_property
     def subsentences(self):
-        subsentence_tokens_list = self.subsentence_extractor.subsentences(self)
+        subsentence_tokens_list = None
+        if self._cache_entry is not None:
+            cache_file, index = self._cache_entry
+            subsentence_tokens_list = cache_file.sentence_subsentences(index, self)
+        if subsentence_tokens_list is None:
+            subsentence_tokens_list = self.subsentence_extractor.subsentences(self)
         subsentences = []
         for subsentence_tokens in subsentence_tokens_list:
             subsentence = Subsentence(self, subsentence_tokens)
@@ -1083,21 +1181,35 @@ class Sentence(BaseText):
 
     def __add__(self, other):
         if type(self) == type(other):
-            merged = self.__class__(
-                text=self.text + other.text,
-                start=self.start,
-                end=None,
-                id=self.id or other.id,
-                references=self.references + other.references,
-                word_tokenizer=self.word_tokenizer,
-                lexicon=self.lexicon,
-                abbreviation_detector=self.abbreviation_detector,
-                pos_tagger=self.pos_tagger,
-                ner_tagger=self.ner_tagger,
-            )
-            return merged
+            return self._extended([(other.text, other.id, other.references)])
         return NotImplemented
 
+    def _extended(self, fragments):
+        """Return a new sentence with the given fragments appended, as adding a sentence per fragment would.
+
+        :param fragments: The ``(text, id, references)`` of each fragment to append.
+        :type fragments: list[(str, Any, list)]
+        """
+        texts = [self.text]
+        id = self.id
+        references = list(self.references)
+        for fragment_text, fragment_id, fragment_references in fragments:
+            texts.append(fragment_text)
+            id = id or fragment_id
+            references.extend(fragment_references)
+        return self.__class__(
+            text="".join(texts),
+            start=self.start,
+            end=None,
+            id=id,
+            references=references,
+            word_tokenizer=self.word_tokenizer,
+            lexicon=self.lexicon,
+            abbreviation_detector=self.abbreviation_detector,
+            pos_tagger=self.pos_tagger,
+            ner_tagger=self.ner_tagger,
+        )
+
 
 class Subsentence(Sentence):
     """
@@ -1149,7 +1261,7 @@ class Subsentence(Sentence):
                         parser_records.extend(
                             parser._batch_parsed_records_dict[id(self.parent_sentence)]
                         )
-                    parser_records.extend(parser.parse_sentence(self))
+                    parser_records.extend(self._parse_with_cache(parser))
                     for record in parser_records:
                         p = record.serialize()
                         if record.is_empty:  # TODO: Potential performance issues?
@@ -1208,6 +1320,17 @@ class Subsentence(Sentence):
             i += 1
         return records
 
+    def _parse_with_cache(self, parser):
+        """
+        The records found by the parser in this subsentence, from the active parse cache if possible.
+        """
+        parse_cache = self.parent_sentence.parse_cache
+        if parse_cache is None and self.document is not None:
+            parse_cache = getattr(self.document, "parse_cache", None)
+        if parse_cache is None or not parse_cache.can_cache(parser):
+            return parser.parse_sentence(self)
+        return parse_cache.parse_sentence(parser, self)
+
 
 class Cell(Sentence):
     """Data cell for tables. One row of the category table"""
@@ -1230,12 +1353,28 @@ class Cell(Sentence):
         self.col_categories_sents = None
 
     @classmethod
-    def from_tdecell(cls, tde_cell, document=None, **kwargs):
+    def from_tdecell(cls, tde_cell, document=None, cell_sentences=None, **kwargs):
+        """
+        Create a Cell from one row of a TableDataExtractor category table.
+
+        The cell is made up of the text of the data cell and the text of each of its row and column headers.
+        Each of these texts is tokenized and tagged as a :class:`Sentence` of its own, and the cell's tokens are
+        copies of their tokens that share their tags. Passing the same ``cell_sentences`` dictionary for every cell
+        in a table means that each distinct text, which is usually a header, is only tokenized and tagged once
+        per table rather than once per cell.
+
+        :param tuple tde_cell: The data cell, row categories and column categories of a row of the category table.
+        :param Document document: (Optional) The document containing the table.
+        :param dict cell_sentences: (Optional) A dictionary of :class:`Sentence` objects for the texts of the cells
+            in the same table, keyed by text, which is added to by this method.
+        """
         # Have the spacing between the cells contain characters that will never be found
         # so that the system doesn't become confused because it found some number in the heading
         # that it confuses as a power for a unit.
         separator = "🙃🙃🙃🙃"
         cell_separator = ";"
+        if cell_sentences is None:
+            cell_sentences = {}
         text = " ".join(
             [
                 tde_cell[0],
@@ -1249,72 +1388,92 @@ class Cell(Sentence):
         cell.data = tde_cell[0]
         cell.row_categories = tde_cell[1]
         cell.col_categories = tde_cell[2]
-        cell.data_sent = Sentence(cell.data)
+        cell.data_sent = cls._cell_sentence(cell.data, cell_sentences, cell)
         cell.row_categories_sents = [
-            Sentence(cell_text) for cell_text in cell.row_categories
+            cls._cell_sentence(cell_text, cell_sentences, cell)
+            for cell_text in cell.row_categories
         ]
         cell.col_categories_sents = [
-            Sentence(cell_text) for cell_text in cell.col_categories
+            cls._cell_sentence(cell_text, cell_sentences, cell)
+            for cell_text in cell.col_categories
         ]
+        separator_sent = cell_sentences.get(separator)
+        if separator_sent is None:
+            separator_sent = Sentence(
+                separator, document=document, taggers=cell.taggers
+            )
+            separator_sent._tokens = [
+                RichToken(separator, 0, 4, cls.lexicon, separator_sent)
+            ]
+            cell_sentences[separator] = separator_sent
+        separator_token = separator_sent.tokens[0]
         cell.is_tde_cell = True
         cell.document = document
 
-        # Doing it this way means that a lot of RichTokens are shared between the sub-elements, resulting
-        # in tagging being only done once per RichToken, which is faster.
+        # The tokens of the cell are copies of the tokens of the sentences above that share their tags,
+        # so that tagging is only done once for each distinct text in the table.
 
-        tokens = cell.data_sent.tokens
+        tokens = [token._shifted(0, cell) for token in cell.data_sent.tokens]
         span_offset = (
             tokens[-1].end + 1
         )  # a cursor to help getting the span location correct when extending the token list
-        separator_token = RichToken(
-            separator, span_offset, span_offset + 4, cls.lexicon, cell
-        )
-        span_offset = separator_token.end + 1
-        tokens.append(separator_token)
+        tokens.append(separator_token._shifted(span_offset, cell))
+        span_offset = tokens[-1].end + 1
 
         for row_category_sent in cell.row_categories_sents:
             for token in row_category_sent.tokens:
-                token.start = token.start + span_offset
-                token.end = token.end + span_offset
-                tokens.append(token)
+                tokens.append(token._shifted(span_offset, cell))
             span_offset = tokens[-1].end + 1
-            cell_separator = RichToken(
-                separator, span_offset, span_offset + 4, cls.lexicon, cell
-            )
-            tokens.append(cell_separator)
+            tokens.append(separator_token._shifted(span_offset, cell))
 
         if cell.row_categories_sents:
             tokens = tokens[:-1]
             span_offset = tokens[-1].end + 1
 
-        separator_token = RichToken(
-            separator, span_offset, span_offset + 4, cls.lexicon, cell
-        )
-        span_offset = separator_token.end + 1
+        tokens.append(separator_token._shifted(span_offset, cell))
+        span_offset = tokens[-1].end + 1
 
-        tokens.append(separator_token)
         for col_category_sent in cell.col_categories_sents:
-
             for token in col_category_sent.tokens:
-                token.start = token.start + span_offset
-                token.end = token.end + span_offset
-                tokens.append(token)
+                tokens.append(token._shifted(span_offset, cell))
             span_offset = tokens[-1].end + 1
-            cell_separator = RichToken(
-                separator, span_offset, span_offset + 4, cls.lexicon, cell
-            )
-            tokens.append(cell_separator)
+            tokens.append(separator_token._shifted(span_offset, cell))
 
         if cell.col_categories_sents:
             tokens = tokens[:-1]
 
-        for token in tokens:
-            token.sentence = cell
-
         cell._tokens = tokens
+        cell._tagged_sentences = list(
+            {
+                id(sentence): sentence
+                for sentence in [cell.data_sent, separator_sent]
+                + cell.row_categories_sents
+                + cell.col_categories_sents
+            }.values()
+        )
 
         return cell
 
+    @staticmethod
+    def _cell_sentence(text, cell_sentences, cell):
+        """The :class:`Sentence` for the given text in ``cell`` from ``cell_sentences``, which is created if needed."""
+        sentence = cell_sentences.get(text)
+        if sentence is None:
+            sentence = Sentence(text, document=cell.document, taggers=cell.taggers)
+            cell_sentences[text] = sentence
+        return sentence
+
+    def _assign_tags(self, tag_type):
+        """
+        Assign tags for each token. The tokens of cells created with :meth:`from_tdecell` are tagged by tagging
+        each of the sentences that they were copied from.
+        """
+        if not self.is_tde_cell:
+            return super(Cell, self)._assign_tags(tag_type)
+        for sentence in self._tagged_sentences:
+            if len(sentence.tokens) and tag_type not in sentence.tokens[0]._tags:
+                sentence._assign_tags(tag_type)
+
     @memoized_property
     def abbreviation_definitions(self):
         """Empty list. Abbreviation detection is disabled within table cells."""
@@ -1445,6 +1604,21 @@ class RichToken(Token):
         )
         return rich_token
 
+    def _shifted(self, offset, sentence):
+        """
+        A copy of this token in the given sentence, with its offsets moved by ``offset``.
+        The copy shares its tags with this token, so that each is only tagged once.
+        """
+        rich_token = self.__class__(
+            text=self.text,
+            start=self.start + offset,
+            end=self.end + offset,
+            lexicon=self.lexicon,
+            sentence=sentence,
+        )
+        rich_token._tags = self._tags
+        return rich_token
+
     @property
     def legacy_pos_tag(self):
         pos_tag = self[POS_TAG_TYPE]
@@ -877,8 +877,9 @@ class BaseModel(metaclass=ModelMeta):
         """
         # TODO(ti250): Add behaviour to actually take the distance into account
 
-        log.debug(self.serialize())
-        log.debug(other.serialize())
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(self.serialize())
+            log.debug(other.serialize())
         did_merge = False
         should_keep_both_records = self._should_keep_both_records(other)
         if self.contextual_fulfilled:
@@ -1001,8 +1002,9 @@ class BaseModel(metaclass=ModelMeta):
         :rtype: BaseModel
         """
 
-        log.debug(self.serialize())
-        log.debug(other.serialize())
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(self.serialize())
+            log.debug(other.serialize())
         did_merge = False
         should_keep_both_records = self._should_keep_both_records(other)
         if self._binding_compatible(other):
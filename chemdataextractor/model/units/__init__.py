@@ -13,6 +13,7 @@ from __future__ import unicode_literals
 
 from .angle import *
 from .charge import *
+from .conversion import *
 from .current import *
 from .dimension import *
 from .electric_potential import *
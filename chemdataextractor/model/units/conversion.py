@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+Bulk conversion of quantities between units.
+
+Converting records one at a time through :meth:`QuantityModel.convert_to` repeats the same
+Python-level unit arithmetic for every record. The functions here group the values by their
+units and convert each group with a single pass of NumPy operations, giving exactly the same
+results as converting each of the records individually::
+
+    from chemdataextractor.model.units import convert_models_to_standard
+
+    records = doc.records
+    convert_models_to_standard(r for r in records if isinstance(r, MeltingPoint))
+
+The conversion between each pair of units is found by running the units' own
+``convert_value_*`` and ``convert_error_*`` methods once on a placeholder that records each
+arithmetic operation. The recorded operations are then applied to arrays of values. Units whose
+conversions can't be recorded, or values for which the operations wouldn't give exactly
+the same results on arrays, are converted one at a time as before.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+
+import numpy as np
+
+from .quantity_model import QuantityModel
+from ...utils import LRUCache
+
+log = logging.getLogger(__name__)
+
+
+#: The compiled conversions between pairs of units, keyed by the structure of the units.
+conversion_cache = LRUCache(max_size=1024)
+
+
+def convert_values(values, from_units, to_units):
+    """
+    Convert an array of values between units.
+
+    :param values: The values to convert, with the values for each quantity along the first axis.
+        For example, an array of shape (n, 2) holds a range of values for each of n quantities.
+    :type values: array_like
+    :param from_units: The units of each of the quantities, or a single Unit if they all have the same units.
+    :type from_units: Unit or list(Unit)
+    :param to_units: The units to convert each of the quantities to, or a single Unit to convert them all to.
+    :type to_units: Unit or list(Unit)
+    :returns: The converted values, with the same shape as ``values``.
+    :rtype: numpy.ndarray
+    :raises ValueError: If any of the units to convert to do not have the same dimensions as the units converted from.
+    """
+    return _convert_array(values, from_units, to_units, errors=False)
+
+
+def convert_errors(errors, from_units, to_units):
+    """
+    Convert an array of errors between units.
+
+    :param errors: The errors to convert, with the errors for each quantity along the first axis.
+    :type errors: array_like
+    :param from_units: The units of each of the quantities, or a single Unit if they all have the same units.
+    :type from_units: Unit or list(Unit)
+    :param to_units: The units to convert each of the quantities to, or a single Unit to convert them all to.
+    :type to_units: Unit or list(Unit)
+    :returns: The converted errors, with the same shape as ``errors``.
+    :rtype: numpy.ndarray
+    :raises ValueError: If any of the units to convert to do not have the same dimensions as the units converted from.
+    """
+    return _convert_array(errors, from_units, to_units, errors=True)
+
+
+def convert_models(models, unit):
+    """
+    Convert each of the given quantities to the given units.
+
+    This has the same effect as calling :meth:`~QuantityModel.convert_to` on each model in turn,
+    including the errors raised, but converts the values of models with the same units together.
+    Any models that are not instances of :class:`QuantityModel` are left unchanged.
+
+    .. note::
+
+        This method both modifies the models and returns them.
+
+    :param models: The models to convert, e.g. a :class:`~chemdataextractor.model.base.ModelList`.
+    :type models: iterable(BaseModel)
+    :param Unit unit: The Unit to convert to.
+    :returns: The models.
+    :rtype: list(BaseModel)
+    """
+    models = list(models)
+    _convert_models(models, [unit] * len(models), standard=False)
+    return models
+
+
+def convert_models_to_standard(models):
+    """
+    Convert each of the given quantities to the standard units for their dimensions.
+
+    This has the same effect as calling :meth:`~QuantityModel.convert_to_standard` on each model in turn,
+    including the errors raised, but converts the values of models with the same units together.
+    Any models that are not instances of :class:`QuantityModel` are left unchanged.
+
+    .. note::
+
+        This method both modifies the models and returns them.
+
+    :param models: The models to convert, e.g. a :class:`~chemdataextractor.model.base.ModelList`.
+    :type models: iterable(BaseModel)
+    :returns: The models.
+    :rtype: list(BaseModel)
+    """
+    models = list(models)
+    units = []
+    for model in models:
+        dimensions = getattr(model, "dimensions", None)
+        units.append(dimensions.standard_units if dimensions is not None else None)
+    _convert_models(models, units, standard=True)
+    return models
+
+
+def _convert_models(models, to_units, standard):
+    # Gather the values and errors of every model that can be converted in bulk, grouped by units
+    groups = {}
+    seen = set()
+    to_unit_keys = {}
+    for index, (model, to_unit) in enumerate(zip(models, to_units)):
+        # Models that appear more than once are converted again from their new units when they recur
+        if not isinstance(model, QuantityModel) or id(model) in seen:
+            continue
+        seen.add(id(model))
+        from_unit = model.units
+        if not from_unit or to_unit is None:
+            continue
+        values = model.value
+        if not values:
+            continue
+        values = values[:2] if len(values) == 2 else values[:1]
+        error = model.error
+        to_unit_key = to_unit_keys.get(id(to_unit))
+        if to_unit_key is None:
+            to_unit_key = to_unit_keys[id(to_unit)] = _unit_key(to_unit)
+        key = (_unit_key(from_unit), to_unit_key)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = (from_unit, to_unit, [], [], [])
+        group[2].append((index, len(values), bool(error)))
+        group[3].extend(values)
+        if error:
+            group[4].append(error)
+
+    converted = {}
+    for key, (from_unit, to_unit, members, values, errors) in groups.items():
+        if to_unit.dimensions != from_unit.dimensions:
+            # Left to the scalar conversion, which raises the appropriate error
+            continue
+        conversion = _get_conversion(key, from_unit, to_unit)
+        if conversion is None:
+            continue
+        new_values = conversion.convert(values, errors=False)
+        new_errors = conversion.convert(errors, errors=True) if errors else []
+        if new_values is None or new_errors is None:
+            continue
+        value_position = 0
+        error_position = 0
+        for index, num_values, has_error in members:
+            error = None
+            if has_error:
+                error = new_errors[error_position]
+                error_position += 1
+            converted[index] = (
+                new_values[value_position : value_position + num_values],
+                error,
+            )
+            value_position += num_values
+
+    # Assign the results in order, converting any models that couldn't be converted in bulk one at a time
+    for index, (model, to_unit) in enumerate(zip(models, to_units)):
+        if not isinstance(model, QuantityModel):
+            continue
+        if index in converted:
+            values, error = converted.pop(index)
+            if error is not None:
+                model.error = error
+            model.value = values
+            model.units = to_unit
+        elif standard:
+            model.convert_to_standard()
+        else:
+            model.convert_to(to_unit)
+
+
+def _convert_array(values, from_units, to_units, errors):
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 0:
+        raise ValueError("Values to convert must have at least one dimension")
+    count = values.shape[0]
+    from_units = _broadcast_units(from_units, count)
+    to_units = _broadcast_units(to_units, count)
+    groups = {}
+    for index, (from_unit, to_unit) in enumerate(zip(from_units, to_units)):
+        key = (_unit_key(from_unit), _unit_key(to_unit))
+        if key not in groups:
+            groups[key] = (from_unit, to_unit, [])
+        groups[key][2].append(index)
+
+    result = np.empty_like(values)
+    for key, (from_unit, to_unit, indices) in groups.items():
+        if to_unit.dimensions != from_unit.dimensions:
+            raise ValueError("Unit to convert to must have same dimensions as current unit")
+        conversion = _get_conversion(key, from_unit, to_unit)
+        group_values = values[indices]
+        converted = None
+        if conversion is not None:
+            converted = conversion.convert(group_values.ravel(), errors=errors)
+        if converted is None:
+            convert = _scalar_conversion(from_unit, to_unit, errors)
+            converted = [convert(value) for value in group_values.ravel().tolist()]
+        result[indices] = np.asarray(converted, dtype=np.float64).reshape(group_values.shape)
+    return result
+
+
+def _broadcast_units(units, count):
+    if units is None or hasattr(units, "dimensions"):
+        units = [units] * count
+    else:
+        units = list(units)
+        if len(units) != count:
+            raise ValueError("Expected %d units, got %d" % (count, len(units)))
+    for unit in units:
+        if not unit:
+            raise AttributeError("Current units not set")
+    return units
+
+
+def _unit_key(unit):
+    """
+    A key identifying the conversions to and from the given unit.
+
+    Unlike equality of units, this takes into account the order of the powers, which determines
+    the order of the floating point operations in the conversion.
+    """
+    if not unit.powers:
+        return (type(unit), float(unit.magnitude))
+    powers = tuple(
+        [(_unit_key(sub_unit), float(power)) for sub_unit, power in unit.powers.items()]
+    )
+    return (type(unit), float(unit.magnitude), powers)
+
+
+def _get_conversion(key, from_unit, to_unit):
+    """The compiled conversion between the given units, or None if they have to be converted one value at a time."""
+    conversion = conversion_cache.get(key)
+    if conversion is None:
+        conversion = _Conversion(from_unit, to_unit)
+        conversion_cache[key] = conversion
+    if not conversion.compiled:
+        return None
+    return conversion
+
+
+def _scalar_conversion(from_unit, to_unit, errors):
+    if errors:
+        return lambda error: to_unit.convert_error_from_standard(
+            from_unit.convert_error_to_standard(error)
+        )
+    return lambda value: to_unit.convert_value_from_standard(
+        from_unit.convert_value_to_standard(value)
+    )
+
+
+class _Conversion(object):
+    """
+    The arithmetic operations converting values and errors from one unit to another.
+    """
+
+    def __init__(self, from_unit, to_unit):
+        self.value_operations = _trace(_scalar_conversion(from_unit, to_unit, errors=False))
+        self.error_operations = _trace(_scalar_conversion(from_unit, to_unit, errors=True))
+        self.compiled = self.value_operations is not None and self.error_operations is not None
+
+    def convert(self, values, errors=False):
+        """
+        Apply the conversion to the given values.
+
+        :param values: The values to convert.
+        :type values: list(float) or numpy.ndarray
+        :param bool errors: Whether the values are errors rather than values.
+        :returns: The converted values, or None if they have to be converted one at a time
+            to get the same results as the scalar conversion.
+        :rtype: list(float) or None
+        """
+        operations = self.error_operations if errors else self.value_operations
+        array = np.asarray(values, dtype=np.float64)
+        try:
+            with np.errstate(all="raise"):
+                for operation, operand, reflected in operations:
+                    array = _apply(array, operation, operand, reflected)
+        except (ArithmeticError, TypeError, FloatingPointError):
+            return None
+        if array is None:
+            return None
+        return array.tolist()
+
+
+def _apply(array, operation, operand, reflected):
+    """Apply an operation to an array exactly as it would be applied to each float, or return None if not possible."""
+    if array is None:
+        return None
+    if operation == "neg":
+        return -array
+    if operation == "pos":
+        return array
+    if operation == "mul":
+        return array * operand
+    if operation == "add":
+        return array + operand
+    if operation == "sub":
+        return operand - array if reflected else array - operand
+    if operation == "truediv":
+        # Python raises ZeroDivisionError where NumPy would return inf or nan
+        if reflected:
+            if np.any(array == 0):
+                return None
+            return operand / array
+        if operand == 0:
+            return None
+        return array / operand
+    if operation == "pow":
+        if not reflected and operand == 1:
+            return array
+        # NumPy's power doesn't always round the same way as Python's, so apply it to each value
+        results = [
+            operand**value if reflected else value**operand for value in array.tolist()
+        ]
+        if not all(isinstance(result, float) for result in results):
+            # e.g. complex results from negative values raised to fractional powers
+            return None
+        return np.array(results, dtype=np.float64)
+    return None
+
+
+def _trace(conversion):
+    """Record the arithmetic operations applied by the given conversion, or None if they can't be recorded."""
+    tracer = _Tracer()
+    try:
+        result = conversion(tracer)
+    except Exception:
+        return None
+    if result is not tracer:
+        return None
+    return tracer.operations
+
+
+class _Tracer(object):
+    """Placeholder for a value that records the arithmetic operations applied to it."""
+
+    def __init__(self):
+        self.operations = []
+
+    def _record(self, operation, operand=None, reflected=False):
+        if operand is not None and (
+            isinstance(operand, bool) or not isinstance(operand, (int, float))
+        ):
+            return NotImplemented
+        if operand is not None:
+            operand = float(operand)
+        self.operations.append((operation, operand, reflected))
+        return self
+
+    def __bool__(self):
+        raise TypeError("Conversions that depend on the value can't be traced")
+
+    def __mul__(self, other):
+        return self._record("mul", other)
+
+    def __rmul__(self, other):
+        return self._record("mul", other, reflected=True)
+
+    def __add__(self, other):
+        return self._record("add", other)
+
+    def __radd__(self, other):
+        return self._record("add", other, reflected=True)
+
+    def __sub__(self, other):
+        return self._record("sub", other)
+
+    def __rsub__(self, other):
+        return self._record("sub", other, reflected=True)
+
+    def __truediv__(self, other):
+        return self._record("truediv", other)
+
+    def __rtruediv__(self, other):
+        return self._record("truediv", other, reflected=True)
+
+    def __pow__(self, other):
+        return self._record("pow", other)
+
+    def __rpow__(self, other):
+        return self._record("pow", other, reflected=True)
+
+    def __neg__(self):
+        return self._record("neg")
+
+    def __pos__(self):
+        return self._record("pos")
@@ -9,6 +9,42 @@ Base types for dimensions. Refer to the example on :ref:`creating new units and
 import copy
 from abc import abstractmethod, ABCMeta
 from ..base import BaseModel, BaseType, FloatType, StringType, ListType
+from ...utils import LRUCache
+
+
+#: The structural keys of the units and dimensions seen most recently. Equal keys are replaced by the same object, so
+#: that once the key for a unit or dimension has been found, comparing it with another is usually an identity check.
+#: Only a bounded number of keys is kept, so a key that has been evicted is compared by equality instead.
+_interned_keys = LRUCache(max_size=4096)
+
+#: The copies of dimensions without any state of their own used as keys in composite dimensions, by class.
+_normalised_dimensions = {}
+
+#: Attributes used only to cache information derived from a unit or dimension.
+_cache_attributes = frozenset(["_structure_cache", "_hash_cache", "_unit_matcher"])
+
+
+def _intern_key(key):
+    """
+    Get the canonical instance of the given key.
+
+    :param key: A hashable structural key.
+    :returns: An object equal to the key, which is the same object for equal keys while the key is kept.
+    """
+    interned = _interned_keys.get(key)
+    if interned is None:
+        _interned_keys[key] = interned = key
+    return interned
+
+
+def _same_key(key, other):
+    """Whether two structural keys are equal, which is an identity check if both have been interned."""
+    return key is other or key == other
+
+
+def _has_only_cached_state(obj):
+    """Whether the object has no instance attributes other than cached information."""
+    return _cache_attributes.issuperset(obj.__dict__)
 
 
 @property
@@ -157,7 +193,7 @@ class Dimension(metaclass=_DimensionMeta):
                     dimensions[dimension] = power * other
 
             else:
-                new_key = copy.deepcopy(self)
+                new_key = self._normalised()
                 dimensions[new_key] = other
 
             new_model._dimensions = dimensions
@@ -176,10 +212,11 @@ class Dimension(metaclass=_DimensionMeta):
         dimensions = {}
 
         if self._dimensions is not None:
-            dimensions = copy.deepcopy(self._dimensions)
+            # The keys are never modified, so they can be shared with the original
+            dimensions = dict(self._dimensions)
 
         else:
-            new_key = copy.deepcopy(self)
+            new_key = self._normalised()
             dimensions[new_key] = 1.0
 
         if other._dimensions is not None:
@@ -196,7 +233,7 @@ class Dimension(metaclass=_DimensionMeta):
                     dimensions[key] = value
 
         else:
-            new_key = copy.deepcopy(other)
+            new_key = other._normalised()
             if self._dimensions is not None:
                 if new_key in self._dimensions:
                     dimensions[new_key] += 1.0
@@ -261,24 +298,77 @@ class Dimension(metaclass=_DimensionMeta):
         return new_model
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Dimension):
             return False
 
         if self._dimensions is not None:
             if other._dimensions is not None:
-                if self._dimensions == other._dimensions:
-                    return True
+                return _same_key(self._structure, other._structure)
             else:
-                if (self**1.0)._dimensions == (other**1.0)._dimensions:
-                    return True
+                return _same_key(
+                    self._structure_to_power_one, other._structure_to_power_one
+                )
         elif other._dimensions is not None:
-            if other._dimensions == (self**1.0)._dimensions:
-                return True
-        else:
-            if type(self) == type(other):
-                return True
+            return _same_key(other._structure, self._structure_to_power_one)
+        return type(self) == type(other)
+
+    def __getstate__(self):
+        # The cached structures are interned, so only valid in this process
+        state = self.__dict__.copy()
+        state.pop("_structure_cache", None)
+        return state
+
+    @property
+    def _structure(self):
+        """
+        The interned structural key of the composite dimensions, equal for two dimensions exactly when their
+        ``_dimensions`` are equal, or None if this is not a composite dimension.
+        """
+        cache = self.__dict__.get("_structure_cache")
+        if cache is not None and cache[0] is self._dimensions:
+            return cache[1]
+        structure = None
+        if self._dimensions is not None:
+            structure = _intern_key(
+                frozenset(
+                    (dimension._key_structure, power)
+                    for dimension, power in self._dimensions.items()
+                )
+            )
+        self.__dict__["_structure_cache"] = (self._dimensions, structure)
+        return structure
+
+    @property
+    def _structure_to_power_one(self):
+        """The structural key of ``(self ** 1.0)._dimensions``."""
+        if isinstance(self, Dimensionless):
+            return None
+        if self._dimensions is not None:
+            return self._structure
+        return _intern_key(frozenset([(self._key_structure, 1.0)]))
 
-        return False
+    @property
+    def _key_structure(self):
+        """The structural key of this dimension when it is one of the keys in the ``_dimensions`` of another."""
+        if self._dimensions is not None:
+            return self._structure
+        return type(self)
+
+    def _normalised(self):
+        """
+        A copy of this dimension for use as a key in the ``_dimensions`` of a composite dimension.
+        Dimensions without any state of their own share the same copy.
+        """
+        if not _has_only_cached_state(self):
+            return copy.deepcopy(self)
+        normalised = _normalised_dimensions.get(type(self))
+        if normalised is None:
+            normalised = copy.deepcopy(self)
+            normalised.__dict__.clear()
+            _normalised_dimensions[type(self)] = normalised
+        return normalised
 
     def __hash__(self):
         string = str(self.__class__.__name__)
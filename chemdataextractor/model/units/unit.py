@@ -8,10 +8,17 @@ Base types for making units. Refer to the example on :ref:`creating new units an
 
 import copy
 from abc import abstractmethod
-from .dimension import Dimensionless
+from .dimension import Dimensionless, _intern_key, _same_key, _cache_attributes
 from ..base import BaseModel, BaseType, FloatType, StringType, ListType
 
 
+#: The copies of units without any state of their own used as keys in the powers of composite units.
+_normalised_units = {}
+
+#: The attributes a unit can have for the copy used as a key in composite units to be shared.
+_normalisable_attributes = _cache_attributes.union(["dimensions", "magnitude", "powers"])
+
+
 class UnitType(BaseType):
     """
     A field containing a :class:`Unit` of some type.
@@ -246,8 +253,7 @@ class Unit(object, metaclass=MetaUnit):
             for key, value in self.powers.items():
                 powers[key] = self.powers[key] * other
         else:
-            new_key = copy.deepcopy(self)
-            new_key.magnitude = 0.0
+            new_key = self._normalised()
             powers[new_key] = other
         return Unit(
             self.dimensions**other, powers=powers, magnitude=self.magnitude * other
@@ -266,21 +272,18 @@ class Unit(object, metaclass=MetaUnit):
         if self.powers:
             for key, value in self.powers.items():
                 powers[key] = self.powers[key]
-                normalised_key = copy.deepcopy(key)
-                normalised_key.magnitude = 0.0
+                normalised_key = key._normalised()
                 normalised_values[normalised_key] = key.magnitude
 
         else:
             if not isinstance(self, DimensionlessUnit):
-                new_key = copy.deepcopy(self)
-                new_key.magnitude = 0.0
+                new_key = self._normalised()
                 powers[new_key] = 1.0
                 normalised_values[new_key] = self.magnitude
 
         if other.powers:
             for key, value in other.powers.items():
-                normalised_key = copy.deepcopy(key)
-                normalised_key.magnitude = 0.0
+                normalised_key = key._normalised()
                 if normalised_key in normalised_values.keys():
                     powers[key] += value
                     if powers[key] == 0:
@@ -290,8 +293,7 @@ class Unit(object, metaclass=MetaUnit):
 
         else:
             if not isinstance(other, DimensionlessUnit):
-                normalised_other = copy.deepcopy(other)
-                normalised_other.magnitude = 0.0
+                normalised_other = other._normalised()
                 if normalised_other in normalised_values:
                     powers[normalised_other] += 1.0
                     if powers[normalised_other] == 0:
@@ -307,28 +309,34 @@ class Unit(object, metaclass=MetaUnit):
     # eq and hash implemented so Units can be used as keys in dictionaries
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Unit):
             return False
         if self.powers:
             if other.powers:
-                if self.powers == other.powers and self.magnitude == other.magnitude:
-                    return True
+                return (
+                    _same_key(self._structure, other._structure)
+                    and self.magnitude == other.magnitude
+                )
             else:
-                if self.powers == (other**1.0).powers:
-                    return True
+                return _same_key(self._structure, other._structure_to_power_one)
         elif other.powers:
-            if other.powers == (self**1.0).powers:
-                return True
-        else:
-            if (
-                type(self) == type(other)
-                and self.magnitude == other.magnitude
-                and self.dimensions == other.dimensions
-            ):
-                return True
-        return False
+            return _same_key(other._structure, self._structure_to_power_one)
+        return (
+            type(self) == type(other)
+            and self.magnitude == other.magnitude
+            and self.dimensions == other.dimensions
+        )
 
     def __hash__(self):
+        cache = self.__dict__.get("_hash_cache")
+        if (
+            cache is not None
+            and cache[0] is self.dimensions
+            and cache[1] == self.magnitude
+        ):
+            return cache[2]
         string = str(self.__class__.__name__)
         string += str(self.dimensions.__hash__())
         string += str(float(self.magnitude))
@@ -337,7 +345,81 @@ class Unit(object, metaclass=MetaUnit):
         # if self.powers is not None:
         #     for key in sorted(str(self.powers.items())):
         #         string += str(key)
-        return string.__hash__()
+        result = string.__hash__()
+        self.__dict__["_hash_cache"] = (self.dimensions, self.magnitude, result)
+        return result
+
+    def __getstate__(self):
+        # The cached structures are interned, so only valid in this process
+        state = self.__dict__.copy()
+        state.pop("_structure_cache", None)
+        state.pop("_hash_cache", None)
+        return state
+
+    @property
+    def _structure(self):
+        """
+        The interned structural key of the powers, equal for two units exactly when their powers are equal.
+
+        .. note::
+
+            The powers of a unit should not be modified in place once it has been compared with another.
+        """
+        cache = self.__dict__.get("_structure_cache")
+        if cache is not None and cache[0] is self.powers:
+            return cache[1]
+        structure = None
+        if self.powers:
+            structure = _intern_key(
+                frozenset(
+                    (unit._key_structure, power) for unit, power in self.powers.items()
+                )
+            )
+        self.__dict__["_structure_cache"] = (self.powers, structure)
+        return structure
+
+    @property
+    def _structure_to_power_one(self):
+        """The structural key of ``(self ** 1.0).powers``."""
+        if isinstance(self, DimensionlessUnit):
+            return None
+        if self.powers:
+            return self._structure
+        return _intern_key(frozenset([(self._simple_key_structure(0.0), 1.0)]))
+
+    @property
+    def _key_structure(self):
+        """The structural key of this unit when it is one of the keys in the powers of another."""
+        if self.powers:
+            return (type(self), self._structure, float(self.magnitude))
+        return self._simple_key_structure(self.magnitude)
+
+    def _simple_key_structure(self, magnitude):
+        return (
+            type(self),
+            float(magnitude),
+            type(self.dimensions),
+            self.dimensions._structure,
+        )
+
+    def _normalised(self):
+        """
+        A copy of this unit with a magnitude of zero, for use as a key in the powers of a composite unit.
+        Units without any state of their own apart from their dimensions and magnitude share the same copy.
+        """
+        if self.powers is not None or not _normalisable_attributes.issuperset(
+            self.__dict__
+        ):
+            normalised = copy.deepcopy(self)
+            normalised.magnitude = 0.0
+            return normalised
+        key = (type(self), type(self.dimensions), self.dimensions._structure)
+        normalised = _normalised_units.get(key)
+        if normalised is None:
+            normalised = copy.deepcopy(self)
+            normalised.magnitude = 0.0
+            _normalised_units[key] = normalised
+        return normalised
 
     def __str__(self):
         string = ""
@@ -17,10 +17,12 @@ from .tokenize import (
     ChemWordTokenizer,
     FineWordTokenizer,
     BertWordTokenizer,
+    TokenizationCache,
 )
 from .pos import ApPosTagger, ChemApPosTagger, CrfPosTagger, ChemCrfPosTagger
 from .cem import LegacyCemTagger, CiDictCemTagger, CsDictCemTagger, CrfCemTagger
 from .new_cem import CemTagger
 from .tag import NoneTagger, ApTagger, CrfTagger, DictionaryTagger, RegexTagger
+from .tag_cache import TagCache
 from .lexicon import Lexicon, ChemLexicon
 from .crf import ConditionalRandomField
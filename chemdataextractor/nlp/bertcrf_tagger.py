@@ -15,6 +15,7 @@ Usage:
 
 import copy
 import datetime
+import itertools
 import logging
 import math
 import re
@@ -34,6 +35,9 @@ from transformers import (
     PretrainedConfig,
     PreTrainedModel,
 )
+from tokenizers import Tokenizer
+from tokenizers.models import WordPiece
+from tokenizers.pre_tokenizers import WhitespaceSplit
 from yaspin import yaspin
 
 from ..data import find_data
@@ -129,6 +133,8 @@ class BertCrfTagger(BaseTagger):
         min_batch_size=None,
         max_batch_size=None,
         max_allowed_length=None,
+        max_batch_tokens=None,
+        wordpiece_cache_size=None,
     ):
         """
         :param indexers (dict(str, ~allennlp.data.token_indexers.TokenIndexer), optional): A dictionary of all the AllenNLP indexers to be used with the taggers.
@@ -142,11 +148,18 @@ class BertCrfTagger(BaseTagger):
             the class property ``model``, which will then search for the model inside of ChemDataExtractor's default model directory.
         :param tag_type (obj, optional): Override the class's tag type. Refer to the documentation for
             :class:`~chemdataextractor.nlp.tag.BaseTagger` for more information on how to use tag types.
-        :param min_batch_size (int, optional): The minimum batch size to use when predicting. Default 100.
-        :param max_batch_size (int, optional): The maximum batch size to use when predicting. Default 200.
+        :param min_batch_size (int, optional): The minimum batch size to use when predicting. Default 50.
+            Only used if ``max_batch_tokens`` is set to 0, in which case sentences are batched by count.
+        :param max_batch_size (int, optional): The maximum batch size to use when predicting. Default 100.
         :param max_allowed_length (int, optional): The maximum allowed length of a sentence when predicting.
             Default 220. Any sentences longer than this will be split into multiple smaller sentences via a sliding window approach and the
             results will be collected. Needs to be a multiple of 4 for correct predictions.
+        :param max_batch_tokens (int, optional): The maximum number of wordpieces in a batch, including padding
+            and the [CLS] and [SEP] tokens. Default 8192. Batches are filled with sentences of similar length until
+            this budget would be exceeded, which keeps the size of the tensors passed to BERT, and hence peak memory, bounded.
+            Set to 0 to batch sentences by count using ``min_batch_size`` and ``max_batch_size`` instead.
+        :param wordpiece_cache_size (int, optional): The maximum number of words for which the wordpiece ids are cached.
+            Default 100000.
         """
         if tag_type is not None:
             self.tag_type = tag_type
@@ -166,31 +179,28 @@ class BertCrfTagger(BaseTagger):
         if max_allowed_length is None:
             self.max_allowed_length = 220
 
+        self.max_batch_tokens = max_batch_tokens
+        if max_batch_tokens is None:
+            self.max_batch_tokens = 8192
+
+        self.wordpiece_cache_size = wordpiece_cache_size
+        if wordpiece_cache_size is None:
+            self.wordpiece_cache_size = 100000
+        self._wordpiece_cache = {}
+
         self.bert_tokenizer = BertTokenizer.from_pretrained(
             find_data(self.model), do_lower_case=False
         )
-
-    def collate_batch(self, instances):
-        """
-        Collate a batch of samples into a dictionary of tensors.
-        """
-        input_ids = [d["input_ids"] for d in instances]
-        offsets = [d["offsets"] for d in instances]
-        crf_mask = [d["crf_mask"] for d in instances]
-        batched_input_ids = nn.utils.rnn.pad_sequence(
-            input_ids, batch_first=True, padding_value=0
-        )
-        batched_offsets = nn.utils.rnn.pad_sequence(
-            offsets, batch_first=True, padding_value=0
-        )
-        batched_crf_mask = nn.utils.rnn.pad_sequence(
-            crf_mask, batch_first=True, padding_value=0
+        # The same wordpiece model as ``bert_tokenizer.wordpiece_tokenizer``, but backed by the Rust tokenizers library.
+        # There is no normalizer, so, as before, words are only split on whitespace and then into wordpieces.
+        self.fast_tokenizer = Tokenizer(
+            WordPiece(
+                vocab=self.bert_tokenizer.get_vocab(),
+                unk_token=self.bert_tokenizer.unk_token,
+                max_input_chars_per_word=100,
+            )
         )
-        return {
-            "input_ids": batched_input_ids,
-            "offsets": batched_offsets,
-            "crf_mask": batched_crf_mask,
-        }
+        self.fast_tokenizer.pre_tokenizer = WhitespaceSplit()
 
     def process(self, tag):
         return tag.replace("CEM", "CM")
@@ -199,42 +209,66 @@ class BertCrfTagger(BaseTagger):
         """
         Get the inputs for the predictor
         """
-        text = (token.text for token in tokens)
-        token_wordpiece_ids = [
-            [
-                self.bert_tokenizer.wordpiece_tokenizer.vocab[wordpiece]
-                for wordpiece in self.bert_tokenizer.wordpiece_tokenizer.tokenize(token)
-            ]
-            for token in text
-        ]
-
-        offsets = []
-        offset = 1
-        # Count amount of wordpieces accumulated
-        pieces_accumulated = 0
-        for token in token_wordpiece_ids:
+        instance = self._encode_batch(
+            [self._wordpiece_ids([token.text for token in tokens])]
+        )
+        return {key: value[0] for key, value in instance.items()}
 
-            # For initial offsets, the current value of ``offset`` is the start of
-            # the current wordpiece, so add it to ``offsets`` and then increment it.
-            offsets.append(offset)
-            offset += len(token)
+    def _wordpiece_ids(self, words):
+        """
+        Get the wordpiece ids for each of the given words.
 
-            pieces_accumulated += len(token)
+        The ids for each word are cached, and any words not yet in the cache are encoded
+        in a single call to the fast tokenizer.
+        """
+        cache = self._wordpiece_cache
+        missing = list({word for word in words if word not in cache})
+        if missing:
+            if len(cache) + len(missing) > self.wordpiece_cache_size:
+                cache.clear()
+            encodings = self.fast_tokenizer.encode_batch(
+                [[word] for word in missing],
+                is_pretokenized=True,
+                add_special_tokens=False,
+            )
+            for word, encoding in zip(missing, encodings):
+                cache[word] = encoding.ids
+        return [cache[word] for word in words]
 
-        flat_token_wordpiece_ids = [
-            wordpiece_id for token in token_wordpiece_ids for wordpiece_id in token
+    def _encode_batch(self, sents_wordpiece_ids):
+        """
+        Create the padded input tensors for a batch of sentences, where each sentence is
+        given as a list of the wordpiece ids for each of its tokens.
+        """
+        batch_size = len(sents_wordpiece_ids)
+        max_num_tokens = max(len(sent) for sent in sents_wordpiece_ids)
+        lengths = [
+            np.fromiter((len(token) for token in sent), dtype=np.int64, count=len(sent))
+            for sent in sents_wordpiece_ids
         ]
-        wordpiece_ids = (
-            [self.bert_tokenizer.cls_token_id]
-            + flat_token_wordpiece_ids
-            + [self.bert_tokenizer.sep_token_id]
-        )
-        mask = [1 for _ in offsets]
+        max_num_wordpieces = max(int(length.sum()) for length in lengths)
+
+        input_ids = np.zeros((batch_size, max_num_wordpieces + 2), dtype=np.int64)
+        offsets = np.zeros((batch_size, max_num_tokens), dtype=np.int64)
+        crf_mask = np.zeros((batch_size, max_num_tokens), dtype=np.int64)
+        for i, (sent, length) in enumerate(zip(sents_wordpiece_ids, lengths)):
+            num_tokens = len(sent)
+            num_wordpieces = int(length.sum())
+            input_ids[i, 0] = self.bert_tokenizer.cls_token_id
+            input_ids[i, 1 : num_wordpieces + 1] = np.fromiter(
+                itertools.chain.from_iterable(sent),
+                dtype=np.int64,
+                count=num_wordpieces,
+            )
+            input_ids[i, num_wordpieces + 1] = self.bert_tokenizer.sep_token_id
+            # The offset for each token is the index of its first wordpiece, allowing for the [CLS] token.
+            offsets[i, :num_tokens] = np.cumsum(length) - length + 1
+            crf_mask[i, :num_tokens] = 1
 
         return {
-            "input_ids": torch.LongTensor(wordpiece_ids),
-            "offsets": torch.LongTensor(offsets),
-            "crf_mask": torch.LongTensor(mask),
+            "input_ids": torch.from_numpy(input_ids),
+            "offsets": torch.from_numpy(offsets),
+            "crf_mask": torch.from_numpy(crf_mask),
         }
 
     @property
@@ -281,17 +315,35 @@ class BertCrfTagger(BaseTagger):
         all_bertcrftokens, sentence_subsentence_map = self._get_subsentences(
             sents)
 
-        # Create batches
-        all_bertcrftokens = sorted(all_bertcrftokens, key=len)
-        instances = self._create_batches(all_bertcrftokens)
-        
+        # Create batches, sorted by the number of wordpieces so that padding is minimised
+        all_wordpiece_ids = [
+            self._wordpiece_ids([token.text for token in bertcrftokens])
+            for bertcrftokens in all_bertcrftokens
+        ]
+        order = sorted(
+            range(len(all_bertcrftokens)),
+            key=lambda i: sum(len(token) for token in all_wordpiece_ids[i]),
+        )
+        all_bertcrftokens = [all_bertcrftokens[i] for i in order]
+        all_wordpiece_ids = [all_wordpiece_ids[i] for i in order]
+        instances = self._create_batches(all_bertcrftokens, all_wordpiece_ids)
+
         instance_time = datetime.datetime.now()
         log.debug("".join(["Created instances:", str(instance_time - start_time)]))
         log.debug("Num Batches: %d", len(instances))
         predictions = []
         for instance in instances:
             prediction_start_time = datetime.datetime.now()
-            log.debug("".join(["Batch size:", str(len(instance))]))
+            log.debug(
+                "".join(
+                    [
+                        "Batch size:",
+                        str(instance["input_ids"].size(0)),
+                        " Batch shape:",
+                        str(tuple(instance["input_ids"].size())),
+                    ]
+                )
+            )
             with torch.no_grad():
                 batch_predictions = self.predictor.forward_on_instances(instance)
             predictions.extend(batch_predictions)
@@ -351,41 +403,84 @@ class BertCrfTagger(BaseTagger):
 
         return all_bertcrftokens, sentence_subsentence_map
 
-    def _create_batches(self, all_bertcrftokens):
+    def _create_batches(self, all_bertcrftokens, all_wordpiece_ids=None):
         """
-        Create batches to feed into the predictor within the given batch size range.
-        To try to be more efficient, these batches are sorted by the length of the sentences.
+        Create batches to feed into the predictor. The sentences should already be sorted by length,
+        so that sentences of similar lengths are batched together.
+
+        By default, each batch is filled until the number of wordpieces in the padded batch would exceed
+        ``max_batch_tokens``. If ``max_batch_tokens`` is 0, the batches are instead created within the given batch size range.
+        """
+        if all_wordpiece_ids is None:
+            all_wordpiece_ids = [
+                self._wordpiece_ids([token.text for token in bertcrftokens])
+                for bertcrftokens in all_bertcrftokens
+            ]
+
+        if self.max_batch_tokens:
+            divisions = self._divide_by_num_wordpieces(all_wordpiece_ids)
+        else:
+            divisions = self._divide_by_num_sentences(all_bertcrftokens)
+
+        instances = []
+        for division in divisions:
+            instances.append(
+                self._encode_batch([all_wordpiece_ids[i] for i in division])
+            )
+        return instances
+
+    def _divide_by_num_wordpieces(self, all_wordpiece_ids):
+        """
+        Divide the sentences into batches such that the padded size of each batch, in wordpieces, does not exceed
+        ``max_batch_tokens``, and that no batch has more than ``max_batch_size`` sentences. A sentence that by itself
+        exceeds ``max_batch_tokens`` is placed in a batch of its own.
+        """
+        max_batch_tokens = self.max_batch_tokens
+        max_batch_size = self.max_batch_size
+        divisions = []
+        current_division = []
+        current_max_length = 0
+        for i, sent_wordpiece_ids in enumerate(all_wordpiece_ids):
+            # Allow for the [CLS] and [SEP] tokens
+            length = sum(len(token) for token in sent_wordpiece_ids) + 2
+            max_length = max(current_max_length, length)
+            if current_division and (
+                (len(current_division) + 1) * max_length > max_batch_tokens
+                or len(current_division) >= max_batch_size
+            ):
+                divisions.append(current_division)
+                current_division = []
+                max_length = length
+            current_division.append(i)
+            current_max_length = max_length
+        if current_division:
+            divisions.append(current_division)
+        return divisions
+
+    def _divide_by_num_sentences(self, all_bertcrftokens):
+        """
+        Divide the sentences into batches within the given batch size range.
         """
         min_batch_size = self.min_batch_size
         max_batch_size = self.max_batch_size
         new_list_sequence_delta = 5
-        instances = []
-
-        if len(all_bertcrftokens) > min_batch_size:
-            current_list_min_sequence_length = len(all_bertcrftokens[0])
-            divided_sents = []
-            sents_current = []
-            for sent in all_bertcrftokens:
-                if (len(sent) > current_list_min_sequence_length + new_list_sequence_delta and len(sents_current) > min_batch_size) or len(sents_current) > max_batch_size:
-                    divided_sents.append(sents_current)
-                    sents_current = [sent]
-                    current_list_min_sequence_length = len(sent)
-                else:
-                    sents_current.append(sent)
-            divided_sents.append(sents_current)
-
-            for div_sents in divided_sents:
-                division_instances = []
-                for sent in div_sents:
-                    division_instances.append(self.get_predictor_inputs(sent))
-                instances.append(self.collate_batch(division_instances))
 
-        else:
-            for bertcrftokens in all_bertcrftokens:
-                instances.append(self.get_predictor_inputs(bertcrftokens))
+        if len(all_bertcrftokens) <= min_batch_size:
             # just a single batch
-            instances = [self.collate_batch(instances)]
-        return instances
+            return [list(range(len(all_bertcrftokens)))]
+
+        current_list_min_sequence_length = len(all_bertcrftokens[0])
+        divisions = []
+        current_division = []
+        for i, sent in enumerate(all_bertcrftokens):
+            if (len(sent) > current_list_min_sequence_length + new_list_sequence_delta and len(current_division) > min_batch_size) or len(current_division) > max_batch_size:
+                divisions.append(current_division)
+                current_division = [i]
+                current_list_min_sequence_length = len(sent)
+            else:
+                current_division.append(i)
+        divisions.append(current_division)
+        return divisions
 
     def _assign_tags(self, sents, sentence_subsentence_map, id_predictions_map):
         """
@@ -2244,6 +2244,7 @@ class CrfCemTagger(CrfTagger):
     """"""
 
     tag_type = NER_TAG_TYPE
+    upstream_tag_types = (POS_TAG_TYPE,)
     model = "models/cem_crf_chemdner_cemp-1.0.pickle"
     lexicon = ChemLexicon()
     clusters = True
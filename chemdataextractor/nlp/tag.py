@@ -101,6 +101,35 @@ class BaseTagger(metaclass=ABCMeta):
     tagger will be called.
     """
 
+    version = "1"
+    """
+    The version of this tagger. This forms part of :attr:`cache_identity`, so it should be changed whenever
+    a change to the tagger would change its output without changing its class or model.
+    """
+
+    upstream_tag_types = ()
+    """
+    The tag types assigned by other taggers that this tagger uses, such as the PoS tags used as features by
+    :class:`~chemdataextractor.nlp.cem.CrfCemTagger`. The :attr:`cache_identity` of the taggers assigning these tag
+    types in a sentence also forms part of the key for tags stored in a :class:`~chemdataextractor.nlp.tag_cache.TagCache`,
+    so cached tags are not used after those taggers change.
+    """
+
+    @property
+    def cache_identity(self):
+        """
+        A string identifying this tagger, used as part of the key for tags stored in a
+        :class:`~chemdataextractor.nlp.tag_cache.TagCache`. By default this is made up of the
+        class of the tagger, its ``model`` if it has one, and its :attr:`version`.
+        """
+        cls = self.__class__
+        return "%s.%s:%s:%s" % (
+            cls.__module__,
+            cls.__qualname__,
+            getattr(self, "model", None),
+            self.version,
+        )
+
     @deprecated(
         deprecated_in="2.1",
         details="Deprecated in conjunction with the deprecation of the legacy_tag function. Please write equivalent functionality to use RichTokens.",
@@ -174,6 +203,18 @@ class EnsembleTagger(BaseTagger):
                 taggers_dict[tagger.tag_type] = tagger
         self.taggers_dict = taggers_dict
         self.taggers_dict[self.tag_type] = self
+        # The tag types used by the taggers within this one that are assigned by other taggers
+        self.upstream_tag_types = tuple(
+            sorted(
+                set(
+                    upstream_tag_type
+                    for tagger in self.taggers
+                    for upstream_tag_type in getattr(tagger, "upstream_tag_types", ())
+                    if upstream_tag_type not in taggers_dict
+                ),
+                key=str,
+            )
+        )
 
     def tag_for_type(self, tokens, tag_type):
         """
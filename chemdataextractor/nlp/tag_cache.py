@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent, content-addressed cache for the tags assigned by taggers.
+
+Tags for a sentence depend only on the text of its tokens and on the tagger, so the tags
+are stored under a hash of the raw tokens, the tag type, and the identity of the tagger
+(see :attr:`~chemdataextractor.nlp.tag.BaseTagger.cache_identity`). Repeated text, such as
+boilerplate or supplementary information duplicating the main text, is then only ever tagged once.
+
+Usage::
+
+    from chemdataextractor.nlp.tag_cache import TagCache
+
+    doc = Document.from_file(f)
+    doc.tag_cache = TagCache('path/to/tag_cache.sqlite')
+    doc.records
+    print(doc.tag_cache.stats())
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+import appdirs
+
+from .tag import POS_TAG_TYPE, NER_TAG_TYPE
+
+
+log = logging.getLogger(__name__)
+
+
+class TagCache(object):
+    """
+    A cache of the tags assigned by taggers, kept in a :class:`~chemdataextractor.doc.cache_store.SqliteCacheStore`.
+
+    When the total size of the stored tags exceeds ``max_size``, the least recently used entries
+    are evicted. The store can safely be shared by multiple processes.
+    """
+
+    def __init__(self, path=None, max_size=2**30, tag_types=None, store=None):
+        """
+        :param str path: (Optional) Path to the SQLite file for the cache. Defaults to ``tag_cache.sqlite``
+            in ChemDataExtractor's OS-dependent cache directory.
+        :param int max_size: (Optional) The maximum total size, in bytes, of the stored tags. Default 1 GiB.
+        :param list(str) tag_types: (Optional) The tag types to cache. Defaults to the PoS and NER tag types.
+            Only tag types whose tags depend solely on the text of the tokens should be cached.
+        :param BaseCacheStore store: (Optional) The store to keep the tags in, instead of a SQLite file.
+        """
+        if store is None:
+            from ..doc.cache_store import SqliteCacheStore
+
+            if path is None:
+                path = os.path.join(
+                    appdirs.user_cache_dir("ChemDataExtractor"), "tag_cache.sqlite"
+                )
+            store = SqliteCacheStore(path, max_size=max_size)
+        self.store = store
+        self.tag_types = (
+            set(tag_types) if tag_types is not None else {POS_TAG_TYPE, NER_TAG_TYPE}
+        )
+        #: The number of sentences for which tags were found in the cache.
+        self.hits = 0
+        #: The number of sentences for which tags were not found in the cache.
+        self.misses = 0
+
+    def __repr__(self):
+        return "<%s: %r>" % (self.__class__.__name__, self.store)
+
+    def can_cache(self, tag_type):
+        """
+        Whether tags of the given type are stored in this cache.
+
+        :param obj tag_type: The tag type.
+        :rtype: bool
+        """
+        return tag_type in self.tag_types
+
+    def key(self, tagger, tag_type, raw_tokens, upstream=None):
+        """
+        The key under which the tags for the given tokens are stored.
+
+        :param BaseTagger tagger: The tagger used to tag the tokens.
+        :param obj tag_type: The tag type.
+        :param list(str) raw_tokens: The text of each of the tokens.
+        :param list(str) upstream: (Optional) The :attr:`~chemdataextractor.nlp.tag.BaseTagger.cache_identity` of
+            the taggers for each of the :attr:`~chemdataextractor.nlp.tag.BaseTagger.upstream_tag_types` of the tagger.
+        :rtype: str
+        """
+        parts = [tagger.cache_identity, str(tag_type), list(raw_tokens)]
+        # Taggers that don't use the tags of other taggers keep the same keys
+        if upstream:
+            parts.append(list(upstream))
+        content = json.dumps(parts, ensure_ascii=False)
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, tagger, tag_type, raw_tokens, upstream=None):
+        """
+        Get the cached tags for the given tokens.
+
+        :param BaseTagger tagger: The tagger used to tag the tokens.
+        :param obj tag_type: The tag type.
+        :param list(str) raw_tokens: The text of each of the tokens.
+        :param list(str) upstream: (Optional) The identities of the upstream taggers, as for :meth:`key`.
+        :returns: The tags for each of the tokens, or None if they were not found in the cache.
+        :rtype: list(obj) or None
+        """
+        return self.get_many(tagger, tag_type, [raw_tokens], [upstream])[0]
+
+    def get_many(self, tagger, tag_type, raw_sents, all_upstream=None):
+        """
+        Get the cached tags for each of the given sentences.
+
+        :param BaseTagger tagger: The tagger used to tag the tokens.
+        :param obj tag_type: The tag type.
+        :param list(list(str)) raw_sents: The text of each of the tokens, for each sentence.
+        :param list(list(str)) all_upstream: (Optional) The identities of the upstream taggers, as for :meth:`key`,
+            for each sentence.
+        :returns: The tags for each of the sentences, with None for any sentence not found in the cache.
+        :rtype: list(list(obj) or None)
+        """
+        if all_upstream is None:
+            all_upstream = [None] * len(raw_sents)
+        keys = [
+            self.key(tagger, tag_type, raw_tokens, upstream)
+            for raw_tokens, upstream in zip(raw_sents, all_upstream)
+        ]
+        results = []
+        for value, raw_tokens in zip(self.store.get_many(keys), raw_sents):
+            tags = None
+            if value is not None:
+                tags = pickle.loads(value)
+                # Guard against hash collisions
+                if len(tags) != len(raw_tokens):
+                    tags = None
+            if tags is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            results.append(tags)
+        return results
+
+    def set(self, tagger, tag_type, raw_tokens, tags, upstream=None):
+        """
+        Store the tags for the given tokens.
+
+        :param BaseTagger tagger: The tagger used to tag the tokens.
+        :param obj tag_type: The tag type.
+        :param list(str) raw_tokens: The text of each of the tokens.
+        :param list(obj) tags: The tag for each of the tokens.
+        :param list(str) upstream: (Optional) The identities of the upstream taggers, as for :meth:`key`.
+        """
+        self.set_many(tagger, tag_type, [raw_tokens], [tags], [upstream])
+
+    def set_many(self, tagger, tag_type, raw_sents, all_tags, all_upstream=None):
+        """
+        Store the tags for each of the given sentences.
+
+        :param BaseTagger tagger: The tagger used to tag the tokens.
+        :param obj tag_type: The tag type.
+        :param list(list(str)) raw_sents: The text of each of the tokens, for each sentence.
+        :param list(list(obj)) all_tags: The tags for each of the sentences.
+        :param list(list(str)) all_upstream: (Optional) The identities of the upstream taggers, as for :meth:`key`,
+            for each sentence.
+        """
+        if all_upstream is None:
+            all_upstream = [None] * len(raw_sents)
+        items = []
+        for raw_tokens, tags, upstream in zip(raw_sents, all_tags, all_upstream):
+            value = pickle.dumps(list(tags), protocol=pickle.HIGHEST_PROTOCOL)
+            items.append((self.key(tagger, tag_type, raw_tokens, upstream), value))
+        if items:
+            self.store.set_many(items)
+
+    def clear(self):
+        """Remove all entries from the cache and reset the hit and miss counters."""
+        self.store.delete_many(self.store.keys())
+        self.store.compact()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Close the store."""
+        self.store.close()
+
+    def stats(self):
+        """
+        Statistics for this cache.
+
+        :returns: A dictionary containing the number of hits and misses in this process, the hit rate,
+            and the statistics of the store.
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+        }
+        stats.update(self.store.stats())
+        return stats
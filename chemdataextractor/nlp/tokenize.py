@@ -16,6 +16,7 @@ import re
 
 from ..text import bracket_level, GREEK
 from ..data import load_model, find_data
+from ..utils import LRUCache
 
 from lxml import etree
 
@@ -73,24 +74,63 @@ class SentenceTokenizer(BaseTokenizer):
     def __init__(self, model=None):
         self.model = model if model is not None else self.model
         self._tokenizer = None
+        self._sent_end_re = None
         log.debug("%s: Initializing with %s" % (self.__class__.__name__, self.model))
 
+    def _load(self):
+        self._tokenizer = load_model(self.model)
+        sent_end_chars = self._tokenizer._lang_vars.sent_end_chars
+        self._sent_end_re = re.compile("[%s]" % re.escape("".join(sent_end_chars)))
+
     def get_sentences(self, text):
         spans = self.span_tokenize(text.text)
         return text._sentences_from_spans(spans)
 
+    def batch_get_sentences(self, texts):
+        """
+        Get the sentences for each of the given text elements, with one call to :meth:`batch_span_tokenize`.
+        Each text is still segmented separately, so that sentences never cross the boundaries between elements.
+
+        :param list(chemdataextractor.doc.text.Text) texts: The text elements to split into sentences.
+        :returns: The sentences for each of the text elements.
+        :rtype: list(list(chemdataextractor.doc.text.Sentence))
+        """
+        all_spans = self.batch_span_tokenize([text.text for text in texts])
+        return [
+            text._sentences_from_spans(spans) for text, spans in zip(texts, all_spans)
+        ]
+
     def span_tokenize(self, s):
         """Return a list of integer offsets that identify sentences in the given text.
 
+        Text without any sentence-ending characters, such as a heading or a table cell, is a single sentence,
+        so it is returned without running Punkt.
+
         :param string s: The text to tokenize into sentences.
         :rtype: iter(tuple(int, int))
         """
         if self._tokenizer is None:
-            self._tokenizer = load_model(self.model)
+            self._load()
+        if self._sent_end_re.search(s) is None:
+            # The same span Punkt would give: from the start of the text up to any trailing whitespace
+            end = len(s.rstrip())
+            return [(0, end)] if end else []
         # for debug in tokenizer.debug_decisions(s):
         #     log.debug(format_debug_decision(debug))
         return self._tokenizer.span_tokenize(s)
 
+    def batch_span_tokenize(self, texts):
+        """Return a list of integer offsets that identify sentences for each of the given texts.
+
+        Each text is tokenized in turn by :meth:`span_tokenize`, so Punkt is only run on the texts that contain
+        sentence-ending characters. The texts are not joined, as Punkt's boundary decisions would then cross from
+        one text to the next.
+
+        :param list(str) texts: The texts to tokenize into sentences.
+        :rtype: list(list(tuple(int, int)))
+        """
+        return [list(self.span_tokenize(s)) for s in texts]
+
 
 class ChemSentenceTokenizer(SentenceTokenizer):
     """Sentence tokenizer that uses the Punkt algorithm by Kiss & Strunk (2006), trained on chemistry text."""
@@ -331,6 +371,50 @@ class WordTokenizer(BaseTokenizer):
     def __init__(self, split_last_stop=True):
         #: Whether to split off the final full stop (unless preceded by NO_SPLIT_STOP). Default True.
         self.split_last_stop = split_last_stop
+        self._compile_rules()
+
+    @property
+    def cache_identity(self):
+        """
+        The class and options of this tokenizer, used as part of the key for spans stored in a
+        :class:`TokenizationCache`. Subclasses with other options that change how text is tokenized should add them.
+        """
+        return (self.__class__, self.split_last_stop)
+
+    def _compile_rules(self):
+        """
+        Precompile the sequence lists that define the splitting rules into sets, tuples and combined regular
+        expressions, so that most tokens can be ruled out of each rule with a single check. This must be called
+        again if any of the sequence lists are modified on an existing tokenizer.
+        """
+        self._unsplittable = (
+            set(self.SPLIT) | set(self.SPLIT_END_WORD) | set(self.SPLIT_START_WORD)
+        )
+        self._split_end_word = tuple(self.SPLIT_END_WORD)
+        self._split_start_word = tuple(self.SPLIT_START_WORD)
+        # SPLIT sequences indexed by their first character, with their priority (position in SPLIT)
+        self._split_by_char = {}
+        for priority, spl in enumerate(self.SPLIT):
+            if spl:
+                self._split_by_char.setdefault(spl[0], []).append((priority, spl))
+        self._contractions = {}
+        for contraction, index in self.CONTRACTIONS:
+            self._contractions.setdefault(contraction, index)
+
+    def _find_split(self, text):
+        """
+        Find the first sequence in SPLIT that occurs in the text, returning its index and the sequence, or None.
+        Only the sequences that start with a character in the text are checked.
+        """
+        candidates = []
+        for char in set(text):
+            if char in self._split_by_char:
+                candidates.extend(self._split_by_char[char])
+        for priority, spl in sorted(candidates):
+            ind = text.find(spl)
+            if ind > -1:
+                return ind, spl
+        return None
 
     def _split_span(self, span, index, length=0):
         """Split a span into two or three separate spans at certain indices."""
@@ -350,19 +434,13 @@ class WordTokenizer(BaseTokenizer):
         # Skip if only a single character or a split sequence
         if (
             span[1] - span[0] < 2
-            or text in self.SPLIT
-            or text in self.SPLIT_END_WORD
-            or text in self.SPLIT_START_WORD
+            or text in self._unsplittable
             or lowertext in self.NO_SPLIT
         ):
             return [span]
 
         # Skip if it looks like URL
-        if (
-            text.startswith("http://")
-            or text.startswith("ftp://")
-            or text.startswith("www.")
-        ):
+        if text.startswith(("http://", "ftp://", "www.")):
             return [span]
 
         # Split full stop at end of final token (allow certain characters to follow) unless ellipsis
@@ -379,28 +457,29 @@ class WordTokenizer(BaseTokenizer):
                 return self._split_span(span, ind, 1)
 
         # Split off certain sequences at the end of a word
-        for spl in self.SPLIT_END_WORD:
-            if (
-                text.endswith(spl)
-                and len(text) > len(spl)
-                and text[-len(spl) - 1].isalpha()
-            ):
-                return self._split_span(span, -len(spl), 0)
+        if text.endswith(self._split_end_word):
+            for spl in self.SPLIT_END_WORD:
+                if (
+                    text.endswith(spl)
+                    and len(text) > len(spl)
+                    and text[-len(spl) - 1].isalpha()
+                ):
+                    return self._split_span(span, -len(spl), 0)
 
         # Split off certain sequences at the start of a word
-        for spl in self.SPLIT_START_WORD:
-            if (
-                text.startswith(spl)
-                and len(text) > len(spl)
-                and text[-len(spl) - 1].isalpha()
-            ):
-                return self._split_span(span, len(spl), 0)
+        if text.startswith(self._split_start_word):
+            for spl in self.SPLIT_START_WORD:
+                if (
+                    text.startswith(spl)
+                    and len(text) > len(spl)
+                    and text[-len(spl) - 1].isalpha()
+                ):
+                    return self._split_span(span, len(spl), 0)
 
         # Split around certain sequences
-        for spl in self.SPLIT:
-            ind = text.find(spl)
-            if ind > -1:
-                return self._split_span(span, ind, len(spl))
+        split = self._find_split(text)
+        if split is not None:
+            return self._split_span(span, split[0], len(split[1]))
 
         # Split around certain sequences unless followed by a digit
         for spl in self.SPLIT_NO_DIGIT:
@@ -411,25 +490,25 @@ class WordTokenizer(BaseTokenizer):
                 return self._split_span(span, ind, len(spl))
 
         # Characters to split around, but with exceptions
-        for i, char in enumerate(text):
-            if char == "-":
-                before = lowertext[:i]
-                after = lowertext[i + 1 :]
-                # By default we split on hyphens
-                split = True
-                if before in self.NO_SPLIT_PREFIX or after in self.NO_SPLIT_SUFFIX:
-                    split = False  # Don't split if prefix or suffix in list
-                elif not before.strip(self.NO_SPLIT_CHARS) or not after.strip(
-                    self.NO_SPLIT_CHARS
-                ):
-                    split = False  # Don't split if prefix or suffix entirely consist of certain characters
-                if split:
-                    return self._split_span(span, i, 1)
+        i = text.find("-")
+        while i > -1:
+            before = lowertext[:i]
+            after = lowertext[i + 1 :]
+            # By default we split on hyphens
+            split = True
+            if before in self.NO_SPLIT_PREFIX or after in self.NO_SPLIT_SUFFIX:
+                split = False  # Don't split if prefix or suffix in list
+            elif not before.strip(self.NO_SPLIT_CHARS) or not after.strip(
+                self.NO_SPLIT_CHARS
+            ):
+                split = False  # Don't split if prefix or suffix entirely consist of certain characters
+            if split:
+                return self._split_span(span, i, 1)
+            i = text.find("-", i + 1)
 
         # Split contraction words
-        for contraction in self.CONTRACTIONS:
-            if lowertext == contraction[0]:
-                return self._split_span(span, contraction[1])
+        if lowertext in self._contractions:
+            return self._split_span(span, self._contractions[lowertext])
 
         additional_regex_handled = self.handle_additional_regex(
             s, span, nextspan, additional_regex
@@ -484,21 +563,30 @@ class WordTokenizer(BaseTokenizer):
             for left, right in regex_span_tokenize(s, "\s+")
             if not left == right
         ]
-        i = 0
-        # Recursively split spans according to rules
-        while i < len(spans):
+        # Recursively split spans according to rules. Spans still to be split are kept on a stack, in reverse
+        # order, and finished spans are appended to the output, which avoids splicing subspans into a list.
+        pending = spans[::-1]
+        output = []
+        while pending:
+            span = pending.pop()
             subspans = self._subspan(
-                s,
-                spans[i],
-                spans[i + 1] if i + 1 < len(spans) else None,
-                additional_regex,
+                s, span, pending[-1] if pending else None, additional_regex
             )
-            spans[i : i + 1] = [
-                subspan for subspan in subspans if subspan[1] - subspan[0] > 0
-            ]
             if len(subspans) == 1:
-                i += 1
-        return spans
+                output.append(subspans[0])
+            else:
+                pending.extend(
+                    subspan
+                    for subspan in reversed(subspans)
+                    if subspan[1] - subspan[0] > 0
+                )
+        return output
+
+
+#: Matches numeric peaks with a bracketed strength/shape, e.g. 1650(br)
+BRACKETED_PEAK_RE = re.compile(r"^(\d+\.\d+|\d{3,})(\([a-z]+\))$", re.I)
+#: Matches the characters that ChemWordTokenizer considers splitting around, subject to exceptions
+SPLIT_CHAR_RE = re.compile("[:;x+−±/>→(-]")
 
 
 class ChemWordTokenizer(WordTokenizer):
@@ -1376,6 +1464,11 @@ class ChemWordTokenizer(WordTokenizer):
     }
     NO_SPLIT = {"°c"}
 
+    def _compile_rules(self):
+        super(ChemWordTokenizer, self)._compile_rules()
+        self._split_end = tuple(self.SPLIT_END)
+        self._split_end_no_digit = tuple(self.SPLIT_END_NO_DIGIT)
+
     def get_additional_regex(self, sentence):
         additional_regex = [self.QUANTITY_RE]
         quantity_re = sentence.quantity_re
@@ -1439,19 +1532,13 @@ class ChemWordTokenizer(WordTokenizer):
         # Skip if only a single character or a split sequence
         if (
             span[1] - span[0] < 2
-            or text in self.SPLIT
-            or text in self.SPLIT_END_WORD
-            or text in self.SPLIT_START_WORD
+            or text in self._unsplittable
             or lowertext in self.NO_SPLIT
         ):
             return [span]
 
         # Skip if it looks like URL
-        if (
-            text.startswith("http://")
-            or text.startswith("ftp://")
-            or text.startswith("www.")
-        ):
+        if text.startswith(("http://", "ftp://", "www.")):
             return [span]
 
         # Split full stop at end of final token (allow certain characters to follow) unless ellipsis
@@ -1468,33 +1555,35 @@ class ChemWordTokenizer(WordTokenizer):
                 return self._split_span(span, ind, 1)
 
         # Split off certain sequences at the end of a token
-        for spl in self.SPLIT_END:
-            if text.endswith(spl) and len(text) > len(spl):
-                return self._split_span(span, -len(spl), 0)
+        if text.endswith(self._split_end):
+            for spl in self.SPLIT_END:
+                if text.endswith(spl) and len(text) > len(spl):
+                    return self._split_span(span, -len(spl), 0)
 
         # Split off certain sequences at the end of a word
-        for spl in self.SPLIT_END_WORD:
-            if (
-                text.endswith(spl)
-                and len(text) > len(spl)
-                and text[-len(spl) - 1].isalpha()
-            ):
-                return self._split_span(span, -len(spl), 0)
+        if text.endswith(self._split_end_word):
+            for spl in self.SPLIT_END_WORD:
+                if (
+                    text.endswith(spl)
+                    and len(text) > len(spl)
+                    and text[-len(spl) - 1].isalpha()
+                ):
+                    return self._split_span(span, -len(spl), 0)
 
         # Split off certain sequences at the end of a word
-        for spl in self.SPLIT_START_WORD:
-            if (
-                text.startswith(spl)
-                and len(text) > len(spl)
-                and text[-len(spl) - 1].isalpha()
-            ):
-                return self._split_span(span, len(spl), 0)
+        if text.startswith(self._split_start_word):
+            for spl in self.SPLIT_START_WORD:
+                if (
+                    text.startswith(spl)
+                    and len(text) > len(spl)
+                    and text[-len(spl) - 1].isalpha()
+                ):
+                    return self._split_span(span, len(spl), 0)
 
         # Split around certain sequences
-        for spl in self.SPLIT:
-            ind = text.find(spl)
-            if ind > -1:
-                return self._split_span(span, ind, len(spl))
+        split = self._find_split(text)
+        if split is not None:
+            return self._split_span(span, split[0], len(split[1]))
 
         # Split around certain sequences unless followed by a digit
         # - We skip this because of difficulty with chemical names.
@@ -1504,13 +1593,14 @@ class ChemWordTokenizer(WordTokenizer):
         #         return self._split_span(span, ind, len(spl))
 
         # Split off certain sequences at the end of a token unless preceded by a digit
-        for spl in self.SPLIT_END_NO_DIGIT:
-            if (
-                text.endswith(spl)
-                and len(text) > len(spl)
-                and not text[-len(spl) - 1].isdigit()
-            ):
-                return self._split_span(span, -len(spl), 0)
+        if text.endswith(self._split_end_no_digit):
+            for spl in self.SPLIT_END_NO_DIGIT:
+                if (
+                    text.endswith(spl)
+                    and len(text) > len(spl)
+                    and not text[-len(spl) - 1].isdigit()
+                ):
+                    return self._split_span(span, -len(spl), 0)
 
         # Regular Bracket at both start and end, break off both provided they correspond
         if (
@@ -1525,7 +1615,7 @@ class ChemWordTokenizer(WordTokenizer):
             return self._split_span(span, 2, 1)
 
         # Split things like \d+\.\d+([a-z]+) e.g. UV-vis/IR peaks with bracketed strength/shape
-        m = re.match("^(\d+\.\d+|\d{3,})(\([a-z]+\))$", text, re.I)
+        m = BRACKETED_PEAK_RE.match(text)
         if m:
             return self._split_span(span, m.start(2), 1)
 
@@ -1548,7 +1638,9 @@ class ChemWordTokenizer(WordTokenizer):
         # TODO: Consider splitting around comma in limited circumstances. Mainly to fix whitespace errors.
 
         # Characters to split around, but with exceptions
-        for i, char in enumerate(text):
+        for match in SPLIT_CHAR_RE.finditer(text):
+            i = match.start()
+            char = text[i]
             before = text[:i]
             after = text[i + 1 :]
             if char in {":", ";"}:
@@ -1712,9 +1804,8 @@ class ChemWordTokenizer(WordTokenizer):
             return self._split_span(span, 2, 0)
 
         # Split contraction words
-        for contraction in self.CONTRACTIONS:
-            if lowertext == contraction[0]:
-                return self._split_span(span, contraction[1])
+        if lowertext in self._contractions:
+            return self._split_span(span, self._contractions[lowertext])
 
         additional_regex_handled = self.handle_additional_regex(
             s, span, nextspan, additional_regex
@@ -1893,9 +1984,18 @@ class BertWordTokenizer(ChemWordTokenizer):
         super().__init__(split_last_stop)
         if path is None:
             path = find_data("models/scibert_uncased_vocab-1.0.txt")
+        self.path = path
+        self.lowercase = lowercase
         # TODO: It's maybe worth replacing with the transformers library tokenizers.
         self.tokenizer = BertWordPieceTokenizer(path, lowercase=lowercase)
 
+    @property
+    def cache_identity(self):
+        return super(BertWordTokenizer, self).cache_identity + (
+            self.path,
+            self.lowercase,
+        )
+
     def span_tokenize(self, s, additional_regex=None):
         output = self.tokenizer.encode(str(s))
         offsets = output.offsets[1:-1]
@@ -1975,20 +2075,72 @@ class BertWordTokenizer(ChemWordTokenizer):
 
         # Perform additional tokenisation as required by the additional regex
         if additional_regex is not None:
-            i = 0
-            while i < len(spans):
+            pending = spans[::-1]
+            spans = []
+            while pending:
+                span = pending.pop()
                 subspans = self.handle_additional_regex(
-                    s,
-                    spans[i],
-                    spans[i + 1] if i + 1 < len(spans) else None,
-                    additional_regex,
+                    s, span, pending[-1] if pending else None, additional_regex
                 )
                 if subspans is None:
-                    subspans = [spans[i]]
-                spans[i : i + 1] = [
-                    subspan for subspan in subspans if subspan[1] - subspan[0] > 0
-                ]
-                if len(subspans) == 1:
-                    i += 1
+                    if span[1] - span[0] > 0:
+                        spans.append(span)
+                else:
+                    pending.extend(
+                        subspan
+                        for subspan in reversed(subspans)
+                        if subspan[1] - subspan[0] > 0
+                    )
 
         return spans
+
+
+class TokenizationCache(LRUCache):
+    """
+    A least recently used cache of the token spans found by word tokenizers.
+
+    Spans are stored under the :attr:`~WordTokenizer.cache_identity` of the tokenizer, the text, and any additional
+    regular expressions used to split the tokens, so identical strings that occur many times, such as table headings
+    and captions, are only tokenized once. Tokenizers of the same class and options are assumed to tokenize text in
+    the same way.
+    """
+
+    def __init__(self, max_size=100000):
+        """
+        :param int max_size: (Optional) The maximum number of texts for which spans are stored. Default 100000.
+        """
+        super(TokenizationCache, self).__init__(max_size=max_size)
+
+    def span_tokenize(self, tokenizer, s, additional_regex=None):
+        """
+        Get the token spans for the given text from the cache, tokenizing it with the tokenizer if not found.
+
+        :param WordTokenizer tokenizer: The word tokenizer.
+        :param str s: The text to tokenize.
+        :param list additional_regex: (Optional) Any additional regular expressions to further split the tokens.
+        :returns: The spans of each of the tokens.
+        :rtype: tuple(tuple(int, int))
+        """
+        key = (
+            tokenizer.cache_identity,
+            s,
+            tuple(additional_regex) if additional_regex else None,
+        )
+        spans = self.get(key)
+        if spans is None:
+            spans = tuple(tokenizer.span_tokenize(s, additional_regex))
+            self[key] = spans
+        return spans
+
+    def get_word_tokens(self, tokenizer, sentence):
+        """
+        Get the tokens for the sentence, equivalent to :meth:`WordTokenizer.get_word_tokens`, using the cached spans.
+
+        :param WordTokenizer tokenizer: The word tokenizer.
+        :param chemdataextractor.doc.text.Sentence sentence: The sentence to tokenize.
+        :rtype: list(chemdataextractor.doc.text.RichToken)
+        """
+        additional_regex = tokenizer.get_additional_regex(sentence)
+        return sentence._tokens_for_spans(
+            self.span_tokenize(tokenizer, sentence.text, additional_regex)
+        )
@@ -41,7 +41,7 @@ from .elements import (
     Or,
     NoMatch,
 )
-from ..utils import first
+from ..utils import first, LRUCache
 from .quantity import magnitudes_dict, value_element, extract_units, lbrct, rbrct
 from .base import BaseSentenceParser, BaseParser, BaseTableParser
 
@@ -50,6 +50,10 @@ import xml.etree.ElementTree as etree
 
 log = logging.getLogger(__name__)
 
+#: Unit elements built by :func:`construct_unit_element`, keyed by the patterns of the units they match
+#: and the maximum power.
+unit_element_cache = LRUCache(max_size=256)
+
 
 def construct_unit_element(dimensions, max_power=None):
     """
@@ -67,6 +71,17 @@ def construct_unit_element(dimensions, max_power=None):
     """
     if not dimensions or not dimensions.units_dict:
         return None
+    unit_patterns = tuple(element.pattern for element in dimensions.units_dict)
+    key = (unit_patterns, max_power)
+    unit_element = unit_element_cache.get(key)
+    if unit_element is None:
+        unit_element = _construct_unit_element(unit_patterns, max_power)
+        unit_element_cache[key] = unit_element
+    # The cached element is shared, so callers get a copy they can add actions and conditions to
+    return unit_element.copy()
+
+
+def _construct_unit_element(unit_patterns, max_power):
     # Handle all the magnitudes
     units_regex = "^(("
     for element in magnitudes_dict.keys():
@@ -77,8 +92,8 @@ def construct_unit_element(dimensions, max_power=None):
     # Case where we have a token that's just brackets
     units_regex += r"((\(|\[))|((\)|\]))|\-|"
     # Handle all the units
-    for element in dimensions.units_dict:
-        units_regex += "(" + element.pattern + ")|"
+    for pattern in unit_patterns:
+        units_regex += "(" + pattern + ")|"
     units_regex += r"(\/)"
     numbers_regex = r"\d+"
     if max_power is not None:
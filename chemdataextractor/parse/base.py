@@ -9,6 +9,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 from abc import abstractproperty, abstractmethod
 from .quantity import extract_error, extract_units, extract_value
+from .parse_cache import fingerprint
 import logging
 
 log = logging.getLogger(__name__)
@@ -35,10 +36,66 @@ class BaseParser(object):
     that takes little time to process.
     """
 
+    cacheable = None
+    """
+    Whether the records found by this parser may be stored in a :class:`~chemdataextractor.parse.parse_cache.ParseCache`.
+    If None, they are stored only if the parser does not override
+    :meth:`~chemdataextractor.parse.base.BaseSentenceParser.parse_sentence`. Set to False for parsers whose records
+    depend on anything other than the text and tags of the tokens, the model, and the parse expressions.
+    """
+
     @abstractproperty
     def root(self):
         pass
 
+    @property
+    def cache_identity(self):
+        """
+        A string identifying this parser, used as part of the key for records stored in a
+        :class:`~chemdataextractor.parse.parse_cache.ParseCache`. This is made up of the class of the parser and a
+        :func:`~chemdataextractor.parse.parse_cache.fingerprint` of the parser, its model and its parse expressions.
+        It is worked out again whenever the parser is used with another model, or the updatable parse expressions of
+        the model or of the models it contains are changed, as they are by
+        :meth:`~chemdataextractor.model.base.BaseModel.update` and
+        :meth:`~chemdataextractor.model.base.BaseModel.reset_updatables`.
+        """
+        model = self.model
+        cached = self.__dict__.get("_cache_identity")
+        if cached is None or cached[0] is not model:
+            models = []
+            if model is not None:
+                models = sorted(
+                    model.flatten(include_inferred=False), key=lambda m: m.__name__
+                )
+            cached = (model, models, None, None)
+        models = cached[1]
+        # Updating a model replaces the parse expressions of its updatable fields with new objects
+        expressions = [
+            field.parse_expression
+            for m in models
+            for field in m.fields.values()
+            if field.updatable
+        ]
+        updated = [m._updated for m in models]
+        if (
+            cached[2] is None
+            or updated != cached[2][1]
+            or any(
+                expression is not previous
+                for expression, previous in zip(expressions, cached[2][0])
+            )
+        ):
+            cls = self.__class__
+            parts = [self, model, self.root, self.trigger_phrase, updated]
+            identity = "%s.%s:%s" % (
+                cls.__module__,
+                cls.__qualname__,
+                fingerprint(parts),
+            )
+            cached = (model, models, (expressions, updated), identity)
+            self._cache_identity = cached
+        return cached[3]
+
     @abstractmethod
     def interpret(self, result, start, end):
         pass
@@ -173,14 +230,18 @@ class BaseTableParser(BaseParser):
         :returns: All the models found in the table.
         :rtype: Iterator[:class:`chemdataextractor.model.base.BaseModel`]
         """
-        if self.trigger_phrase is not None:
+        trigger_phrase = self.trigger_phrase
+        if trigger_phrase is not None:
+            # Only whether the trigger phrase is found matters, so stop at the first match
             trigger_phrase_results = [
-                result for result in self.trigger_phrase.scan(cell.tokens)
+                result for result in trigger_phrase.scan(cell.tokens, max_matches=1)
             ]
-        if (
-            self.trigger_phrase is None or trigger_phrase_results
-        ) and self.root is not None:
-            for result in self.root.scan(cell.tokens):
+        if trigger_phrase is None or trigger_phrase_results:
+            # The root phrase of some parsers is built each time it is accessed, so only do so once
+            root = self.root
+            if root is None:
+                return
+            for result in root.scan(cell.tokens):
                 try:
                     for model in self.interpret(*result):
                         yield model
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent cache for the records found by sentence parsers.
+
+The records a parser finds in a sentence depend only on the text and tags of the tokens, the model, and the parser's
+grammar. The records are therefore stored under a hash of the
+:attr:`~chemdataextractor.parse.base.BaseParser.cache_identity` of the parser, which is a fingerprint of the
+parser, its parse expressions and its model, and of the text and tags of the tokens. The tags in the key are the
+legacy tag (the NER tag, or the PoS tag where there is none) and every tag type that the
+:class:`~chemdataextractor.parse.elements.Tag` elements of the parse expressions match against. Editing the fields of
+a model, its parse expressions, or the code of the parser or model changes the fingerprint, so stale records are not
+used. Parsers whose parse expressions use custom elements that read other tags should set
+:attr:`~chemdataextractor.parse.base.BaseSentenceParser.cacheable` to False.
+
+Usage::
+
+    from chemdataextractor.parse.parse_cache import ParseCache
+
+    doc = Document.from_file(f)
+    doc.parse_cache = ParseCache('path/to/parse_cache.sqlite')
+    doc.records
+    print(doc.parse_cache.stats())
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import types
+
+import appdirs
+
+
+log = logging.getLogger(__name__)
+
+
+#: Attributes of models that are not part of their fingerprint.
+_MODEL_IGNORED_ATTRIBUTES = {"parsers"}
+
+_METHOD_TYPES = (types.FunctionType, classmethod, staticmethod, property)
+
+_class_code_fingerprints = {}
+
+
+def _code_parts(code, parts):
+    """Add the parts of a code object that determine its behaviour, ignoring its file name and line numbers."""
+    parts.append(code.co_code)
+    parts.append(repr(code.co_names))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_parts(const, parts)
+        elif isinstance(const, frozenset):
+            parts.append(repr(sorted(repr(c) for c in const)))
+        else:
+            parts.append(repr(const))
+
+
+def _class_code(cls):
+    """A fingerprint of the code of the methods defined by a class and its bases."""
+    if cls not in _class_code_fingerprints:
+        parts = []
+        for klass in cls.__mro__:
+            if klass is object:
+                continue
+            for name, value in sorted(vars(klass).items()):
+                if isinstance(value, (classmethod, staticmethod)):
+                    value = value.__func__
+                elif isinstance(value, property):
+                    value = value.fget
+                if isinstance(value, types.FunctionType):
+                    parts.append(name)
+                    _code_parts(value.__code__, parts)
+        digest = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+        _class_code_fingerprints[cls] = digest.hexdigest()
+    return _class_code_fingerprints[cls]
+
+
+class _Fingerprinter(object):
+    """Walks an object graph, collecting the parts that determine its behaviour."""
+
+    def __init__(self):
+        self.parts = []
+        # Objects seen so far, by id, so that cycles are only followed once. The objects are kept so ids are not reused
+        self.seen = {}
+
+    def add(self, obj):
+        from ..model.base import BaseModel
+        from .elements import BaseParserElement
+
+        parts = self.parts
+        if obj is None or isinstance(obj, (bool, int, float, str, bytes)):
+            parts.append(repr(obj))
+            return
+        if id(obj) in self.seen:
+            parts.append("<ref %d>" % self.seen[id(obj)][0])
+            return
+        self.seen[id(obj)] = (len(self.seen), obj)
+
+        if isinstance(obj, type):
+            name = "%s.%s" % (obj.__module__, obj.__qualname__)
+            parts.append("<class %s %s>" % (name, _class_code(obj)))
+            if issubclass(obj, BaseModel):
+                for klass in obj.__mro__:
+                    for name, value in sorted(vars(klass).items()):
+                        # Methods are part of the fingerprint of the code of the class
+                        if (
+                            name.startswith("_")
+                            or name in _MODEL_IGNORED_ATTRIBUTES
+                            or isinstance(value, _METHOD_TYPES)
+                        ):
+                            continue
+                        parts.append(name)
+                        self.add(value)
+        elif isinstance(obj, types.FunctionType):
+            parts.append("<function %s.%s>" % (obj.__module__, obj.__qualname__))
+            _code_parts(obj.__code__, parts)
+            self.add(obj.__defaults__)
+            self.add([cell.cell_contents for cell in obj.__closure__ or ()])
+        elif isinstance(obj, types.MethodType):
+            parts.append("<method>")
+            self.add(obj.__func__)
+            self.add(obj.__self__)
+        elif isinstance(obj, (types.BuiltinFunctionType, types.ModuleType)):
+            name = getattr(obj, "__qualname__", obj.__name__)
+            parts.append("<%s %s>" % (type(obj).__name__, name))
+        elif isinstance(obj, re.Pattern):
+            parts.append("<regex %r %d>" % (obj.pattern, obj.flags))
+        elif isinstance(obj, (list, tuple)):
+            parts.append("<%s %d>" % (type(obj).__name__, len(obj)))
+            for item in obj:
+                self.add(item)
+        elif isinstance(obj, dict):
+            parts.append("<dict %d>" % len(obj))
+            for key, value in obj.items():
+                self.add(key)
+                self.add(value)
+        elif isinstance(obj, (set, frozenset)):
+            # Sets of strings are ordered differently in each process, so order the items by their fingerprints
+            parts.append("<set %d>" % len(obj))
+            parts.extend(sorted(fingerprint(item) for item in obj))
+        else:
+            cls = type(obj)
+            parts.append(
+                "<%s.%s %s>" % (cls.__module__, cls.__qualname__, _class_code(cls))
+            )
+            if isinstance(obj, BaseParserElement) and not obj.streamlined:
+                obj.streamline()
+            for name, value in sorted(getattr(obj, "__dict__", {}).items()):
+                if name.startswith("_") or name == "streamlined":
+                    continue
+                parts.append(name)
+                self.add(value)
+
+    def hexdigest(self):
+        digest = hashlib.blake2b(digest_size=20)
+        for part in self.parts:
+            digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+
+def _expression_tag_types(expressions):
+    """
+    The tag types matched by the :class:`~chemdataextractor.parse.elements.Tag` elements within the given parse
+    expressions, other than the legacy tag, which are the tag types that the records found by the expressions depend on.
+
+    :param list(BaseParserElement) expressions: The parse expressions. Any that are None are ignored.
+    :returns: The tag types, in a stable order.
+    :rtype: list
+    """
+    tag_types = set()
+    seen = set()
+    expressions = list(expressions)
+    while expressions:
+        expression = expressions.pop()
+        if expression is None or id(expression) in seen:
+            continue
+        seen.add(id(expression))
+        tag_type = getattr(expression, "tag_type", None)
+        if tag_type is not None and tag_type not in (0, 1):
+            tag_types.add(tag_type)
+        expressions.extend(getattr(expression, "exprs", None) or [])
+        expressions.append(getattr(expression, "expr", None))
+    return sorted(tag_types, key=str)
+
+
+def fingerprint(obj):
+    """
+    A fingerprint of an object, such as a parse expression, a model or a parser, that changes whenever its behaviour
+    might change.
+
+    The fingerprint is made up of the values of the public attributes of the object, followed recursively, together
+    with the code of the methods of its class. The fingerprint of a model class is made up of its fields and other
+    public class attributes.
+
+    :param obj: The object.
+    :returns: A hexadecimal digest.
+    :rtype: str
+    """
+    fingerprinter = _Fingerprinter()
+    fingerprinter.add(obj)
+    return fingerprinter.hexdigest()
+
+
+class ParseCache(object):
+    """
+    A cache of the records found by sentence parsers, kept in a
+    :class:`~chemdataextractor.doc.cache_store.SqliteCacheStore`.
+
+    Only parsers for which :meth:`can_cache` is True are cached. The records for a sentence are stored as they are
+    found by :meth:`~chemdataextractor.parse.base.BaseSentenceParser.parse_sentence`, before they are merged with
+    other records.
+    """
+
+    def __init__(self, path=None, max_size=2**30, store=None):
+        """
+        :param str path: (Optional) Path to the SQLite file for the cache. Defaults to ``parse_cache.sqlite``
+            in ChemDataExtractor's OS-dependent cache directory.
+        :param int max_size: (Optional) The maximum total size, in bytes, of the stored records. Default 1 GiB.
+        :param BaseCacheStore store: (Optional) The store to keep the records in, instead of a SQLite file.
+        """
+        if store is None:
+            from ..doc.cache_store import SqliteCacheStore
+
+            if path is None:
+                path = os.path.join(
+                    appdirs.user_cache_dir("ChemDataExtractor"), "parse_cache.sqlite"
+                )
+            store = SqliteCacheStore(path, max_size=max_size)
+        self.store = store
+        #: The number of parses for which records were found in the cache.
+        self.hits = 0
+        #: The number of parses for which records were not found in the cache.
+        self.misses = 0
+        # The tag types matched by the parse expressions of each parser, keyed by the cache identity of the parser
+        self._tag_types = {}
+
+    def __repr__(self):
+        return "<%s: %r>" % (self.__class__.__name__, self.store)
+
+    def can_cache(self, parser):
+        """
+        Whether the records found by the given parser are stored in this cache. This is given by the parser's
+        :attr:`~chemdataextractor.parse.base.BaseParser.cacheable` attribute, or if that is None, by whether the
+        parser uses the default :meth:`~chemdataextractor.parse.base.BaseSentenceParser.parse_sentence`, which only
+        looks at the text and tags of the tokens.
+
+        :param BaseSentenceParser parser: The parser.
+        :rtype: bool
+        """
+        from .base import BaseSentenceParser
+
+        cacheable = getattr(parser, "cacheable", None)
+        if cacheable is None:
+            cacheable = (
+                getattr(type(parser), "parse_sentence", None)
+                is BaseSentenceParser.parse_sentence
+            )
+        return cacheable
+
+    def key(self, parser, tokens):
+        """
+        The key under which the records found in the given tokens are stored. This is made up of the cache identity
+        of the parser, and the text, the legacy tag and each tag type matched by the parse expressions of each token.
+
+        :param BaseSentenceParser parser: The parser.
+        :param list(RichToken) tokens: The tokens of the sentence.
+        :rtype: str
+        """
+        identity = parser.cache_identity
+        tag_types = self._tag_types.get(identity)
+        if tag_types is None:
+            tag_types = _expression_tag_types([parser.root, parser.trigger_phrase])
+            self._tag_types[identity] = tag_types
+        content = json.dumps(
+            [
+                identity,
+                [
+                    [token[0], token[1]] + [token[tag_type] for tag_type in tag_types]
+                    for token in tokens
+                ],
+            ],
+            ensure_ascii=False,
+            default=repr,
+        )
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=20).hexdigest()
+
+    def get(self, parser, tokens):
+        """
+        Get the cached records for the given tokens. New copies of the records are returned each time.
+
+        :param BaseSentenceParser parser: The parser.
+        :param list(RichToken) tokens: The tokens of the sentence.
+        :returns: The records, or None if they were not found in the cache.
+        :rtype: list(BaseModel) or None
+        """
+        value = self.store.get(self.key(parser, tokens))
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pickle.loads(value)
+
+    def set(self, parser, tokens, records):
+        """
+        Store the records found in the given tokens.
+
+        :param BaseSentenceParser parser: The parser.
+        :param list(RichToken) tokens: The tokens of the sentence.
+        :param list(BaseModel) records: The records found by the parser.
+        """
+        try:
+            value = pickle.dumps(list(records), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            log.debug("Not caching records of %s: %s" % (parser, e))
+            return
+        self.store.set(self.key(parser, tokens), value)
+
+    def parse_sentence(self, parser, sentence):
+        """
+        Parse a sentence with the given parser, using the cached records if there are any.
+
+        :param BaseSentenceParser parser: The parser.
+        :param Sentence sentence: The sentence.
+        :returns: The records found in the sentence.
+        :rtype: list(BaseModel)
+        """
+        tokens = sentence.tokens
+        records = self.get(parser, tokens)
+        if records is None:
+            records = list(parser.parse_sentence(sentence))
+            self.set(parser, tokens, records)
+        return records
+
+    def clear(self):
+        """Remove all entries from the cache and reset the hit and miss counters."""
+        self.store.delete_many(self.store.keys())
+        self.store.compact()
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        """Close the store."""
+        self.store.close()
+
+    def stats(self):
+        """
+        Statistics for this cache.
+
+        :returns: A dictionary containing the number of hits and misses in this process, the hit rate,
+            and the statistics of the store.
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        stats = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+        }
+        stats.update(self.store.stats())
+        return stats
@@ -9,6 +9,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+import collections
 import logging
 import re
 
@@ -19,7 +20,7 @@ from deprecation import deprecated
 from .common import lbrct, rbrct
 from .actions import merge, join
 from .elements import W, I, R, T, Optional, Any, OneOrMore, Not, ZeroOrMore
-from ..utils import memoize
+from ..utils import memoize, LRUCache
 
 log = logging.getLogger(__name__)
 
@@ -60,6 +61,10 @@ _open_bracket_pattern = re.compile("/\(")
 _division_pattern = re.compile("[/]\D*")
 # A regex pattern containing all the shorthand single letter magnitude indicators, that could be misconstrued as units
 _magnitude_indicators = re.compile("[pnµmTGMkc]")
+# A regex pattern to match backreferences in a regex pattern
+_backreference_pattern = re.compile(r"\\\d|\(\?P=")
+# The unit matchers for each units_dict, shared between dimensions with the same units_dict
+_unit_matchers = LRUCache(max_size=256)
 
 
 def value_element(units=None, activate_to_range=False):
@@ -146,15 +151,21 @@ def value_element_plain():
     return value_element()
 
 
-# @memoize
+#: Compiled regexes for :func:`construct_quantity_re`, keyed by the patterns of the units they match.
+quantity_re_cache = LRUCache(max_size=256)
+
+
 def construct_quantity_re(*models):
-    # Handle all the magnitudes
-    units_regex = "(("
-    for element in magnitudes_dict.keys():
-        units_regex += "(" + element.pattern + ")|"
-    units_regex = units_regex[:-1]
-    units_regex += ")?"
-    units_regex += "("
+    """
+    Construct a regex matching tokens that consist of a number followed directly by units of
+    the dimensions of the given models, used to split such tokens in two.
+
+    The compiled regex is shared by all sets of models that look for the same units.
+
+    :param models: The models to look for units of.
+    :returns: The compiled regex, or None if the models have no units.
+    :rtype: re.Pattern or None
+    """
     units_dict = {}
     for model in models:
         if hasattr(model, "dimensions_to_look_for"):
@@ -164,12 +175,27 @@ def construct_quantity_re(*models):
             units_dict.update(model.dimensions.units_dict)
     if len(units_dict) == 0:
         return None
+    unit_patterns = tuple(element.pattern for element in units_dict)
+    quantity_re = quantity_re_cache.get(unit_patterns)
+    if quantity_re is None:
+        quantity_re = _construct_quantity_re(unit_patterns)
+        quantity_re_cache[unit_patterns] = quantity_re
+    return quantity_re
+
+
+def _construct_quantity_re(unit_patterns):
+    # Handle all the magnitudes
+    units_regex = "(("
+    for element in magnitudes_dict.keys():
+        units_regex += "(" + element.pattern + ")|"
+    units_regex = units_regex[:-1]
+    units_regex += ")?"
+    units_regex += "("
     # Case where we have a token that's just brackets
     units_regex += "(\((?!\d))|(\)|\])|\-|"
     # Handle all the units
-    for element, unit in units_dict.items():
-        # if unit is not None:
-        units_regex += "(" + element.pattern + ")|"
+    for pattern in unit_patterns:
+        units_regex += "(" + pattern + ")|"
     units_regex += "(\/)"
     # Case when we have powers, or one or more units
     units_regex2 = units_regex + "|([\+\-–−]?\d+(\.\d+)?)"
@@ -376,7 +402,11 @@ def _convert_from_european_format(string):
     return string
 
 
-@memoize
+#: Cache of the results of :func:`extract_units`, keyed by the normalised string, the dimensions and strict.
+extract_units_cache = LRUCache(max_size=10000)
+_NOT_CACHED = object()
+
+
 def extract_units(string, dimensions, strict=False):
     """
     Takes a string and returns a Unit.
@@ -385,6 +415,9 @@ def extract_units(string, dimensions, strict=False):
     looking for a temperature, strict=False would return Fahrenheit, strinct=True would
     raise a TypeError.
 
+    The results are cached in :data:`extract_units_cache`, and a copy of the cached Unit is returned,
+    so the returned Unit may be modified freely.
+
     Usage::
 
         dimensions = Temperature() * Length()**0.5 * Time()**(1.5)
@@ -407,6 +440,32 @@ def extract_units(string, dimensions, strict=False):
     string = string.replace(" ", "")
     if string[0] == "[" and string[-1] == "]":
         string = string[1:-1]
+    # The units found depend on the units_dict, which may differ between dimensions that are equal
+    key = (string, bool(strict), tuple(dimensions.units_dict.items()), dimensions)
+    result = extract_units_cache.get(key, _NOT_CACHED)
+    if result is _NOT_CACHED:
+        try:
+            result = _extract_units(string, dimensions, strict)
+        except TypeError as e:
+            result = e
+        extract_units_cache[key] = result
+    if isinstance(result, TypeError):
+        raise TypeError(*result.args)
+    return _copy_unit(result)
+
+
+def _copy_unit(unit):
+    """Return a copy of a Unit that can be modified without affecting the original."""
+    if unit is None:
+        return None
+    unit_copy = copy.copy(unit)
+    if unit.powers is not None:
+        unit_copy.powers = dict(unit.powers)
+    return unit_copy
+
+
+def _extract_units(string, dimensions, strict):
+    """Uncached implementation of :func:`extract_units`, for a normalised string."""
     # Split string at numbers, /s, and brackets, so we have the units tokenized into the right units for later processing stages.
     try:
         split_string = _split(string)
@@ -506,24 +565,15 @@ def _find_unit_types(tokenized_sentence, dimensions):
     :returns: A list containing tuples of the found units and the string split by the units, in the format (unit, string containing the unit, the substring that caused the unit to be recognised)
     :rtype: list((chemdataextractor.quantities.Unit, str, str))
     """
-    units_dict = {}
-    for key, value in dimensions.units_dict.items():
-        if value is not None:
-            units_dict[key] = value
+    matcher = _unit_matcher(dimensions)
     units_list = []
-    # This is O(m*n), m being the length of the units dictionary, n the number of components of powers.
     for element in tokenized_sentence:
         # Find the potential matches for each of the units using the regex supplied by the user in units_dict
         all_results = []
         found_units = {}
-        for unit in units_dict.keys():
-            matches = [res for res in re.finditer(unit.pattern, element)]
-            if matches is not None:
-                for match in matches:
-                    text = match.group(0)
-                    span = match.span()
-                    all_results.append((text, span[0], span[1]))
-                    found_units[text] = units_dict[unit]
+        for text, start, end, unit in matcher.finditer(element):
+            all_results.append((text, start, end))
+            found_units[text] = unit
         # If none found, then return the original string and that no units were found.
         if len(found_units) == 0:
             units_list.append((None, element, None))
@@ -605,23 +655,112 @@ def _find_unit_types(tokenized_sentence, dimensions):
 
 
 def _remove_subranges(ranges):
-    should_remove_indices = []
-    for parent_index, parent in enumerate(ranges):
-        parent_range = (parent[1], parent[2])
-        for child_index, child in enumerate(ranges):
-            if child_index != parent_index:
-                child_range = (child[1], child[2])
-                if (
-                    child_range[0] >= parent_range[0]
-                    and child_range[1] <= parent_range[1]
-                ):
-                    should_remove_indices.append(child_index)
-    new_ranges = [
-        original_range
-        for index, original_range in enumerate(ranges)
-        if index not in should_remove_indices
-    ]
-    return new_ranges
+    """
+    Remove any of the (text, start, end) ranges that lie within another of the ranges,
+    so only the longest matches are kept. Ranges that occur more than once are all removed.
+    """
+    counts = collections.Counter((r[1], r[2]) for r in ranges)
+    should_remove = set(span for span, count in counts.items() if count > 1)
+    # With the ranges ordered by start, and then longest first, a range lies within another
+    # if and only if one of the ranges before it ends at or after its end.
+    max_end = None
+    for start, end in sorted(counts, key=lambda span: (span[0], -span[1])):
+        if max_end is not None and max_end >= end:
+            should_remove.add((start, end))
+        else:
+            max_end = end
+    return [r for r in ranges if (r[1], r[2]) not in should_remove]
+
+
+class _UnitMatcher(object):
+    """
+    Finds the matches of all the unit patterns in a units_dict in a single pass over a string,
+    giving the same matches as calling :func:`re.finditer` with each of the patterns in turn.
+
+    The patterns are combined into one regular expression, with an optional lookahead group for each pattern,
+    so matching it at a position finds the match of every pattern starting there. A second expression,
+    an alternation of all the patterns, finds the positions at which any of the patterns match.
+    """
+
+    def __init__(self, units):
+        """
+        :param tuple((BaseParserElement, Unit)) units: The elements and units from the units_dict.
+        """
+        self.units = units
+        self._units = [(element, unit) for element, unit in units if unit is not None]
+        patterns = [element.pattern for element, unit in self._units]
+        self.regex = None
+        # Group numbers and names in the patterns themselves would refer to the wrong groups once combined
+        if patterns and not any(_backreference_pattern.search(p) for p in patterns):
+            try:
+                self.starts = re.compile(
+                    "(?=%s)" % "|".join("(?:%s)" % p for p in patterns)
+                )
+                self.regex = re.compile(
+                    "".join(
+                        "(?:(?=(?P<_unit%d>%s)))?" % (i, p)
+                        for i, p in enumerate(patterns)
+                    )
+                )
+                self.groups = [
+                    self.regex.groupindex["_unit%d" % i] for i in range(len(patterns))
+                ]
+            except re.error as e:
+                log.debug("Could not combine unit patterns: %s" % e)
+                self.regex = None
+        if self.regex is None:
+            self.regexes = [re.compile(p) for p in patterns]
+
+    def __deepcopy__(self, memodict={}):
+        # Immutable once created, so it can be shared between copies of a dimension
+        return self
+
+    def finditer(self, string):
+        """
+        Find all the matches of each of the unit patterns in the string.
+
+        :param str string: The string to search.
+        :returns: The matched text, start and end, and the unit for each match, ordered by unit.
+        :rtype: list((str, int, int, Unit))
+        """
+        if self.regex is None:
+            return [
+                (match.group(0), match.start(), match.end(), self._units[i][1])
+                for i, regex in enumerate(self.regexes)
+                for match in regex.finditer(string)
+            ]
+        # The position at which each pattern may next match, as matches of a pattern do not overlap
+        next_start = [0] * len(self.groups)
+        results = []
+        for position in self.starts.finditer(string):
+            regs = self.regex.match(string, position.start()).regs
+            for i, group in enumerate(self.groups):
+                start, end = regs[group]
+                if start != -1 and start >= next_start[i]:
+                    results.append((i, start, end))
+                    next_start[i] = end if end > start else start + 1
+        # Ordered by unit, as for separate searches with each pattern
+        results.sort(key=lambda result: result[0])
+        return [
+            (string[start:end], start, end, self._units[i][1])
+            for i, start, end in results
+        ]
+
+
+def _unit_matcher(dimensions):
+    """
+    Get the :class:`_UnitMatcher` for the units_dict of the dimensions. This is compiled lazily and cached on the
+    dimensions, and recompiled if the units_dict has been changed since.
+    """
+    units = tuple(dimensions.units_dict.items())
+    matcher = getattr(dimensions, "_unit_matcher", None)
+    if matcher is None or matcher.units != units:
+        matcher = _unit_matchers.get(units)
+        if matcher is None:
+            matcher = _UnitMatcher(units)
+            _unit_matchers[units] = matcher
+        dimensions._unit_matcher = matcher
+    return matcher
 
 
 def _find_powers(units_list):
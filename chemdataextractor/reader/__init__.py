@@ -19,6 +19,7 @@ from .rsc import RscHtmlReader
 from .nlm import NlmXmlReader
 from .uspto import UsptoXmlReader
 from .springer_jats import SpringerJatsReader
+from .registry import ReaderRegistry
 
 
 DEFAULT_READERS = [
@@ -35,10 +35,5 @@ class AcsHtmlReader(HtmlReader):
     citation_css = ".reference"
     ignore_css = 'a[href="JavaScript:void(0);"], a.ref sup'
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        if b'<meta name="dc.Identifier" scheme="doi" content="10.1021/' in fstring:
-            return True
-        return False
+    extensions = (".html", ".htm")
+    markers = (b'<meta name="dc.Identifier" scheme="doi" content="10.1021/',)
@@ -13,16 +13,35 @@ from abc import ABCMeta, abstractmethod
 class BaseReader(metaclass=ABCMeta):
     """All Document Readers should implement a parse method."""
 
+    #: Filename extensions of the files this reader can read. If None, files with any name are accepted.
+    extensions = None
+
+    #: Byte strings, one of which must appear near the start of a file for this reader to read it. If None, no marker
+    #: is needed.
+    markers = None
+
     def __init__(self):
         self.root = None
 
     def detect(self, fstring, fname=None):
-        """Quickly check if this reader can parse the input. Reader subclasses should override this.
+        """Quickly check if this reader can parse the input.
 
-        Used to quickly skip attempting to parse when trying different readers. If in doubt, return True, and then
-        raise ReaderError in the parse method if it fails.
+        Used to quickly skip attempting to parse when trying different readers. By default, this checks ``fname``
+        against :attr:`extensions` and ``fstring`` for any of :attr:`markers`, so most subclasses only need to declare
+        those. Subclasses with other needs may override this. If in doubt, return True, and then raise ReaderError in
+        the parse method if it fails.
         """
-        return True
+        if not self._accepts_fname(fname):
+            return False
+        if self.markers is None:
+            return True
+        return any(marker in fstring for marker in self.markers)
+
+    def _accepts_fname(self, fname):
+        """Return True if the filename has one of this reader's extensions, or no filename is given."""
+        if not fname or self.extensions is None:
+            return True
+        return fname.lower().endswith(tuple(self.extensions))
 
     @abstractmethod
     def parse(self, fstring):
@@ -27,6 +27,9 @@ class CsspHtmlReader(HtmlReader):
     heading_css = "h3, h4, h5, h6"
     citation_css = "#csm-article-part-lead_ref > p, #csm-article-part-other_refs > p"
 
+    extensions = (".html", ".htm")
+    markers = (b'meta name="DC.Publisher" content="ChemSpider SyntheticPages"',)
+
     def _parse_table_footnotes(self, fns, refs, specials):
         """Override to account for awkward RSC table footnotes."""
         footnotes = []
@@ -37,11 +40,3 @@ class CsspHtmlReader(HtmlReader):
             footnote += Footnote("", id=fn.getprevious().get("id"))
             footnotes.append(footnote)
         return footnotes
-
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        if b'meta name="DC.Publisher" content="ChemSpider SyntheticPages"' in fstring:
-            return True
-        return False
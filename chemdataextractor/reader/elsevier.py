@@ -180,13 +180,8 @@ class ElsevierXmlReader(XmlReader):
 
     url_prefix = "https://sciencedirect.com/science/article/pii/"
 
-    def detect(self, fstring, fname=None):
-        """Elsevier document detection based on string found in xml"""
-        if fname and not fname.endswith(".xml"):
-            return False
-        if b'xmlns="http://www.elsevier.com/xml/svapi/article/dtd"' in fstring:
-            return True
-        return False
+    extensions = (".xml",)
+    markers = (b'xmlns="http://www.elsevier.com/xml/svapi/article/dtd"',)
 
     def _parse_metadata(self, el, refs, specials):
         title = self._css(self.metadata_title_css, el)
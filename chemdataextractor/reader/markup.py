@@ -8,7 +8,10 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+import copy
+import io
 import logging
+import re
 from abc import abstractmethod, ABCMeta
 from collections import defaultdict
 
@@ -37,12 +40,19 @@ from ..scrape import INLINE_ELEMENTS
 from ..scrape.clean import clean
 from ..scrape.csstranslator import CssXmlTranslator
 from ..text import get_encoding
+from ..utils import memoize
 from .base import BaseReader
 
 
 log = logging.getLogger(__name__)
 
 
+@memoize
+def _compile_css(query):
+    """Translate a CSS selector into a compiled XPath expression, once for all readers."""
+    return etree.XPath(CssXmlTranslator().css_to_xpath(query), smart_strings=False)
+
+
 class LxmlReader(BaseReader, metaclass=ABCMeta):
     """Abstract base class for lxml-based readers."""
 
@@ -100,38 +110,66 @@ class LxmlReader(BaseReader, metaclass=ABCMeta):
             elements.append(element_cls(str(el.text), id=id, references=references))
         elif references:
             elements.append(element_cls("", id=id, references=references))
+        # The (text, id, references) of inline fragments still to be joined onto the last element
+        fragments = []
         for child in el:
             # br is a special case - technically inline, but we want to split
             if (
                 child.tag not in {etree.Comment, etree.ProcessingInstruction}
                 and child.tag.lower() == "br"
             ):
+                self._join_fragments(elements, fragments)
                 elements.append(element_cls(""))
 
-            child_elements = self._parse_element_r(
-                child, specials=specials, refs=refs, id=id, element_cls=element_cls
-            )
+            inline = self._is_inline(child)
+            if (
+                inline
+                and len(child) == 0
+                and child.text is not None
+                and child not in specials
+                and len(elements) > 0
+                and type(elements[-1]) == element_cls
+            ):
+                # An inline element holding only text is joined on without creating an element for it
+                fragments.append((str(child.text), child.get("id", id), refs.get(child, [])))
+                child_elements = []
+            else:
+                child_elements = self._parse_element_r(
+                    child, specials=specials, refs=refs, id=id, element_cls=element_cls
+                )
             if (
-                self._is_inline(child)
+                inline
                 and len(elements) > 0
                 and len(child_elements) > 0
                 and isinstance(elements[-1], (Text, Sentence))
                 and isinstance(child_elements[0], (Text, Sentence))
                 and type(elements[-1]) == type(child_elements[0])
             ):
-                elements[-1] += child_elements.pop(0)
-            elements.extend(child_elements)
+                first = child_elements[0]
+                fragments.append((first.text, first.id, first.references))
+                child_elements = child_elements[1:]
+            if child_elements:
+                self._join_fragments(elements, fragments)
+                elements.extend(child_elements)
             if child.tail is not None:
                 if (
-                    self._is_inline(child)
+                    inline
                     and len(elements) > 0
-                    and isinstance(elements[-1], element_cls)
+                    and type(elements[-1]) == element_cls
                 ):
-                    elements[-1] += element_cls(str(child.tail), id=id)
+                    fragments.append((str(child.tail), id, []))
                 else:
+                    self._join_fragments(elements, fragments)
                     elements.append(element_cls(str(child.tail), id=id))
+        self._join_fragments(elements, fragments)
         return elements
 
+    def _join_fragments(self, elements, fragments):
+        """Replace the last element with one that has the pending inline fragments joined onto it."""
+        if fragments:
+            elements[-1] = elements[-1]._extended(fragments)
+            del fragments[:]
+
     def _parse_element(self, el, specials=None, refs=None, element_cls=Paragraph):
         """"""
         if specials is None:
@@ -308,14 +346,18 @@ class LxmlReader(BaseReader, metaclass=ABCMeta):
         return [meta]
 
     def _xpath(self, query, root):
-        result = root.xpath(query, smart_strings=False)
+        if isinstance(query, etree.XPath):
+            result = query(root)
+        else:
+            result = root.xpath(query, smart_strings=False)
         if type(result) is not list:
             result = [result]
-        log.debug("Selecting XPath: {}: {}".format(query, result))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Selecting XPath: {}: {}".format(query, result))
         return result
 
     def _css(self, query, root):
-        return self._xpath(CssXmlTranslator().css_to_xpath(query), root)
+        return self._xpath(_compile_css(query), root)
 
     def _is_inline(self, element):
         """Return True if an element is inline."""
@@ -331,8 +373,31 @@ class LxmlReader(BaseReader, metaclass=ABCMeta):
         """Read a string into an lxml elementtree."""
         pass
 
-    def parse(self, fstring):
-        root = self._make_tree(fstring)
+    def _make_shared_tree(self, fstring, trees):
+        """Return a tree for ``fstring``, reusing one already made by a reader that makes trees the same way."""
+        if trees is None:
+            return self._make_tree(fstring)
+        make_tree = type(self)._make_tree
+        if make_tree not in trees:
+            trees[make_tree] = self._make_tree(fstring)
+        root = trees[make_tree]
+        if root is None:
+            return None
+        # Cleaners modify the tree in place, so each reader works on its own copy
+        return copy.deepcopy(root.getroottree()).getroot()
+
+    def parse(self, fstring, trees=None):
+        """Parse the input and return a Document. Raises ReaderError if the parse fails.
+
+        :param bytes fstring: The contents of the file.
+        :param dict trees: (Optional) Unmodified trees already made from ``fstring``, keyed by the ``_make_tree``
+            function that made them. Readers of the same markup format share these instead of parsing ``fstring``
+            again.
+        """
+        return self._parse_tree(self._make_shared_tree(fstring, trees))
+
+    def _parse_tree(self, root):
+        """Return a Document for the given tree. Raises ReaderError if there is no tree."""
         self.root = root
 
         if root is None:
@@ -377,14 +442,70 @@ class LxmlReader(BaseReader, metaclass=ABCMeta):
         return Document(*elements)
 
 
+class _ArchiveStream(object):
+    """A file-like view of an archive of concatenated XML documents as a single XML document.
+
+    The XML declaration and document type declaration of each document are removed, and the documents are wrapped in
+    one ``cde-archive`` element, so the archive can be parsed incrementally by ``lxml.etree.iterparse``.
+    """
+
+    #: XML declarations and document type declarations, with an optional internal subset.
+    declaration = re.compile(br"<\?xml\s[^>]*\?>|<!DOCTYPE[^\[>]*(?:\[[^\]]*\])?\s*>")
+    encoding = re.compile(br"""<\?xml\s[^>]*encoding=["']([A-Za-z0-9._-]+)["']""")
+
+    def __init__(self, f, chunk_size=65536):
+        """
+        :param f: A binary file-like object.
+        :param int chunk_size: (Optional) Number of bytes to read from the file at a time.
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self._started = False
+        self._finished = False
+        self._carry = b""
+
+    def _safe_end(self, data):
+        """Return the index before which no declaration can be cut off by the end of the data read so far."""
+        end = data.rfind(b"<")
+        doctype = data.rfind(b"<!DOCTYPE")
+        if doctype != -1 and not self.declaration.match(data, doctype):
+            end = doctype
+        return len(data) if end == -1 else end
+
+    def read(self, size=-1):
+        """Return the next part of the archive as a single document, or an empty byte string at the end."""
+        while not self._finished:
+            chunk = self.f.read(self.chunk_size)
+            prefix = b""
+            if not self._started:
+                self._started = True
+                if chunk.startswith(b"\xef\xbb\xbf"):
+                    chunk = chunk[3:]
+                match = self.encoding.search(chunk)
+                if match:
+                    prefix = b'<?xml version="1.0" encoding="' + match.group(1) + b'"?>'
+                prefix += b"<cde-archive>"
+            data = self._carry + chunk
+            suffix = b""
+            if chunk:
+                end = self._safe_end(data)
+                data, self._carry = data[:end], data[end:]
+            else:
+                self._finished = True
+                suffix = b"</cde-archive>"
+            data = prefix + self.declaration.sub(b"", data) + suffix
+            if data:
+                return data
+        return b""
+
+
 class XmlReader(LxmlReader):
     """Reader for generic XML documents."""
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not fname.endswith(".xml"):
-            return False
-        return True
+    extensions = (".xml",)
+
+    #: The tag of the element that holds each document in a bulk archive read with :meth:`iterread`.
+    record_tag = None
 
     def _make_tree(self, fstring):
         root = etree.fromstring(
@@ -392,15 +513,53 @@ class XmlReader(LxmlReader):
         )
         return root
 
+    def iterread(self, f, record_tag=None):
+        """Read a bulk archive holding many documents, and yield a Document for each one in turn.
+
+        Bulk archives such as USPTO weekly grant files concatenate many complete XML documents, and bulk JATS dumps
+        hold many articles in one file. The archive is parsed incrementally, and each document is removed from the
+        tree once read, so memory use depends on the size of the largest document, not of the archive. Documents that
+        this reader cannot read are logged and skipped.
+
+        Usage::
+
+            for doc in UsptoXmlReader().iterread('ipg240102.xml'):
+                records = doc.records.serialize()
+
+        :param f: A binary file-like object or path to a file.
+        :type f: file or str
+        :param str record_tag: (Optional) The tag of the element that holds each document. Default :attr:`record_tag`.
+        :rtype: Iterator[chemdataextractor.doc.document.Document]
+        """
+        record_tag = record_tag or self.record_tag
+        if record_tag is None:
+            raise ReaderError("%s has no record tag" % self.__class__.__name__)
+        if isinstance(f, str):
+            with io.open(f, "rb") as fileobj:
+                for document in self.iterread(fileobj, record_tag=record_tag):
+                    yield document
+            return
+        # Match the record tag in any namespace, or none
+        tag = record_tag if record_tag.startswith("{") else "{*}" + record_tag
+        records = etree.iterparse(
+            _ArchiveStream(f), events=("end",), tag=tag, recover=True, huge_tree=True
+        )
+        for i, (_, el) in enumerate(records):
+            # Read a standalone copy, so cleaners and selectors only see this document
+            record = copy.deepcopy(el)
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+            try:
+                yield self._parse_tree(record)
+            except ReaderError:
+                log.warning("Skipping record %s: %s cannot read it" % (i, self.__class__.__name__))
+
 
 class HtmlReader(LxmlReader):
     """Reader for generic HTML documents."""
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        return True
+    extensions = (".html", ".htm")
 
     def _make_tree(self, fstring):
         root = etree.fromstring(
@@ -20,6 +20,7 @@ class NlmXmlReader(XmlReader):
     cleaners = [clean, tidy_nlm_references, space_labels]
 
     root_css = "article"
+    record_tag = "article"
     title_css = "front article-meta article-title"
     heading_css = "title"
     table_css = "table-wrap"
@@ -88,14 +89,9 @@ class NlmXmlReader(XmlReader):
         "{http://www.w3.org/1998/math/mathml}mn",
     }
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".xml") or fname.endswith(".nxml")):
-            return False
-        if b'xmlns="http://jats.nlm.nih.gov/ns/archiving' in fstring:
-            return True
-        if b"JATS-archivearticle1.dtd" in fstring:
-            return True
-        if b"-//NLM//DTD JATS" in fstring:
-            return True
-        return False
+    extensions = (".xml", ".nxml")
+    markers = (
+        b'xmlns="http://jats.nlm.nih.gov/ns/archiving',
+        b"JATS-archivearticle1.dtd",
+        b"-//NLM//DTD JATS",
+    )
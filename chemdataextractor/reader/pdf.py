@@ -9,6 +9,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 import io
+import logging
+import multiprocessing
 
 from pdfminer.converter import PDFPageAggregator
 from pdfminer.layout import LAParams, LTTextLine, LTTextBox, LTFigure
@@ -23,44 +25,112 @@ from .base import BaseReader
 from ..errors import ReaderError
 
 
+log = logging.getLogger(__name__)
+
+
+#: In a worker process started by :meth:`PdfReader.iterelements`, the reader, the pages of the PDF, and the
+#: interpreter and device used to analyse their layout.
+_worker_state = None
+
+
+def _init_worker(reader, fstring):
+    """Open the PDF whose pages are analysed in this worker process."""
+    global _worker_state
+    interpreter, device = reader._make_interpreter()
+    pages = list(PDFPage.create_pages(reader._open(fstring)))
+    _worker_state = (reader, pages, interpreter, device)
+
+
+def _page_layout(index):
+    """Return the LTPage layout of the page at the given index, in a worker process."""
+    reader, pages, interpreter, device = _worker_state
+    interpreter.process_page(pages[index])
+    return device.get_result()
+
+
 class PdfReader(BaseReader):
     """"""
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not fname.endswith(".pdf"):
-            return False
-        return True
+    extensions = (".pdf",)
 
-    def _process_layout(self, layout):
-        """Process an LTPage layout and return a list of elements."""
+    def __init__(self, workers=None, pages=None):
+        """
+        :param int workers: (Optional) Number of worker processes in which to analyse the layout of the pages.
+            Default None, to analyse them in this process.
+        :param pages: (Optional) The zero-based indices of the pages to read, e.g. ``range(10)``. Default None, to read
+            all pages.
+        :type pages: iterable[int]
+        """
+        super(PdfReader, self).__init__()
+        self.workers = workers
+        self.pages = pages
+
+    def _layout_texts(self, layout):
+        """Return the text of each element in an LTPage layout."""
         # Here we just group text into paragraphs
-        elements = []
+        texts = []
         for lt_obj in layout:
             if isinstance(lt_obj, LTTextBox) or isinstance(lt_obj, LTTextLine):
-                elements.append(Paragraph(lt_obj.get_text().strip()))
+                texts.append(lt_obj.get_text().strip())
             elif isinstance(lt_obj, LTFigure):
                 # Recursive...
-                elements.extend(self._process_layout(lt_obj))
-        return elements
+                texts.extend(self._layout_texts(lt_obj))
+        return texts
+
+    def _process_layout(self, layout):
+        """Process an LTPage layout and return a list of elements."""
+        return [Paragraph(text) for text in self._layout_texts(layout)]
+
+    def _open(self, fstring):
+        """Return the PDFDocument for the input. Raises ReaderError if text can not be extracted from it."""
+        document = PDFDocument(PDFParser(io.BytesIO(fstring)))
+        if not document.is_extractable:
+            raise ReaderError("PDF text extraction not allowed")
+        return document
+
+    def _make_interpreter(self):
+        """Return a page interpreter and the device that collects the layout of each page it processes."""
+        rsrcmgr = PDFResourceManager()
+        laparams = LAParams()
+        device = PDFPageAggregator(rsrcmgr, laparams=laparams)
+        return PDFPageInterpreter(rsrcmgr, device), device
 
     def parse(self, fstring):
+        return Document(*self.iterelements(fstring))
+
+    def iterelements(self, fstring):
+        """Parse the input and yield its elements, a page at a time. Raises ReaderError if the parse fails.
+
+        With :attr:`workers`, the layout of the pages is analysed in a pool of worker processes, and the elements are
+        still yielded in page order. The layouts are passed back to this process and turned into elements by
+        :meth:`_process_layout`, so the elements are the same as those read without workers.
+
+        :param bytes fstring: The contents of the PDF file.
+        :rtype: Iterator[chemdataextractor.doc.element.BaseElement]
+        """
         try:
-            f = io.BytesIO(fstring)
-            parser = PDFParser(f)
-            document = PDFDocument(parser)
-            if not document.is_extractable:
-                raise ReaderError("PDF text extraction not allowed")
-            rsrcmgr = PDFResourceManager()
-            laparams = LAParams()
-            device = PDFPageAggregator(rsrcmgr, laparams=laparams)
-            interpreter = PDFPageInterpreter(rsrcmgr, device)
-            elements = []
-            for page in PDFPage.create_pages(document):
-                interpreter.process_page(page)
-                layout = device.get_result()
-                elements.extend(self._process_layout(layout))
-            return Document(*elements)
+            pages = list(PDFPage.create_pages(self._open(fstring)))
+            indices = range(len(pages))
+            if self.pages is not None:
+                selected = set(self.pages)
+                indices = [i for i in indices if i in selected]
+            if self.workers is not None and self.workers > 1 and len(indices) > 1:
+                with multiprocessing.Pool(
+                    min(self.workers, len(indices)),
+                    initializer=_init_worker,
+                    initargs=(self, fstring),
+                ) as pool:
+                    for layout in pool.imap(_page_layout, indices):
+                        for element in self._process_layout(layout):
+                            yield element
+            else:
+                interpreter, device = self._make_interpreter()
+                for i in indices:
+                    interpreter.process_page(pages[i])
+                    for element in self._process_layout(device.get_result()):
+                        yield element
+        except ReaderError:
+            raise
         except Exception as e:
             raise ReaderError(e)
 
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+A registry of readers, which picks the readers to try for a file.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+from collections import Counter
+import logging
+import re
+
+from ..errors import ReaderError
+from .base import BaseReader
+from .markup import LxmlReader
+
+
+log = logging.getLogger(__name__)
+
+
+#: Number of bytes at the start of a file that are searched for reader markers.
+SNIFF_SIZE = 256 * 1024
+
+
+class ReaderRegistry(object):
+    """An ordered collection of readers.
+
+    Rather than each reader searching the whole file for its own markers, the registry searches the first
+    ``sniff_size`` bytes of the file once for the markers of all its readers. Readers whose markers are found are tried
+    first. If none of these can read the file, the rest of the file is searched for the markers that were not found,
+    before generic readers that accept any content are tried. Otherwise readers are tried in the order they were
+    registered.
+
+    Usage::
+
+        registry = ReaderRegistry([AcsHtmlReader(), HtmlReader()])
+        registry.register(RscHtmlReader(), index=1)
+        doc = registry.read(contents, fname='paper.html')
+
+    """
+
+    def __init__(self, readers=None, sniff_size=SNIFF_SIZE):
+        """
+        :param list[chemdataextractor.reader.base.BaseReader] readers: (Optional) The readers, in order of preference.
+        :param int sniff_size: (Optional) Number of bytes at the start of a file searched for reader markers.
+        """
+        self.readers = list(readers) if readers is not None else []
+        self.sniff_size = sniff_size
+
+    def register(self, reader, index=None):
+        """Add a reader to the registry.
+
+        :param chemdataextractor.reader.base.BaseReader reader: The reader.
+        :param int index: (Optional) The position of the reader in order of preference. Defaults to last.
+        """
+        if index is None:
+            self.readers.append(reader)
+        else:
+            self.readers.insert(index, reader)
+
+    def _marker_regex(self):
+        """Return a regex matching any marker of any reader that uses the default detect, or None if there are none."""
+        markers = set()
+        for reader in self.readers:
+            if type(reader).detect is BaseReader.detect and reader.markers:
+                markers.update(reader.markers)
+        if not markers:
+            return None
+        # Longest first, so a marker that starts with another is not hidden by it
+        return re.compile(b"|".join(re.escape(m) for m in sorted(markers, key=len, reverse=True)))
+
+    def sniff(self, fstring, fname=None):
+        """Return the readers that may be able to read a file, in the order they should be tried.
+
+        :param bytes fstring: The contents of the file.
+        :param str fname: (Optional) The filename. Used to help determine file format.
+        :rtype: list[chemdataextractor.reader.base.BaseReader]
+        """
+        found, unfound, others = self._sniff_prefix(fstring, fname=fname)
+        return found + self._search_rest(fstring, unfound) + others
+
+    def _sniff_prefix(self, fstring, fname=None):
+        """Sort the readers by whether their markers are found in the first ``sniff_size`` bytes of a file.
+
+        :returns: The readers whose markers are found, the readers whose markers may be in the rest of the file, and
+            the readers that accept any content or whose overridden detect accepts the file.
+        :rtype: (list[BaseReader], list[BaseReader], list[BaseReader])
+        """
+        prefix = fstring[: self.sniff_size]
+        regex = self._marker_regex()
+        found_markers = set(regex.findall(prefix)) if regex is not None else set()
+        found, unfound, others = [], [], []
+        for reader in self.readers:
+            if type(reader).detect is not BaseReader.detect:
+                # Readers that detect files in their own way are given the whole file
+                if reader.detect(fstring, fname=fname):
+                    others.append(reader)
+            elif not reader._accepts_fname(fname):
+                continue
+            elif reader.markers is None:
+                others.append(reader)
+            elif found_markers.intersection(reader.markers):
+                found.append(reader)
+            elif len(fstring) > len(prefix):
+                unfound.append(reader)
+        return found, unfound, others
+
+    def _search_rest(self, fstring, readers):
+        """Return the readers with any of their markers in the whole file. Used for markers that were not found near
+        the start of the file, such as those in page footers."""
+        return [
+            reader
+            for reader in readers
+            if any(marker in fstring for marker in reader.markers)
+        ]
+
+    def read(self, fstring, fname=None):
+        """Read a file with the first reader that succeeds, and return a Document.
+
+        Markup readers that make their trees the same way share a single parse of the file. The rest of a long file is
+        only searched for markers if none of the readers with markers near its start can read it.
+
+        :param bytes fstring: The contents of the file.
+        :param str fname: (Optional) The filename. Used to help determine file format.
+        :rtype: chemdataextractor.doc.document.Document
+        """
+        found, unfound, others = self._sniff_prefix(fstring, fname=fname)
+        tree_users = Counter(
+            type(reader)._make_tree
+            for reader in found + unfound + others
+            if isinstance(reader, LxmlReader)
+        )
+        trees = {}
+        for stage in (found, unfound, others):
+            if stage is unfound:
+                stage = self._search_rest(fstring, unfound)
+            for reader in stage:
+                try:
+                    if (
+                        isinstance(reader, LxmlReader)
+                        and tree_users[type(reader)._make_tree] > 1
+                    ):
+                        d = reader.parse(fstring, trees=trees)
+                    else:
+                        d = reader.readstring(fstring)
+                    log.debug("Parsed document with %s" % reader.__class__.__name__)
+                    return d
+                except ReaderError:
+                    pass
+        raise ReaderError("Unable to read document")
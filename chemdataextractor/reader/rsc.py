@@ -84,6 +84,12 @@ class RscHtmlReader(HtmlReader):
     figure_download_link_css = "img::attr(src)"
     ignore_css = '.table_caption + table, .left_head, sup span.sup_ref, small sup a, a[href^="#fn"], .PMedLink'
 
+    extensions = (".html", ".htm")
+    markers = (
+        b'meta name="citation_doi" content="10.1039',
+        b'meta content="Royal Society of Chemistry"',
+    )
+
     def _parse_table_footnotes(self, fns, refs, specials):
         """Override to account for awkward RSC table footnotes."""
         footnotes = []
@@ -94,14 +100,3 @@ class RscHtmlReader(HtmlReader):
             footnote += Footnote("", id=fn.getprevious().get("id"))
             footnotes.append(footnote)
         return footnotes
-
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        if (
-            b'meta name="citation_doi" content="10.1039' in fstring
-            or b'meta content="Royal Society of Chemistry"' in fstring
-        ):
-            return True
-        return False
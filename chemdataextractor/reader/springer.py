@@ -38,17 +38,11 @@ class SpringerMaterialsHtmlReader(HtmlReader):
     table_cell_css = "th, td"
     ignore_css = 'sub, sup, em[class^="EmphasisTypeItalic "], li[class="article-metrics__item"], div[class="CitationContent"]'
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        if (
-            b'<a class="footer-copyright_link" href="http://www.springernature.com"'
-            in fstring
-            or b'<meta content="SpringerLink"' in fstring
-        ):
-            return True
-        return False
+    extensions = (".html", ".htm")
+    markers = (
+        b'<a class="footer-copyright_link" href="http://www.springernature.com"',
+        b'<meta content="SpringerLink"',
+    )
 
     def _make_tree(self, fstring):
         root = etree.fromstring(
@@ -126,17 +120,11 @@ class SpringerHtmlReader(HtmlReader):
                   div[class="section section--collapsible uptodate-recommendations gtm-recommendations"], span[class="InlineEquation"], div[class="EquationContent"],\
                   div[class="EquationNumber"], footer'
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not (fname.endswith(".html") or fname.endswith(".htm")):
-            return False
-        if (
-            b'<meta content="Springer US" name="citation_publisher"' in fstring
-            or b'<meta content="SpringerLink"' in fstring
-        ):
-            print("springer HTML")
-            return True
-        return False
+    extensions = (".html", ".htm")
+    markers = (
+        b'<meta content="Springer US" name="citation_publisher"',
+        b'<meta content="SpringerLink"',
+    )
 
     def _make_tree(self, fstring):
         root = etree.fromstring(
@@ -49,13 +49,8 @@ class SpringerJatsReader(XmlReader):
 
     ignore_css = "tex-math, label, table"
 
-    def detect(self, fstring, fname=None):
-        """Springer document detection based on string found in xml"""
-        if fname and not fname.endswith(".xml"):
-            return False
-        if b'dtd-version="1.2"' in fstring:
-            return True
-        return False
+    extensions = (".xml",)
+    markers = (b'dtd-version="1.2"',)
 
     def _parse_metadata(self, el, refs, specials):
         title = self._css(self.metadata_title_css, el)
@@ -26,6 +26,7 @@ class UsptoXmlReader(XmlReader):
     cleaners = [clean]  # tidy_nlm_references, space_labels
 
     root_css = "us-patent-grant"  # TODO: Other roots
+    record_tag = "us-patent-grant"
     title_css = "invention-title"
     heading_css = 'heading, p[id^="h-"]'
     table_css = "table"
@@ -93,14 +94,9 @@ class UsptoXmlReader(XmlReader):
         "figref",
     }
 
-    def detect(self, fstring, fname=None):
-        """"""
-        if fname and not fname.lower().endswith(".xml"):
-            return False
-        if b"us-patent-grant" in fstring:
-            return True
-        # TODO: Other DTDs
-        return False
+    extensions = (".xml",)
+    # TODO: Other DTDs
+    markers = (b"us-patent-grant",)
 
     def _parse_table(self, el, refs, specials):
         hdict = {}
@@ -8,6 +8,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
+import collections
 import errno
 import functools
 import logging
@@ -43,6 +44,72 @@ def memoize(obj):
     return memoizer
 
 
+class LRUCache(object):
+    """
+    A mapping that holds at most ``max_size`` items, discarding the least recently used items first.
+    Lookups through :meth:`get` are counted as hits or misses.
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        :param int max_size: (Optional) The maximum number of items in the cache. Default 1024.
+        """
+        self.max_size = max_size
+        #: The number of lookups for which the key was found.
+        self.hits = 0
+        #: The number of lookups for which the key was not found.
+        self.misses = 0
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __setitem__(self, key, value):
+        if self.max_size <= 0:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return the value for the key, marking it as recently used, or the default if not found."""
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """Remove all items and reset the hit and miss counters."""
+        self._items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Statistics for this cache.
+
+        :returns: A dictionary containing the number of hits and misses, the hit rate,
+            and the number of entries in the cache.
+        :rtype: dict
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+            "entries": len(self._items),
+            "max_size": self.max_size,
+        }
+
+
 class Singleton(type):
     """Singleton metaclass."""
 
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+benchmark_readers
+~~~~~~~~~~~~~~~~~
+
+Measure the time taken by the document readers to read HTML and XML documents.
+
+Usage::
+
+    python scripts/benchmark_readers.py [FILE ...] [--repeat N]
+
+With no files, the HTML and XML test documents are used.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import argparse
+import collections
+import glob
+import logging
+import os
+import time
+
+from chemdataextractor import Document
+from chemdataextractor.reader import DEFAULT_READERS, ReaderRegistry
+
+log = logging.getLogger(__name__)
+
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "data")
+
+
+def load_files(paths):
+    """Return the name and contents of each readable document, with the name of the reader that reads it."""
+    registry = ReaderRegistry(DEFAULT_READERS)
+    files = []
+    for path in paths:
+        with open(path, "rb") as f:
+            fstring = f.read()
+        fname = os.path.basename(path)
+        try:
+            Document.from_string(fstring, fname=fname, readers=registry)
+        except Exception as e:
+            log.warning("Skipping %s: %s" % (path, e))
+            continue
+        reader = registry.sniff(fstring, fname=fname)[0]
+        files.append((fname, fstring, reader.__class__.__name__))
+    return files
+
+
+def benchmark(fname, fstring, repeat=3):
+    """Return the best time taken to read a document, over a number of repeats."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        Document.from_string(fstring, fname=fname)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the document readers.")
+    parser.add_argument("files", nargs="*", help="Documents to read.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats.")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(
+        glob.glob(os.path.join(TEST_DATA, "**", "*.html"), recursive=True)
+        + glob.glob(os.path.join(TEST_DATA, "**", "*.xml"), recursive=True)
+    )
+    files = load_files(paths)
+    print("%d documents" % len(files))
+
+    totals = collections.defaultdict(float)
+    counts = collections.Counter()
+    for fname, fstring, reader in files:
+        totals[reader] += benchmark(fname, fstring, repeat=args.repeat)
+        counts[reader] += 1
+    for reader in sorted(totals):
+        print(
+            "%-20s %4d documents %8.3f s %8.1f ms/document"
+            % (reader, counts[reader], totals[reader], 1000 * totals[reader] / counts[reader])
+        )
+    print("%-20s %4d documents %8.3f s" % ("total", len(files), sum(totals.values())))
+
+
+if __name__ == "__main__":
+    main()
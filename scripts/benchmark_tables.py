@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+benchmark_tables
+~~~~~~~~~~~~~~~~
+
+Measure the time taken to find the records of a table-heavy document, with the tables processed serially and
+in worker processes.
+
+Usage::
+
+    python scripts/benchmark_tables.py [FILE] [--copies N] [--workers N ...] [--repeat N]
+
+With no file, the Springer HTML table test document is used. The document is read a number of times and its
+elements concatenated, so that the benchmark document holds many tables.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import argparse
+import logging
+import os
+import time
+
+from chemdataextractor import Document
+from chemdataextractor.model.model import CurieTemperature, NeelTemperature
+from chemdataextractor.reader.springer import SpringerHtmlReader
+
+log = logging.getLogger(__name__)
+
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "data")
+
+
+def load_document(path, copies, table_workers=None):
+    """Return a Document holding the elements of the given document, repeated a number of times."""
+    elements = []
+    for _ in range(copies):
+        with open(path, "rb") as f:
+            elements.extend(Document.from_file(f, readers=[SpringerHtmlReader()]).elements)
+    doc = Document(*elements, table_workers=table_workers)
+    doc.models = [CurieTemperature, NeelTemperature]
+    return doc
+
+
+def benchmark(path, copies, table_workers, repeat=3):
+    """Return the best time taken to find the records of the document, over a number of repeats, and the records."""
+    best = None
+    records = None
+    for _ in range(repeat):
+        doc = load_document(path, copies, table_workers=table_workers)
+        start = time.perf_counter()
+        records = doc.records.serialize()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark finding the records of table-heavy documents.")
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default=os.path.join(TEST_DATA, "tables", "table_test.html"),
+        help="Springer HTML document to take tables from.",
+    )
+    parser.add_argument("--copies", type=int, default=20, help="Number of copies of the document.")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[2, 4], help="Numbers of table worker processes."
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats.")
+    args = parser.parse_args()
+
+    doc = load_document(args.file, args.copies)
+    print("%d elements, %d tables" % (len(doc.elements), len(doc.tables)))
+
+    serial, expected = benchmark(args.file, args.copies, None, repeat=args.repeat)
+    print("%-12s %8.3f s" % ("serial", serial))
+    for workers in args.workers:
+        elapsed, records = benchmark(args.file, args.copies, workers, repeat=args.repeat)
+        print(
+            "%-12s %8.3f s %6.2fx%s"
+            % (
+                "%d workers" % workers,
+                elapsed,
+                serial / elapsed,
+                "" if records == expected else "  (records differ)",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
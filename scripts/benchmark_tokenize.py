@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+benchmark_tokenize
+~~~~~~~~~~~~~~~~~~
+
+Measure the throughput of the word tokenizers.
+
+Usage::
+
+    python scripts/benchmark_tokenize.py [FILE ...] [--repeat N]
+
+With no files, the sentences in the HTML and XML test documents are used.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import argparse
+import glob
+import logging
+import os
+import time
+
+from chemdataextractor import Document
+from chemdataextractor.nlp.tokenize import (
+    WordTokenizer,
+    ChemWordTokenizer,
+    FineWordTokenizer,
+)
+
+log = logging.getLogger(__name__)
+
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "data")
+
+
+def load_sentences(paths):
+    """Return the text of every sentence in the given documents."""
+    sentences = []
+    for path in paths:
+        try:
+            doc = Document.from_file(path)
+        except Exception as e:
+            log.warning("Skipping %s: %s" % (path, e))
+            continue
+        sentences.extend(sentence.text for sentence in doc.sentences)
+    return sentences
+
+
+def benchmark(tokenizer, sentences, repeat=3):
+    """Return the best time taken to tokenize all of the sentences, over a number of repeats."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sentence in sentences:
+            tokenizer.span_tokenize(sentence)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the word tokenizers.")
+    parser.add_argument("files", nargs="*", help="Documents to take sentences from.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of repeats.")
+    args = parser.parse_args()
+
+    paths = args.files or sorted(
+        glob.glob(os.path.join(TEST_DATA, "**", "*.html"), recursive=True)
+        + glob.glob(os.path.join(TEST_DATA, "**", "*.xml"), recursive=True)
+    )
+    sentences = load_sentences(paths)
+    num_chars = sum(len(sentence) for sentence in sentences)
+    print("%d sentences, %d characters" % (len(sentences), num_chars))
+
+    for tokenizer in [WordTokenizer(), ChemWordTokenizer(), FineWordTokenizer()]:
+        elapsed = benchmark(tokenizer, sentences, repeat=args.repeat)
+        print(
+            "%-20s %8.3f s %10.0f sentences/s %12.0f chars/s"
+            % (
+                tokenizer.__class__.__name__,
+                elapsed,
+                len(sentences) / elapsed,
+                num_chars / elapsed,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 test_doc_cache
 ~~~~~~~~~~~~~~~~~
 
-Test the Document caching using the PlainTextCacher class.
+Test the Document caching using the PlainTextCacher and BinaryCacher classes.
 
 """
 
@@ -13,17 +13,67 @@ from __future__ import print_function
 from __future__ import unicode_literals
 import logging
 import os
+import shutil
+import tempfile
 import unittest
 
+from chemdataextractor.doc.cache_store import SqliteCacheStore
 from chemdataextractor.doc.document import Document
-from chemdataextractor.doc.document_cacher import PlainTextCacher
+from chemdataextractor.doc.document_cacher import BinaryCacher, PlainTextCacher
+from chemdataextractor.doc.text import Sentence
 from chemdataextractor.model import Compound
+from chemdataextractor.nlp.dependency import IndexTagger
+from chemdataextractor.nlp.tag import BaseTagger
+from chemdataextractor.nlp.tokenize import WordTokenizer
 
 
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
 
+class CountingTagger(BaseTagger):
+    """Tags numbers as CD and other tokens as NN, counting the tokens tagged."""
+    tag_type = 'pos_tag'
+    tagged = 0
+
+    def tag(self, tokens):
+        CountingTagger.tagged += len(tokens)
+        return [(token, 'CD' if token.text[0].isdigit() else 'NN') for token in tokens]
+
+
+class NoneTagger(BaseTagger):
+    """Tags every token with None."""
+    tag_type = 'ner_tag'
+
+    def tag(self, tokens):
+        return [(token, None) for token in tokens]
+
+
+class CommaSubsentenceExtractor(object):
+    """Splits sentences into subsentences at commas."""
+
+    def subsentences(self, sentence):
+        subsentences = [[]]
+        for token in sentence.tokens:
+            if token.text == ',':
+                subsentences.append([])
+            else:
+                subsentences[-1].append(token)
+        return subsentences
+
+
+def make_document():
+    texts = ['The melting point is 120 °C, the boiling point is 300 °C.', 'Naïve text, here.', '']
+    return Document(*[
+        Sentence(
+            text,
+            word_tokenizer=WordTokenizer(),
+            taggers=[CountingTagger(), NoneTagger(), IndexTagger()],
+            subsentence_extractor=CommaSubsentenceExtractor(),
+        ) for text in texts
+    ])
+
+
 class TestDocument(unittest.TestCase):
     def test_caching(self):
         fname = '10.1039_C6OB02074G.html'
@@ -50,3 +100,85 @@ class TestDocument(unittest.TestCase):
                 self.assertEqual(token1.pos_tag, token2.pos_tag)
 
         self.assertCountEqual(doc.records.serialize(), cached_document.records.serialize())
+
+
+class TestBinaryCacher(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_location = tempfile.mkdtemp()
+        self.cacher = BinaryCacher(self.cache_location)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_location)
+
+    def assertSameSentences(self, doc, cached_document):
+        self.assertEqual(len(doc.sentences), len(cached_document.sentences))
+        for sentence1, sentence2 in zip(doc.sentences, cached_document.sentences):
+            self.assertEqual(len(sentence1.tokens), len(sentence2.tokens))
+            for token1, token2 in zip(sentence1.tokens, sentence2.tokens):
+                self.assertEqual(token1.text, token2.text)
+                self.assertEqual(token1.start, token2.start)
+                self.assertEqual(token1.end, token2.end)
+                self.assertEqual(token1.ner_tag, token2.ner_tag)
+                self.assertEqual(token1.pos_tag, token2.pos_tag)
+                self.assertIs(token2.sentence, sentence2)
+            self.assertEqual(
+                [s.text for s in sentence1.subsentences],
+                [s.text for s in sentence2.subsentences]
+            )
+
+    def test_caching(self):
+        """Test hydrated documents have the same tokens, spans, tags and subsentences, read when first used."""
+        doc = make_document()
+        self.cacher.cache_document(doc, 'test/cache.1')
+        self.assertEqual(os.listdir(self.cache_location), ['test😅cache🔥1.cdedoc'])
+
+        cached_document = self.cacher.hydrate_document(make_document(), 'test/cache.1')
+        sentence = cached_document.sentences[0]
+        self.assertFalse(hasattr(sentence, '_tokens'))
+        CountingTagger.tagged = 0
+        self.assertEqual(sentence.tokens[4].pos_tag, 'CD')
+        self.assertEqual(CountingTagger.tagged, 0)
+        self.assertEqual([s.tokens[0] for s in sentence.subsentences], [sentence.tokens[0], sentence.tokens[8]])
+        self.assertSameSentences(doc, cached_document)
+        self.assertEqual(CountingTagger.tagged, 0)
+
+    def test_caching_without_subsentences(self):
+        """Test subsentences are found again if they were not cached."""
+        doc = make_document()
+        self.cacher.cache_document(doc, 'test_cache', tags=['pos_tag'], save_subsentences=False)
+        cached_document = self.cacher.hydrate_document(make_document(), 'test_cache')
+        self.assertSameSentences(doc, cached_document)
+        with self.assertRaises(AttributeError):
+            self.cacher.hydrate_document(make_document(), 'test_cache', tags=['ner_tag'])
+
+    def test_cache_errors(self):
+        """Test documents are not overwritten or hydrated from a cache that does not match."""
+        self.cacher.cache_document(make_document(), 'test_cache')
+        with self.assertRaises(AttributeError):
+            self.cacher.cache_document(make_document(), 'test_cache')
+        self.cacher.cache_document(make_document(), 'test_cache', overwrite_cache=True)
+        with self.assertRaises(AttributeError):
+            self.cacher.hydrate_document(make_document(), 'other_cache')
+        with self.assertRaises(AttributeError):
+            self.cacher.hydrate_document(Document(*make_document().sentences[:2]), 'test_cache')
+
+    def test_plain_text_cache(self):
+        """Test documents cached by the PlainTextCacher can still be hydrated."""
+        doc = make_document()
+        PlainTextCacher(self.cache_location).cache_document(doc, 'test_cache')
+        cached_document = self.cacher.hydrate_document(make_document(), 'test_cache')
+        self.assertSameSentences(doc, cached_document)
+
+    def test_store(self):
+        """Test documents can be cached in batches in a store."""
+        cacher = BinaryCacher(store=SqliteCacheStore(os.path.join(self.cache_location, 'store'), shards=2))
+        docs = [make_document(), make_document()]
+        cacher.cache_documents(docs, ['doc1', 'doc2'], tags=['pos_tag'])
+        with self.assertRaises(AttributeError):
+            cacher.cache_document(make_document(), 'doc2')
+        cached_documents = cacher.hydrate_documents([make_document(), make_document()], ['doc1', 'doc2'])
+        for doc, cached_document in zip(docs, cached_documents):
+            self.assertSameSentences(doc, cached_document)
+        with self.assertRaises(AttributeError):
+            cacher.hydrate_document(make_document(), 'doc3')
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+test_doc_cache_store
+~~~~~~~~~~~~~~~~~~~~
+
+Test the key-value stores for document caches.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+
+from chemdataextractor.doc.cache_store import SqliteCacheStore
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+def _write_entries(args):
+    store, worker = args
+    store.set_many([('worker%d-%d' % (worker, i), b'x' * i) for i in range(50)])
+    return len(store.get_many(['worker%d-%d' % (worker, i) for i in range(50)]))
+
+
+class TestSqliteCacheStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_single_file(self):
+        """Test a store with a single shard keeps its entries in one file."""
+        path = os.path.join(self.directory, 'cache.sqlite')
+        store = SqliteCacheStore(path)
+        store.set('a', b'first')
+        store.set_many([('b', b'second'), ('a', b'replaced')])
+        self.assertEqual(store.get('a'), b'replaced')
+        self.assertEqual(store.get_many(['b', 'c', 'a']), [b'second', None, b'replaced'])
+        self.assertIn('b', store)
+        self.assertNotIn('c', store)
+        store.delete('b')
+        self.assertEqual(store.keys(), ['a'])
+        store.close()
+        self.assertTrue(os.path.isfile(path))
+        self.assertEqual(SqliteCacheStore.open(path).get('a'), b'replaced')
+
+    def test_shards(self):
+        """Test keys are spread across the shards, and the number of shards is found again when opened."""
+        path = os.path.join(self.directory, 'cache')
+        store = SqliteCacheStore(path, shards=4)
+        items = [('key%d' % i, b'%d' % i) for i in range(200)]
+        store.set_many(items)
+        self.assertEqual(len([f for f in os.listdir(path) if f.endswith('.sqlite')]), 4)
+        for shard in store.shards:
+            self.assertGreater(shard.size(), 0)
+        store = SqliteCacheStore.open(path)
+        self.assertEqual(len(store.shards), 4)
+        self.assertEqual(store.get_many([key for key, _ in items]), [value for _, value in items])
+        self.assertEqual(store.stats()['entries'], 200)
+
+    def test_prune(self):
+        """Test the least recently used entries are removed first."""
+        store = SqliteCacheStore(os.path.join(self.directory, 'cache.sqlite'))
+        store.set_many([('old', b'x' * 100), ('new', b'x' * 100)])
+        connection = store.shards[0].connection
+        connection.execute('UPDATE entries SET last_used = ? WHERE key = ?', (time.time() - 86400, 'old'))
+        connection.commit()
+        self.assertEqual(store.prune(max_age=3600), 1)
+        self.assertEqual(store.keys(), ['new'])
+        store.set('newer', b'x' * 100)
+        store.get('new')
+        self.assertEqual(store.prune(max_size=150), 1)
+        self.assertEqual(store.keys(), ['new'])
+        store.compact()
+        self.assertEqual(store.stats()['size'], 100)
+
+    def test_eviction(self):
+        """Test entries are evicted when the store is over its maximum size."""
+        store = SqliteCacheStore(os.path.join(self.directory, 'cache'), max_size=1000, shards=2)
+        for i in range(30):
+            store.set('key%d' % i, b'x' * 100)
+        self.assertLessEqual(store.stats()['size'], 1000 + 100)
+        self.assertIsNotNone(store.get('key29'))
+
+    def test_processes(self):
+        """Test worker processes can share a store."""
+        store = SqliteCacheStore(os.path.join(self.directory, 'cache'), shards=2)
+        store.set('a', b'first')
+        self.assertEqual(pickle.loads(pickle.dumps(store)).get('a'), b'first')
+        with multiprocessing.Pool(4) as pool:
+            self.assertEqual(pool.map(_write_entries, [(store, i) for i in range(4)]), [50] * 4)
+        self.assertEqual(store.stats()['entries'], 201)
+
+
+if __name__ == '__main__':
+    unittest.main()
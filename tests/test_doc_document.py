@@ -12,15 +12,29 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 import logging
+import multiprocessing
 import unittest
 
+from chemdataextractor.doc import Caption, Paragraph, Table
+from chemdataextractor.doc import document
 from chemdataextractor.doc.document import Document
+from chemdataextractor.model.base import ModelType, StringType
+from chemdataextractor.model.model import Compound
+from chemdataextractor.model.units.temperature import TemperatureModel
 from chemdataextractor.nlp.tag import BaseTagger
+from chemdataextractor.parse.actions import join
+from chemdataextractor.parse.elements import I
 
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
 
+class ExampleTemperature(TemperatureModel):
+    specifier = StringType(parse_expression=(I('Curie') + I('temperature')).add_action(join), required=True,
+                           contextual=False, updatable=True)
+    compound = ModelType(Compound, required=False, contextual=True)
+
+
 class TestDocument(unittest.TestCase):
     """Simple Document instantiation tests."""
 
@@ -117,6 +131,72 @@ class TestDocument(unittest.TestCase):
                 for index, token in enumerate(sentence.tokens):
                     self.assertEqual("TEST_BATCH" + token.pos_tag, token.test_tag)
 
+    def test_table_workers(self):
+        """Test the records of tables found in worker processes are the same as those found serially."""
+        def records(table_workers):
+            d = Document(
+                Paragraph('Here we define the Curie temperature (TC).'),
+                Table(Caption('Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Fe', '100'], ['Co', '300']]),
+                Table(Caption('More Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Ni', '400']]),
+                Table(Caption('Yet more Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Gd', '290']]),
+                models=[ExampleTemperature],
+                table_workers=table_workers,
+            )
+            return d.records.serialize()
+
+        serial = records(None)
+        self.assertEqual(len([r for r in serial if 'ExampleTemperature' in r]), 4)
+        self.assertEqual(records(2), serial)
+
+    def test_table_worker_updates(self):
+        """Test a table worker only updates the models for the elements since the last table it processed, unless the
+        tables come out of order."""
+        d = Document(
+            Paragraph('Here we define the Curie temperature (TC).'),
+            Table(Caption('Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Fe', '100'], ['Co', '300']]),
+            Paragraph('Some more text.'),
+            Table(Caption('More Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Ni', '400']]),
+            models=[ExampleTemperature],
+        )
+        updated_elements = []
+        update_models_for_element = d._update_models_for_element
+
+        def record_update(el):
+            updated_elements.append(d.elements.index(el))
+            update_models_for_element(el)
+
+        d._update_models_for_element = record_update
+        try:
+            document._init_table_worker(d)
+            records = [document._find_table_records(1).serialize(), document._find_table_records(3).serialize()]
+            self.assertEqual(updated_elements, [0, 1, 2, 3])
+            del updated_elements[:]
+            self.assertEqual(document._find_table_records(1).serialize(), records[0])
+            self.assertEqual(updated_elements, [0, 1])
+        finally:
+            document._table_worker_document = None
+            document._table_worker_state = None
+            document._table_worker_position = 0
+            ExampleTemperature.reset_updatables()
+
+    def test_table_workers_error(self):
+        """Test the worker processes are stopped if finding the records of an element fails."""
+        class BrokenParagraph(Paragraph):
+            @property
+            def records(self):
+                raise ValueError('Broken paragraph')
+
+        d = Document(
+            BrokenParagraph('Here we define the Curie temperature (TC).'),
+            Table(Caption('Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Fe', '100'], ['Co', '300']]),
+            Table(Caption('More Curie temperatures.'), table_data=[['Compound', 'TC (K)'], ['Ni', '400']]),
+            models=[ExampleTemperature],
+            table_workers=2,
+        )
+        with self.assertRaises(ValueError):
+            d.records
+        self.assertEqual(multiprocessing.active_children(), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+test_doc_reextract
+~~~~~~~~~~~~~~~~~~
+
+Test incremental re-extraction of records when models change.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from chemdataextractor.doc import BinaryCacher, Document, Paragraph, SqliteCacheStore
+from chemdataextractor.doc.reextract import RecordCache, Reextractor, model_fingerprint
+from chemdataextractor.model.base import BaseModel, StringType
+from chemdataextractor.nlp.subsentence import NoneSubsentenceExtractor
+from chemdataextractor.nlp.tag import BaseTagger
+from chemdataextractor.nlp.tokenize import WordTokenizer
+from chemdataextractor.parse import I, R
+from chemdataextractor.parse.base import BaseSentenceParser
+from chemdataextractor.parse.parse_cache import ParseCache
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class CountingPosTagger(BaseTagger):
+    """Tags numbers as CD and other tokens as NN, counting the tokens tagged."""
+    tag_type = 'pos_tag'
+    tagged = 0
+
+    def tag(self, tokens):
+        CountingPosTagger.tagged += len(tokens)
+        return [(token, 'CD' if token.text.isdigit() else 'NN') for token in tokens]
+
+
+class NerTagger(BaseTagger):
+    tag_type = 'ner_tag'
+
+    def tag(self, tokens):
+        return [(token, 'O') for token in tokens]
+
+
+def make_model(specifier):
+    """A model with a parser for the given specifier followed by a number."""
+
+    class SpecifierParser(BaseSentenceParser):
+        root = (I(specifier) + R(r'^\d+$')('value'))('property')
+
+        def interpret(self, result, start, end):
+            yield self.model(specifier=specifier, value=result.xpath('./value/text()')[0])
+
+    class Property(BaseModel):
+        specifier = StringType()
+        value = StringType()
+        parsers = [SpecifierParser()]
+
+    Property.__name__ = specifier.capitalize()
+    return Property
+
+
+def make_document():
+    texts = ['The bp 120 here. The mp 80 there.', 'No properties.']
+    return Document(*[
+        Paragraph(
+            text,
+            word_tokenizer=WordTokenizer(),
+            taggers=[CountingPosTagger(), NerTagger()],
+            subsentence_extractor=NoneSubsentenceExtractor(),
+        ) for text in texts
+    ])
+
+
+class TestReextractor(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.record_cache = RecordCache(SqliteCacheStore(os.path.join(self.directory, 'records.sqlite')))
+        self.document_cacher = BinaryCacher(store=SqliteCacheStore(os.path.join(self.directory, 'documents.sqlite')))
+        self.parse_cache = ParseCache(os.path.join(self.directory, 'parse_cache.sqlite'))
+
+    def tearDown(self):
+        self.record_cache.close()
+        self.parse_cache.close()
+        shutil.rmtree(self.directory)
+
+    def make_reextractor(self, models):
+        return Reextractor(
+            models,
+            self.record_cache,
+            document_cacher=self.document_cacher,
+            parse_cache=self.parse_cache,
+        )
+
+    def test_reextract(self):
+        """Test only new and changed models are run, on hydrated tokens and tags, and their records are merged."""
+        bp = make_model('bp')
+        CountingPosTagger.tagged = 0
+        records, report = self.make_reextractor([bp]).reextract(make_document(), 'doc')
+        self.assertEqual(records, [{'Bp': {'specifier': 'bp', 'value': '120'}}])
+        self.assertEqual(report['document_cache'], 'miss')
+        self.assertEqual(report['extracted'], ['Bp'])
+        self.assertEqual(report['reused'], [])
+        tagged = CountingPosTagger.tagged
+        self.assertGreater(tagged, 0)
+
+        # Nothing has changed, so the document isn't even read
+        records, report = self.make_reextractor([bp]).reextract(self.fail, 'doc')
+        self.assertEqual(records, [{'Bp': {'specifier': 'bp', 'value': '120'}}])
+        self.assertEqual(report['document_cache'], None)
+        self.assertEqual(report['reused'], ['Bp'])
+        self.assertEqual(report['extracted'], [])
+
+        # A new model is run on the cached tokens and tags
+        records, report = self.make_reextractor([make_model('mp'), make_model('bp')]).reextract(make_document, 'doc')
+        self.assertEqual(records, [
+            {'Mp': {'specifier': 'mp', 'value': '80'}},
+            {'Bp': {'specifier': 'bp', 'value': '120'}},
+        ])
+        self.assertEqual(report['document_cache'], 'hit')
+        self.assertEqual(report['reused'], ['Bp'])
+        self.assertEqual(report['extracted'], ['Mp'])
+        self.assertEqual(report['parse_cache']['misses'], 3)
+        self.assertEqual(CountingPosTagger.tagged, tagged)
+
+        # A changed model is run again, and the records of removed models are dropped
+        changed_mp = make_model('mp')
+        changed_mp.parsers[0].root = (I('mp') + R(r'^\d+$')('value') + I('there'))('property')
+        records, report = self.make_reextractor([changed_mp]).reextract(make_document, 'doc')
+        self.assertEqual(records, [{'Mp': {'specifier': 'mp', 'value': '80'}}])
+        self.assertEqual(report['extracted'], ['Mp'])
+        self.assertEqual(self.record_cache.get('doc')[0], {'Mp': model_fingerprint(changed_mp)})
+
+    def test_model_fingerprint(self):
+        """Test model fingerprints depend on the fields and parsers of the model, but not on the class object."""
+        self.assertEqual(model_fingerprint(make_model('bp')), model_fingerprint(make_model('bp')))
+        self.assertNotEqual(model_fingerprint(make_model('bp')), model_fingerprint(make_model('mp')))
+        changed = make_model('bp')
+        changed.value.required = True
+        self.assertNotEqual(model_fingerprint(make_model('bp')), model_fingerprint(changed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+test_doc_serializer
+~~~~~~~~~~~~~~~~~~~
+
+Test the binary serialization of documents.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import os
+import unittest
+
+from chemdataextractor.doc import Caption, Document, Figure, Heading, Paragraph, Sentence, Table, Title
+from chemdataextractor.doc.meta import MetaData
+from chemdataextractor.doc.text import Cell
+from chemdataextractor.errors import ReaderError
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+def describe(element):
+    """The content of an element that should survive serialization."""
+    description = [element.__class__.__name__, element.id, element.references]
+    if isinstance(element, (Figure, Table)):
+        description.extend([describe(element.caption), element.label])
+        if isinstance(element, Figure):
+            description.append(element.links)
+        else:
+            description.append(element.table_data)
+            description.append({
+                key: [[describe(cell) for cell in row] for row in value] if isinstance(value, list) else value
+                for key, value in element._tde_kwargs.items()
+            })
+    elif isinstance(element, MetaData):
+        description.append(element.data)
+    else:
+        description.append(element.text)
+        if isinstance(element, Sentence):
+            description.extend([element.start, element.end])
+    return description
+
+
+class TestDocumentSerializer(unittest.TestCase):
+
+    maxDiff = None
+
+    def assertRoundTrip(self, doc, **kwargs):
+        data = doc.to_bytes(**kwargs)
+        loaded = Document.from_bytes(data)
+        self.assertEqual([describe(el) for el in loaded.elements], [describe(el) for el in doc.elements])
+        for element in loaded.elements:
+            self.assertIs(element.document, loaded)
+        return loaded
+
+    def test_round_trip(self):
+        """Test each type of element is created again with its content, id and references."""
+        doc = Document(
+            MetaData({'_title': 'A paper', '_authors': ['A. Author', 'B. Author'], '_doi': '10.1039/test'}),
+            Title('A paper'),
+            Heading('Results', id='s1'),
+            Paragraph('The mp of 1 is 120 °C, see Table 1.', id='p1', references=['tab1', 'ref2']),
+            Sentence('A sentence.', start=4, end=15),
+            Figure(Caption('Fig. 1 Structure of 1.', references=['ref3']), label='1', links=['fig1.png'], id='fig1'),
+            Table(Caption('Table 1 Melting points'), label='1', table_data=[['Compound', 'mp'], ['1', '120']], id='tab1'),
+        )
+        loaded = self.assertRoundTrip(doc)
+        self.assertEqual(loaded.metadata.title, 'A paper')
+        self.assertRoundTrip(doc, compression_level=0)
+
+    def test_table_elements(self):
+        """Test elements passed on to TableDataExtractor, as by the USPTO reader, are kept."""
+        doc = Document(Table(Caption(''), headings=[[Cell('Compound'), Cell('mp')]], rows=[[Cell('1'), Cell('120')]]))
+        self.assertRoundTrip(doc)
+
+    def test_html(self):
+        """Test a document read from HTML is the same after serialization."""
+        fname = '10.1039_C6OB02074G.html'
+        with open(os.path.join(os.path.dirname(__file__), 'data', 'rsc', fname), 'rb') as f:
+            doc = Document.from_file(f, fname=fname)
+        data = doc.to_bytes()
+        self.assertLess(len(data), len(doc.to_bytes(compression_level=0)))
+        loaded = self.assertRoundTrip(doc)
+        self.assertEqual(loaded.serialize(), doc.serialize())
+        self.assertEqual(len(loaded.tables), len(doc.tables))
+
+    def test_errors(self):
+        """Test invalid data and unknown elements are rejected."""
+        class CustomParagraph(Paragraph):
+            pass
+
+        with self.assertRaises(ReaderError):
+            Document.from_bytes(b'<html></html>')
+        data = Document(Paragraph('Text')).to_bytes()
+        with self.assertRaises(ReaderError):
+            Document.from_bytes(data[:6] + b'\xff\xff' + data[8:])
+        with self.assertRaises(TypeError):
+            Document(CustomParagraph('Text')).to_bytes()
+
+
+if __name__ == '__main__':
+    unittest.main()
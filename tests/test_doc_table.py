@@ -5,18 +5,21 @@ Test the Table Document element and simple Table autoparsers.
 """
 
 from chemdataextractor.model.units.quantity_model import DimensionlessModel
-from chemdataextractor.parse.elements import R, I, Optional, Group, Every, Not
-from chemdataextractor.model.base import StringType, ModelType
+from chemdataextractor.parse.elements import R, I, T, Optional, Group, Every, Not
+from chemdataextractor.model.base import BaseModel, StringType, ModelType
 from chemdataextractor.model.model import Compound
 from chemdataextractor.parse.cem import CompoundParser, CompoundHeadingParser, ChemicalLabelParser, CompoundTableParser
 from chemdataextractor.doc.table import Table
-from chemdataextractor.doc import Caption
+from chemdataextractor.doc.text import Cell, Sentence
+from chemdataextractor.doc import Caption, Paragraph
 from chemdataextractor.doc import Document
 from chemdataextractor.reader.elsevier import ElsevierXmlReader
 from chemdataextractor.reader.springer import SpringerHtmlReader
 from chemdataextractor.model.units.length import LengthModel
 from chemdataextractor.model.units.temperature import TemperatureModel
 from chemdataextractor.parse.actions import merge
+from chemdataextractor.parse.base import BaseTableParser
+from chemdataextractor.nlp.tag import BaseTagger
 
 import logging
 import unittest
@@ -433,6 +436,148 @@ class TestTable(unittest.TestCase):
         self.assertCountEqual(expected, result)
         Compound.parsers = [CompoundParser(), CompoundHeadingParser(), ChemicalLabelParser(), CompoundTableParser()]
 
+    def test_cell_sentences_shared(self):
+        """Each distinct text in a table is tokenized and tagged once, however many cells it is in."""
+        tagged = []
+
+        class UpperTagger(BaseTagger):
+            tag_type = "upper_tag"
+
+            def batch_tag(self, sents):
+                tagged.extend(tuple(token.text for token in sent) for sent in sents)
+                return [[(token, token.text.upper()) for token in sent] for sent in sents]
+
+        Cell.taggers = Sentence.taggers + [UpperTagger()]
+        try:
+            table = Table(caption=Caption("Example table."),
+                          table_data=[["Compound", "Tc (K)", "Tn (K)"], ["Fe", "100", "200"], ["Co", "300", "400"]])
+            Document(table)
+            cells = [cell for cde_tables in table.cde_tables for cde_table in cde_tables for cell in cde_table]
+            for cell in cells:
+                self.assertEqual([token.upper_tag for token in cell.tokens],
+                                 [token.text.upper() for token in cell.tokens])
+                self.assertTrue(all(token.sentence is cell for token in cell.tokens))
+        finally:
+            del Cell.taggers
+        self.assertEqual(len(tagged), len(set(tagged)))
+        self.assertIn(("Tc", "(", "K", ")"), tagged)
+        first, second = cells[0], cells[2]
+        self.assertEqual(first.col_categories, second.col_categories)
+        self.assertIs(first.col_categories_sents[0], second.col_categories_sents[0])
+        self.assertEqual([(token.text, token.start, token.end) for token in first.tokens[-4:]],
+                         [("Tc", 17, 19), ("(", 20, 21), ("K", 21, 22), (")", 22, 23)])
+
+
+    def test_trigger_phrase_prefilter(self):
+        """Cells that do not contain the trigger phrase of a parser are not parsed by it."""
+        parsed = []
+
+        class HeaderParser(BaseTableParser):
+            trigger_phrase = I('Tc')
+            root = I('Tc')('specifier')
+
+            def parse_cell(self, cell):
+                parsed.append(cell.data)
+                return super(HeaderParser, self).parse_cell(cell)
+
+            def interpret(self, result, start, end):
+                yield self.model(specifier=result.text)
+
+        class Header(BaseModel):
+            specifier = StringType()
+            parsers = [HeaderParser()]
+
+        table = Table(caption=Caption(""),
+                      table_data=[["Compound", "Tc (K)", "Tn (K)"], ["Fe", "100", "200"], ["Co", "300", "400"]],
+                      models=[Header])
+        records = table.records
+        self.assertEqual(parsed, ["100", "300"])
+        self.assertEqual([record.serialize() for record in records], [{'Header': {'specifier': 'Tc'}}])
+
+    def test_consolidate_skips_conflicting_records(self):
+        """Records whose values conflict are never compared, but compatible records are still merged."""
+        class Header(BaseModel):
+            specifier = StringType()
+            value = StringType()
+            units = StringType()
+
+        table = Table(caption=Caption(""), models=[Header])
+        records = [Header(specifier='Tc', value='100'),
+                   Header(specifier='Tc', value='200', units='K'),
+                   Header(specifier='Tc', value='100', units='K'),
+                   Header(specifier='Tc', units='K')]
+        self.assertEqual(table._merge_candidates(records), [[2, 3], [3], [0, 3], None])
+        table._consolidate(records)
+        self.assertEqual([record.serialize() for record in records],
+                         [{'Header': {'specifier': 'Tc', 'value': '100', 'units': 'K'}},
+                          {'Header': {'specifier': 'Tc', 'value': '200', 'units': 'K'}},
+                          {'Header': {'specifier': 'Tc', 'value': '100', 'units': 'K'}},
+                          {'Header': {'specifier': 'Tc', 'units': 'K'}}])
+
+    def test_lazy_tde_analysis(self):
+        """The table is only analysed when its records are requested, and not at all if no model could match it."""
+        class Tc(TemperatureModel):
+            specifier = StringType(parse_expression=I('Tc'), required=True, contextual=False)
+            compound = ModelType(Compound, required=False, contextual=True)
+
+        table_data = [["Compound", "Tc (K)"], ["Fe", "100"], ["Co", "300"]]
+        table = Table(caption=Caption("Curie temperatures."), table_data=table_data, models=[Tc])
+        self.assertNotIn('_tde_table', table.__dict__)
+        self.assertEqual(len([record for record in table.records if isinstance(record, Tc)]), 2)
+        self.assertIn('_tde_table', table.__dict__)
+
+        table_data = [["Compound", "Tn (K)"], ["Fe", "100"], ["Co", "300"]]
+        table = Table(caption=Caption("Néel temperatures."), table_data=table_data, models=[Tc])
+        self.assertEqual(len(table.records), 0)
+        self.assertEqual(table.elements, [table.caption])
+        self.assertNotIn('_tde_table', table.__dict__)
+
+    def test_lazy_tde_analysis_in_document(self):
+        """A table in a document is not analysed if no model could match it, when the records of the document are found."""
+        class Tc(TemperatureModel):
+            specifier = StringType(parse_expression=I('Tc'), required=True, contextual=False)
+            compound = ModelType(Compound, required=False, contextual=True)
+
+        skipped = Table(caption=Caption("Colours."), table_data=[["Name", "Colour"], ["Fe", "Grey"], ["Co", "Blue"]])
+        table = Table(caption=Caption("Curie temperatures."), table_data=[["Compound", "Tc (K)"], ["Fe", "100"], ["Co", "300"]])
+        doc = Document(Paragraph("Some magnetic compounds."), skipped, table)
+        doc.models = [Tc]
+        self.assertEqual(len([record for record in doc.records if isinstance(record, Tc)]), 2)
+        self.assertNotIn('_tde_table', skipped.__dict__)
+        self.assertIn('_tde_table', table.__dict__)
+        self.assertEqual(skipped.elements, [skipped.caption])
+
+    def test_required_phrase_with_tags(self):
+        """A required phrase that needs tags can be looked for in a table within a document, which tags the text
+        of the cells with the rest of the document."""
+        class UpperTagger(BaseTagger):
+            tag_type = "upper_tag"
+
+            def batch_tag(self, sents):
+                return [[(token, token.text.upper()) for token in sent] for sent in sents]
+
+        class Tc(TemperatureModel):
+            specifier = StringType(parse_expression=T('TC', tag_type='upper_tag'), required=True, contextual=False)
+            compound = ModelType(Compound, required=False, contextual=True)
+
+        Cell.taggers = Sentence.taggers + [UpperTagger()]
+        try:
+            caption = Caption("Curie temperatures.", taggers=Sentence.taggers + [UpperTagger()])
+            table = Table(caption=caption, table_data=[["Compound", "Tc (K)"], ["Fe", "100"], ["Co", "300"]], models=[Tc])
+            Document(table)
+            self.assertEqual(len([record for record in table.records if isinstance(record, Tc)]), 2)
+            self.assertGreater(len([el for el in table.elements if isinstance(el, Cell)]), 0)
+        finally:
+            del Cell.taggers
+
+    def test_elements_without_models(self):
+        """The cells of a table without models are in its elements, whether or not its records have been requested."""
+        table = Table(caption=Caption("Example table."), table_data=[["Compound", "Tc (K)"], ["Fe", "100"]])
+        elements = table.elements
+        self.assertGreater(len([el for el in elements if isinstance(el, Cell)]), 0)
+        self.assertEqual(len(table.records), 0)
+        self.assertEqual(table.elements, elements)
+
 
 if __name__ == '__main__':
     unittest.main()
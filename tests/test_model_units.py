@@ -19,6 +19,7 @@ import unittest
 import copy
 
 from chemdataextractor.model.units.quantity_model import QuantityModel, DimensionlessModel
+from chemdataextractor.model.units import dimension
 from chemdataextractor.model.units.dimension import Dimensionless, Dimension
 from chemdataextractor.model.units.unit import DimensionlessUnit, Unit
 
@@ -26,6 +27,7 @@ from chemdataextractor.model.units.time import Second, Minute, Hour, Time, TimeM
 from chemdataextractor.model.units.length import Meter, Mile, Length, LengthModel
 from chemdataextractor.model.units.temperature import Temperature, TemperatureModel, Kelvin, Celsius, Fahrenheit
 from chemdataextractor.model.units.mass import Mass, Gram
+from chemdataextractor.model.units.conversion import convert_models, convert_models_to_standard, convert_values, convert_errors
 
 from chemdataextractor.parse.elements import R
 
@@ -204,6 +206,52 @@ class TestDimensions(unittest.TestCase):
         self.assertEqual(str(test_dimension), expected)
 
 
+class TestInterning(unittest.TestCase):
+
+    def test_equal_structures_interned(self):
+        """Test equal composite units and dimensions share the same structural key."""
+        speed1 = Meter() / Second()
+        speed2 = (Second() ** -1.0) * Meter()
+        self.assertIs(speed1._structure, speed2._structure)
+        self.assertIs((Length() / Time())._structure, Speed()._structure)
+        self.assertIsNot(speed1._structure, (Meter() / Hour())._structure)
+
+    def test_evicted_structures(self):
+        """Test units and dimensions are still equal once their structural keys are no longer interned."""
+        speed = Meter() / Second()
+        speed._structure
+        dimension._interned_keys.clear()
+        other_speed = (Second() ** -1.0) * Meter()
+        self.assertIsNot(speed._structure, other_speed._structure)
+        self.assertEqual(speed, other_speed)
+        self.assertNotEqual(speed, Meter() / Hour())
+        self.assertEqual(Length() / Time(), Speed())
+        self.assertLessEqual(len(dimension._interned_keys), dimension._interned_keys.max_size)
+
+    def test_normalised_keys_shared(self):
+        """Test the units used as keys in composite units are shared rather than copied."""
+        keys1 = list((Meter() / Second()).powers)
+        keys2 = list((Meter(magnitude=3.0) / Second()).powers)
+        self.assertIs(keys1[0], keys2[0])
+        self.assertEqual(keys1[0].magnitude, 0.0)
+
+    def test_modified_magnitude(self):
+        """Test equality and hashing take into account changes to the magnitude after a unit has been hashed."""
+        meter = Meter()
+        hash(meter)
+        self.assertNotEqual(meter, Meter(magnitude=3.0))
+        meter.magnitude = 3.0
+        self.assertEqual(meter, Meter(magnitude=3.0))
+        self.assertEqual(hash(meter), hash(Meter(magnitude=3.0)))
+
+    def test_copies(self):
+        """Test copied units are equal to the originals."""
+        speed = Meter(magnitude=3.0) / Hour()
+        self.assertEqual(copy.deepcopy(speed), speed)
+        self.assertEqual(copy.copy(speed), speed)
+        self.assertNotIn("_structure_cache", speed.__getstate__())
+
+
 class TestQuantity(unittest.TestCase):
 
     def test_equality(self):
@@ -308,3 +356,73 @@ class TestQuantity(unittest.TestCase):
         speed2.units = Meter() / Second()
         dimensionless_div = speed / speed2
         self.assertTrue(isinstance(dimensionless_div, DimensionlessModel))
+
+
+class TestBulkConversion(unittest.TestCase):
+
+    def _temperatures(self):
+        temperatures = []
+        for i, units in enumerate([Celsius(), Fahrenheit(), Celsius(), Kelvin(magnitude=-3.0)]):
+            temperature = TemperatureModel()
+            temperature.value = [i * 101.7 - 40.3] if i % 2 else [i * 13.1, i * 57.3 + 1.0]
+            temperature.units = units
+            if i > 1:
+                temperature.error = 0.3 * i
+            temperatures.append(temperature)
+        return temperatures
+
+    def test_convert_models(self):
+        """Test converting models in bulk gives exactly the same results as converting each model."""
+        expected = [temperature.convert_to(Fahrenheit()) for temperature in self._temperatures()]
+        converted = convert_models(self._temperatures(), Fahrenheit())
+        for temperature, expected_temperature in zip(converted, expected):
+            self.assertEqual(temperature.value, expected_temperature.value)
+            self.assertEqual(temperature.error, expected_temperature.error)
+            self.assertEqual(temperature.units, Fahrenheit())
+
+    def test_convert_models_to_standard(self):
+        """Test converting models of different dimensions to their standard units in bulk."""
+        speed = SpeedModel()
+        speed.value = [100.0]
+        speed.units = Mile() / Hour()
+        models = self._temperatures() + [speed]
+        expected = [copy.deepcopy(model).convert_to_standard() for model in models]
+        convert_models_to_standard(models)
+        for model, expected_model in zip(models, expected):
+            self.assertEqual(model.value, expected_model.value)
+            self.assertEqual(model.error, expected_model.error)
+            self.assertEqual(model.units, expected_model.units)
+        self.assertAlmostEqual(speed.value[0], 44.70400, places=places)
+
+    def test_convert_models_zero(self):
+        """Test errors are raised as when converting each model."""
+        class InvTempModel(QuantityModel):
+            dimensions = Temperature() ** -1.0
+        invtemp = InvTempModel()
+        invtemp.value = [0.0]
+        invtemp.units = Celsius() ** -1.0
+        with self.assertRaises(ValueError):
+            convert_models_to_standard([invtemp])
+
+    def test_convert_values(self):
+        """Test converting arrays of values and errors."""
+        values = [[0.0, 10.0], [32.0, 50.0], [273.15, 283.15]]
+        units = [Celsius(), Fahrenheit(), Kelvin()]
+        converted = convert_values(values, units, Kelvin())
+        for row, unit, converted_row in zip(values, units, converted.tolist()):
+            self.assertEqual(converted_row, [unit.convert_value_to_standard(value) for value in row])
+        errors = convert_errors([1.0, 1.8], [Kelvin(), Fahrenheit()], Celsius())
+        self.assertEqual(errors.tolist(), [1.0, Fahrenheit().convert_error_to_standard(1.8)])
+        with self.assertRaises(ValueError):
+            convert_values([1.0], Meter(), Kelvin())
+
+    def test_untraceable_unit(self):
+        """Test units whose conversions depend on the value are converted one value at a time."""
+        class OffsetCelsius(Celsius):
+            def convert_value_to_standard(self, value):
+                if value < 0:
+                    return value + 273.0
+                return value + 273.15
+
+        converted = convert_values([-1.0, 1.0], OffsetCelsius(), Kelvin())
+        self.assertEqual(converted.tolist(), [272.0, 274.15])
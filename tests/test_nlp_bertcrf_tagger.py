@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+test_nlp_bertcrf_tagger
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Test how the BERT-CRF tagger encodes and batches sentences.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from chemdataextractor.doc.text import Sentence
+from chemdataextractor.nlp.bertcrf_tagger import BertCrfTagger, ProcessedTextTagger, _BertCrfTokenTagger
+from chemdataextractor.nlp.subsentence import NoneSubsentenceExtractor
+from chemdataextractor.nlp.tokenize import WordTokenizer
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+VOCAB = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]', 'the', 'mel', '##ting', 'point', 'of', 'benz', '##ene', 'is',
+         '<nUm>', 'K', '.', 'C', '##o', '##O', '2']
+
+
+def slow_wordpiece_ids(word):
+    """The wordpiece ids for a word, found greedily longest first, as by the WordpieceTokenizer of slow BERT tokenizers."""
+    ids = []
+    start = 0
+    while start < len(word):
+        end = len(word)
+        while end > start:
+            wordpiece = word[start:end] if start == 0 else '##' + word[start:end]
+            if wordpiece in VOCAB:
+                break
+            end -= 1
+        else:
+            return [VOCAB.index('[UNK]')]
+        ids.append(VOCAB.index(wordpiece))
+        start = end
+    return ids
+
+
+class EchoPredictor(object):
+    """Tags each token with the id of its first wordpiece, in place of the BERT-CRF model."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def forward_on_instances(self, instance):
+        self.shapes.append(tuple(instance['input_ids'].size()))
+        return [
+            {'tags': [str(int(ids[offset])) for offset, mask in zip(offsets, crf_mask) if mask]}
+            for ids, offsets, crf_mask in zip(instance['input_ids'], instance['offsets'], instance['crf_mask'])
+        ]
+
+
+class TestBertCrfTagger(unittest.TestCase):
+
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        with open(os.path.join(cls.directory, 'vocab.txt'), 'w') as f:
+            f.write('\n'.join(VOCAB) + '\n')
+
+        class SmallBertCrfTagger(BertCrfTagger):
+            model = cls.directory
+
+        cls.tagger_class = SmallBertCrfTagger
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def make_tagger(self, **kwargs):
+        tagger = self.tagger_class(archive_location=self.directory, **kwargs)
+        tagger._predictor = EchoPredictor()
+        return tagger
+
+    def make_tokens(self, text):
+        sentence = Sentence(
+            text,
+            word_tokenizer=WordTokenizer(),
+            taggers=[ProcessedTextTagger(), _BertCrfTokenTagger()],
+            subsentence_extractor=NoneSubsentenceExtractor(),
+        )
+        return sentence.tokens
+
+    def test_wordpieces_match_slow_tokenizer(self):
+        """Test the wordpiece ids and offsets are those given by the slow BERT tokenizer."""
+        tagger = self.make_tagger()
+        sents = [['the', 'melting', 'point', 'of', 'benzene'], ['CoO', 'xyz', '<nUm>', 'K', '.'], ['point']]
+        instance = tagger._encode_batch([tagger._wordpiece_ids(words) for words in sents])
+        for i, words in enumerate(sents):
+            expected_ids = [tagger.bert_tokenizer.cls_token_id]
+            expected_offsets = []
+            for word in words:
+                expected_offsets.append(len(expected_ids))
+                expected_ids.extend(slow_wordpiece_ids(word))
+            expected_ids.append(tagger.bert_tokenizer.sep_token_id)
+            padding = instance['input_ids'].size(1) - len(expected_ids)
+            self.assertEqual(instance['input_ids'][i].tolist(), expected_ids + [0] * padding)
+            padding = instance['offsets'].size(1) - len(words)
+            self.assertEqual(instance['offsets'][i].tolist(), expected_offsets + [0] * padding)
+            self.assertEqual(instance['crf_mask'][i].tolist(), [1] * len(words) + [0] * padding)
+        self.assertEqual(tagger._wordpiece_ids(['melting']), [[6, 7]])
+
+    def test_long_sentence(self):
+        """Test a sentence longer than the wordpiece budget is put in a batch of its own."""
+        tagger = self.make_tagger(max_batch_tokens=20)
+        all_wordpiece_ids = [[[5]] * 3, [[5]] * 4, [[5]] * 30, [[5]] * 3]
+        self.assertEqual(tagger._divide_by_num_wordpieces(all_wordpiece_ids), [[0, 1], [2], [3]])
+        instances = tagger._create_batches([None] * 4, all_wordpiece_ids)
+        self.assertEqual([tuple(instance['input_ids'].size()) for instance in instances], [(2, 6), (1, 32), (1, 5)])
+
+    def test_empty(self):
+        """Test there are no batches and no tags when there are no sentences."""
+        tagger = self.make_tagger()
+        self.assertEqual(tagger._divide_by_num_wordpieces([]), [])
+        self.assertEqual(tagger._create_batches([], []), [])
+        self.assertEqual(tagger.batch_tag([]), [])
+        self.assertEqual(tagger._predictor.shapes, [])
+
+    def test_batches_in_order(self):
+        """Test every sentence is batched once, in order, within the budget and the maximum batch size."""
+        tagger = self.make_tagger(max_batch_tokens=64, max_batch_size=4)
+        rng = random.Random(0)
+        all_wordpiece_ids = sorted(
+            ([[5] * rng.randint(1, 3) for _ in range(rng.randint(0, 40))] for _ in range(50)),
+            key=lambda sent: sum(len(token) for token in sent),
+        )
+        divisions = tagger._divide_by_num_wordpieces(all_wordpiece_ids)
+        self.assertEqual([i for division in divisions for i in division], list(range(len(all_wordpiece_ids))))
+        for division in divisions:
+            self.assertLessEqual(len(division), 4)
+            padded_length = max(sum(len(token) for token in all_wordpiece_ids[i]) + 2 for i in division)
+            if len(division) > 1:
+                self.assertLessEqual(len(division) * padded_length, 64)
+
+    def test_batch_tag_order(self):
+        """Test the tags of each sentence are returned in the order of the sentences, across batches."""
+        tagger = self.make_tagger(max_batch_tokens=16)
+        texts = ['the melting point of benzene is 5 K .', 'CoO', 'the point', 'benzene is C', 'of']
+        sents = [self.make_tokens(text) for text in texts]
+        tags = [list(sent_tags) for sent_tags in tagger.batch_tag(sents)]
+        self.assertGreater(len(tagger._predictor.shapes), 1)
+        for sent, sent_tags in zip(sents, tags):
+            self.assertEqual([token for token, tag in sent_tags], sent)
+            self.assertEqual(
+                [tag for token, tag in sent_tags],
+                [str(slow_wordpiece_ids(token.processed_text)[0]) for token in sent],
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
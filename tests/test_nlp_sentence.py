@@ -15,7 +15,8 @@ from __future__ import unicode_literals
 import logging
 import unittest
 
-from chemdataextractor.doc.text import Text
+from chemdataextractor.doc.document import Document
+from chemdataextractor.doc.text import Text, Heading, Paragraph
 from chemdataextractor.nlp.tokenize import SentenceTokenizer, ChemSentenceTokenizer
 
 
@@ -147,6 +148,37 @@ class TestChemSentenceTokenizer(unittest.TestCase):
             [(s.start, s.end, s.text) for s in t.sentences]
         )
 
+    def test_batch_span_tokenize(self):
+        """Test batch sentence tokenization gives the same spans as Punkt, including for texts without sentence ends."""
+        texts = [
+            'This is in agreement with previous observations by Peng et al. It is believed that 1D growth does occur.',
+            'Results and discussion',
+            '  Tc (K)  ',
+            '',
+            '   ',
+            'Is this a question? Yes!',
+        ]
+        self.ps.span_tokenize('')
+        expected = [list(self.ps._tokenizer.span_tokenize(text)) for text in texts]
+        self.assertEqual(expected, self.ps.batch_span_tokenize(texts))
+
+    def test_document_sentences(self):
+        """Test sentences are assigned to the correct elements when a document is segmented in one pass."""
+        d = Document(
+            Heading('Experimental'),
+            Paragraph('These regions are positive contributors to overall efficiency. van Westen et al. built on this.'),
+            Paragraph('Entry'),
+        )
+        self.assertEqual(
+            ['Experimental', 'These regions are positive contributors to overall efficiency.', 'van Westen et al. built on this.', 'Entry'],
+            [s.text for s in d.sentences]
+        )
+        self.assertEqual([1, 2, 1], [len(el.sentences) for el in d.elements])
+        self.assertEqual((63, 95), (d.elements[1].sentences[1].start, d.elements[1].sentences[1].end))
+        for el in d.elements:
+            for sent in el.sentences:
+                self.assertIs(d, sent.document)
+
 
 if __name__ == '__main__':
     unittest.main()
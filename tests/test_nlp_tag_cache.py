@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+test_nlp_tag_cache
+~~~~~~~~~~~~~~~~~~
+
+Test caching of tags using the TagCache class.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from chemdataextractor.doc import Document, Paragraph, Sentence, SqliteCacheStore
+from chemdataextractor.nlp.cem import LegacyCemTagger
+from chemdataextractor.nlp.subsentence import NoneSubsentenceExtractor
+from chemdataextractor.nlp.tag import BaseTagger, EnsembleTagger, NER_TAG_TYPE, POS_TAG_TYPE
+from chemdataextractor.nlp.tag_cache import TagCache
+from chemdataextractor.nlp.tokenize import WordTokenizer
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class UpperTagger(BaseTagger):
+    tag_type = POS_TAG_TYPE
+
+    def tag(self, tokens):
+        return [(token, token.upper()) for token in tokens]
+
+
+class PosTagger(BaseTagger):
+    """Tags each token with its text, in upper or lower case."""
+    tag_type = POS_TAG_TYPE
+
+    def __init__(self, upper=True):
+        self.upper = upper
+        self.model = 'upper' if upper else 'lower'
+
+    def tag(self, tokens):
+        return [(token, token.text.upper() if self.upper else token.text.lower()) for token in tokens]
+
+
+class PosFeatureTagger(BaseTagger):
+    """Tags each token with its PoS tag, as taggers using PoS tags as features do."""
+    tag_type = NER_TAG_TYPE
+    upstream_tag_types = (POS_TAG_TYPE,)
+
+    def tag(self, tokens):
+        return [(token, token.pos_tag) for token in tokens]
+
+
+class BatchPosFeatureTagger(PosFeatureTagger):
+
+    def batch_tag(self, sents):
+        return [self.tag(tokens) for tokens in sents]
+
+
+class TestTagCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "tag_cache.sqlite")
+        self.tagger = UpperTagger()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_hits_and_misses(self):
+        cache = TagCache(self.path)
+        tokens = ["Benzene", "is", "aromatic"]
+        self.assertIsNone(cache.get(self.tagger, POS_TAG_TYPE, tokens))
+        cache.set(self.tagger, POS_TAG_TYPE, tokens, ["BENZENE", "IS", "AROMATIC"])
+        self.assertEqual(
+            cache.get(self.tagger, POS_TAG_TYPE, tokens), ["BENZENE", "IS", "AROMATIC"]
+        )
+        self.assertIsNone(cache.get(self.tagger, NER_TAG_TYPE, tokens))
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["entries"], 1)
+        cache.close()
+
+    def test_get_many(self):
+        cache = TagCache(self.path)
+        sents = [["a", "b"], ["c"], ["a", "b"]]
+        cache.set_many(self.tagger, POS_TAG_TYPE, sents[:1], [["A", "B"]])
+        self.assertEqual(
+            cache.get_many(self.tagger, POS_TAG_TYPE, sents), [["A", "B"], None, ["A", "B"]]
+        )
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+        cache.close()
+
+    def test_persistence(self):
+        cache = TagCache(self.path)
+        cache.set(self.tagger, POS_TAG_TYPE, ["a"], ["A"])
+        cache.close()
+        cache = TagCache(self.path)
+        self.assertEqual(cache.get(self.tagger, POS_TAG_TYPE, ["a"]), ["A"])
+        cache.close()
+
+    def test_store(self):
+        store = SqliteCacheStore(os.path.join(self.directory, "store"), shards=2)
+        cache = TagCache(store=store)
+        cache.set(self.tagger, POS_TAG_TYPE, ["a"], ["A"])
+        self.assertEqual(store.keys(), [cache.key(self.tagger, POS_TAG_TYPE, ["a"])])
+        self.assertEqual(cache.get(self.tagger, POS_TAG_TYPE, ["a"]), ["A"])
+        self.assertEqual(cache.stats()["shards"], 2)
+        cache.clear()
+        self.assertEqual(cache.stats()["entries"], 0)
+        cache.close()
+
+    def test_version_invalidates(self):
+        cache = TagCache(self.path)
+        cache.set(self.tagger, POS_TAG_TYPE, ["a"], ["A"])
+        self.tagger.version = "2"
+        self.assertIsNone(cache.get(self.tagger, POS_TAG_TYPE, ["a"]))
+        cache.close()
+
+    def test_upstream_invalidates(self):
+        cache = TagCache(self.path)
+        cache.set(self.tagger, NER_TAG_TYPE, ["a"], ["A"], upstream=["pos:1"])
+        self.assertEqual(cache.get(self.tagger, NER_TAG_TYPE, ["a"], upstream=["pos:1"]), ["A"])
+        self.assertIsNone(cache.get(self.tagger, NER_TAG_TYPE, ["a"], upstream=["pos:2"]))
+        self.assertIsNone(cache.get(self.tagger, NER_TAG_TYPE, ["a"]))
+        self.assertEqual(
+            cache.get_many(self.tagger, NER_TAG_TYPE, [["a"], ["a"]], [["pos:2"], ["pos:1"]]), [None, ["A"]]
+        )
+        # Keys for taggers without upstream taggers are unchanged
+        self.assertEqual(cache.key(self.tagger, POS_TAG_TYPE, ["a"], []), cache.key(self.tagger, POS_TAG_TYPE, ["a"]))
+        cache.close()
+
+    def test_upstream_sentence(self):
+        """Test tags from a tagger using PoS tags are not reused from the cache once the PoS tagger changes."""
+        cache = TagCache(self.path)
+        for upper, expected in [(True, ['BENZENE', 'IS']), (False, ['benzene', 'is']), (True, ['BENZENE', 'IS'])]:
+            sentence = Sentence(
+                'Benzene is',
+                word_tokenizer=WordTokenizer(),
+                taggers=[PosTagger(upper), PosFeatureTagger()],
+                subsentence_extractor=NoneSubsentenceExtractor(),
+            )
+            sentence.tag_cache = cache
+            self.assertEqual(sentence.ner_tags, expected)
+        # The cached NER tags are found on the third run, without needing the PoS tags
+        self.assertEqual(cache.hits, 1)
+        cache.close()
+
+    def test_upstream_document(self):
+        """Test tags from a batch tagger using PoS tags are not reused from the cache once the PoS tagger changes."""
+        cache = TagCache(self.path)
+        for upper, expected in [(True, ['BENZENE', 'IS']), (False, ['benzene', 'is']), (True, ['BENZENE', 'IS'])]:
+            doc = Document(
+                Paragraph(
+                    'Benzene is',
+                    word_tokenizer=WordTokenizer(),
+                    taggers=[PosTagger(upper), BatchPosFeatureTagger()],
+                    subsentence_extractor=NoneSubsentenceExtractor(),
+                ),
+                tag_cache=cache,
+            )
+            self.assertEqual(doc.elements[0].sentences[0].ner_tags, expected)
+        # The cached NER tags are found on the third run, without needing the PoS tags
+        self.assertEqual(cache.hits, 1)
+        cache.close()
+
+    def test_ensemble_upstream_tag_types(self):
+        """Test ensemble taggers use the upstream tag types of their taggers, other than those they assign."""
+        self.assertEqual(LegacyCemTagger().upstream_tag_types, (POS_TAG_TYPE,))
+
+        class PosFeatureEnsembleTagger(EnsembleTagger):
+            taggers = [PosTagger(), PosFeatureTagger()]
+
+        self.assertEqual(PosFeatureEnsembleTagger().upstream_tag_types, ())
+
+    def test_eviction(self):
+        cache = TagCache(self.path, max_size=2000)
+        for i in range(100):
+            cache.set(self.tagger, POS_TAG_TYPE, [str(i)], [str(i) * 20])
+        stats = cache.stats()
+        self.assertLessEqual(stats["size"], 2000)
+        self.assertLess(stats["entries"], 100)
+        # The most recently stored entries are kept
+        self.assertEqual(cache.get(self.tagger, POS_TAG_TYPE, ["99"]), ["99" * 20])
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
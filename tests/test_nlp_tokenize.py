@@ -17,7 +17,7 @@ import unittest
 import re
 
 from chemdataextractor.doc.text import Text, Sentence
-from chemdataextractor.nlp.tokenize import WordTokenizer, ChemWordTokenizer, FineWordTokenizer
+from chemdataextractor.nlp.tokenize import WordTokenizer, ChemWordTokenizer, FineWordTokenizer, TokenizationCache
 from chemdataextractor.parse import R
 from chemdataextractor.model import QuantityModel
 from chemdataextractor.model.units import Dimension, Unit
@@ -995,5 +995,50 @@ class TestFineWordTokenizer(unittest.TestCase):
                          self.t.tokenize('1-methyl-2-methylidene-cyclohexane'))
 
 
+class TestTokenizationCache(unittest.TestCase):
+
+    def test_cache(self):
+        """Test spans are only computed once for each tokenizer class, options and text."""
+        cache = TokenizationCache()
+        t = ChemWordTokenizer()
+        spans = t.span_tokenize('Tc (K)')
+        self.assertEqual(tuple(spans), cache.span_tokenize(t, 'Tc (K)'))
+        self.assertEqual(tuple(spans), cache.span_tokenize(ChemWordTokenizer(), 'Tc (K)'))
+        cache.span_tokenize(WordTokenizer(), 'Tc (K)')
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(2, cache.stats()['entries'])
+
+    def test_tokenizer_options(self):
+        """Test spans are stored separately for tokenizers of the same class with different options."""
+        cache = TokenizationCache()
+        self.assertEqual(((0, 3), (4, 9), (10, 12), (13, 14), (14, 15)),
+                         cache.span_tokenize(ChemWordTokenizer(), 'The value is 5.'))
+        self.assertEqual(((0, 3), (4, 9), (10, 12), (13, 15)),
+                         cache.span_tokenize(ChemWordTokenizer(split_last_stop=False), 'The value is 5.'))
+        self.assertEqual(2, cache.misses)
+
+    def test_max_size(self):
+        """Test the least recently used entries are evicted."""
+        cache = TokenizationCache(max_size=2)
+        t = WordTokenizer()
+        cache.span_tokenize(t, 'Entry')
+        cache.span_tokenize(t, 'Compound')
+        cache.span_tokenize(t, 'Entry')
+        cache.span_tokenize(t, 'Yield')
+        self.assertEqual(2, len(cache))
+        cache.span_tokenize(t, 'Entry')
+        self.assertEqual(2, cache.hits)
+
+    def test_sentence_tokens(self):
+        """Test sentences with the same text get separate tokens from the shared cache."""
+        s1 = Sentence('Tc (K)')
+        s2 = Sentence('Tc (K)')
+        self.assertEqual(['Tc', '(', 'K', ')'], [token.text for token in s1.tokens])
+        self.assertEqual(s1.raw_tokens, s2.raw_tokens)
+        self.assertIsNot(s1.tokens[0], s2.tokens[0])
+        self.assertIs(s2, s2.tokens[0].sentence)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+test_parse_cache
+~~~~~~~~~~~~~~~~
+
+Test the parse cache and parser fingerprints.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from chemdataextractor.doc import Document, Sentence
+from chemdataextractor.model.base import BaseModel, StringType
+from chemdataextractor.nlp.subsentence import NoneSubsentenceExtractor
+from chemdataextractor.nlp.tag import BaseTagger
+from chemdataextractor.nlp.tokenize import WordTokenizer
+from chemdataextractor.parse import I, R, T, W
+from chemdataextractor.parse.base import BaseSentenceParser
+from chemdataextractor.parse.parse_cache import ParseCache, fingerprint
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class PosTagger(BaseTagger):
+    tag_type = 'pos_tag'
+
+    def tag(self, tokens):
+        return [(token, 'CD' if token.text.isdigit() else 'NN') for token in tokens]
+
+
+class NerTagger(BaseTagger):
+    tag_type = 'ner_tag'
+
+    def tag(self, tokens):
+        return [(token, 'O') for token in tokens]
+
+
+class BpParser(BaseSentenceParser):
+    """Finds boiling points, counting the sentences it interprets."""
+    interpreted = 0
+    root = (I('bp') + R(r'^\d+$')('value'))('bp')
+
+    def interpret(self, result, start, end):
+        BpParser.interpreted += 1
+        yield self.model(specifier='bp', value=result.xpath('./value/text()')[0])
+
+
+class Bp(BaseModel):
+    specifier = StringType()
+    value = StringType()
+    parsers = [BpParser()]
+
+
+class ShapeTagger(BaseTagger):
+    """Tags numbers with the given shape."""
+    tag_type = 'shape_tag'
+
+    def __init__(self, shape):
+        self.shape = shape
+
+    def tag(self, tokens):
+        return [(token, self.shape if token.text.isdigit() else 'x') for token in tokens]
+
+
+class ShapeParser(BaseSentenceParser):
+    """Finds boiling points whose values have the shape d."""
+    root = (I('bp') + T('d', tag_type='shape_tag')('value'))('bp')
+
+    def interpret(self, result, start, end):
+        yield self.model(specifier='bp', value=result.xpath('./value/text()')[0])
+
+
+class ShapeBp(BaseModel):
+    specifier = StringType()
+    value = StringType()
+    parsers = [ShapeParser()]
+
+
+def make_sentence(text):
+    return Sentence(
+        text,
+        word_tokenizer=WordTokenizer(),
+        taggers=[PosTagger(), NerTagger()],
+        subsentence_extractor=NoneSubsentenceExtractor(),
+    )
+
+
+class TestParseCache(unittest.TestCase):
+
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.parse_cache = ParseCache(os.path.join(self.directory, 'parse_cache.sqlite'))
+
+    def tearDown(self):
+        self.parse_cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_parse_sentence(self):
+        """Test records are only parsed once for the same tokens, and new copies are returned each time."""
+        parser = Bp.parsers[0]
+        BpParser.interpreted = 0
+        sentence = make_sentence('The bp 120 here.')
+        records = self.parse_cache.parse_sentence(parser, sentence)
+        cached_records = self.parse_cache.parse_sentence(parser, make_sentence('The bp 120 here.'))
+        self.assertEqual(BpParser.interpreted, 1)
+        self.assertEqual(self.parse_cache.hits, 1)
+        self.assertEqual([r.serialize() for r in cached_records], [{'Bp': {'specifier': 'bp', 'value': '120'}}])
+        self.assertEqual([r.serialize() for r in records], [r.serialize() for r in cached_records])
+        self.assertIsNot(cached_records[0], self.parse_cache.parse_sentence(parser, sentence)[0])
+        self.parse_cache.parse_sentence(parser, make_sentence('The bp 130 here.'))
+        self.assertEqual(BpParser.interpreted, 2)
+
+    def test_document(self):
+        """Test documents with a parse cache find the same records."""
+        texts = ['The bp 120 here.', 'No boiling point.']
+        expected = Document(*[make_sentence(text) for text in texts], models=[Bp]).records.serialize()
+        BpParser.interpreted = 0
+        for _ in range(2):
+            doc = Document(*[make_sentence(text) for text in texts], models=[Bp], parse_cache=self.parse_cache)
+            self.assertEqual(doc.records.serialize(), expected)
+        self.assertEqual(BpParser.interpreted, 1)
+        self.assertEqual(self.parse_cache.stats()['entries'], 2)
+
+    def test_tag_types(self):
+        """Test records are not reused for tokens with the same text and legacy tags but other tags that the parser matches."""
+        def make_shape_sentence(shape):
+            return Sentence(
+                'The bp 120 here.',
+                word_tokenizer=WordTokenizer(),
+                taggers=[PosTagger(), NerTagger(), ShapeTagger(shape)],
+                subsentence_extractor=NoneSubsentenceExtractor(),
+            )
+
+        parser = ShapeBp.parsers[0]
+        self.assertEqual(len(self.parse_cache.parse_sentence(parser, make_shape_sentence('d'))), 1)
+        self.assertEqual(self.parse_cache.parse_sentence(parser, make_shape_sentence('dd')), [])
+        self.assertEqual(self.parse_cache.hits, 0)
+        self.assertEqual(len(self.parse_cache.parse_sentence(parser, make_shape_sentence('d'))), 1)
+        self.assertEqual(self.parse_cache.hits, 1)
+
+    def test_can_cache(self):
+        """Test parsers that override parse_sentence are not cached unless they say so."""
+        class CustomBpParser(BpParser):
+            def parse_sentence(self, sentence):
+                return []
+
+        self.assertTrue(self.parse_cache.can_cache(BpParser()))
+        self.assertFalse(self.parse_cache.can_cache(CustomBpParser()))
+        CustomBpParser.cacheable = True
+        self.assertTrue(self.parse_cache.can_cache(CustomBpParser()))
+
+    def test_fingerprint(self):
+        """Test fingerprints depend on the parse expressions and fields, but not on the objects themselves."""
+        self.assertEqual(fingerprint(I('bp') + W('K')), fingerprint(I('bp') + W('K')))
+        self.assertNotEqual(fingerprint(I('bp') + W('K')), fingerprint(I('bp') + W('C')))
+        self.assertNotEqual(fingerprint(I('bp') + W('K')), fingerprint(W('bp') + W('K')))
+        self.assertEqual(fingerprint({'b', 'a', 'c'}), fingerprint({'c', 'b', 'a'}))
+
+        class Mp(BaseModel):
+            specifier = StringType(parse_expression=I('mp'))
+
+        before = fingerprint(Mp)
+        self.assertEqual(before, fingerprint(Mp))
+        Mp.specifier.parse_expression = I('m.p.')
+        self.assertNotEqual(before, fingerprint(Mp))
+        Mp.specifier.parse_expression = I('mp')
+        self.assertEqual(before, fingerprint(Mp))
+        Mp.specifier.required = True
+        self.assertNotEqual(before, fingerprint(Mp))
+
+    def test_updated_model(self):
+        """Test records are parsed again after the updatable parse expressions of the model are changed."""
+        class TbParser(BaseSentenceParser):
+            @property
+            def root(self):
+                return (self.model.specifier.parse_expression('specifier') + R(r'^\d+$')('value'))('tb')
+
+            def interpret(self, result, start, end):
+                yield self.model(specifier=result.xpath('./specifier/text()')[0], value=result.xpath('./value/text()')[0])
+
+        class Tb(BaseModel):
+            specifier = StringType(parse_expression=I('bp'), updatable=True)
+            value = StringType()
+            parsers = [TbParser()]
+
+        parser = Tb.parsers[0]
+        parser.model = Tb
+        text = 'The TB 100 here.'
+        self.assertEqual(self.parse_cache.parse_sentence(parser, make_sentence(text)), [])
+        Tb.update([{'specifier': 'TB', 'tokens': [('bp', 'NN'), ('(', '-LRB-'), ('TB', 'NN'), (')', '-RRB-')]}])
+        records = self.parse_cache.parse_sentence(parser, make_sentence(text))
+        self.assertEqual([r.serialize() for r in records], [{'Tb': {'specifier': 'TB', 'value': '100'}}])
+        Tb.reset_updatables()
+        self.assertEqual(self.parse_cache.parse_sentence(parser, make_sentence(text)), [])
+        self.assertEqual(self.parse_cache.hits, 1)
+
+    def test_cache_identity(self):
+        """Test parsers of different models have different identities."""
+        class OtherBp(BaseModel):
+            specifier = StringType()
+            value = StringType()
+            parsers = [BpParser()]
+
+        self.assertEqual(Bp.parsers[0].cache_identity, Bp.parsers[0].cache_identity)
+        self.assertNotEqual(Bp.parsers[0].cache_identity, OtherBp.parsers[0].cache_identity)
+
+
+if __name__ == '__main__':
+    unittest.main()
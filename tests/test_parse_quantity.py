@@ -14,10 +14,16 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 import logging
+import random
+import re
 import unittest
 
 
 from chemdataextractor.parse.base import BaseParser
+from chemdataextractor.parse.auto import construct_unit_element, unit_element_cache
+from chemdataextractor.parse.elements import R
+from chemdataextractor.parse.quantity import extract_units, extract_units_cache, construct_quantity_re, quantity_re_cache
+from chemdataextractor.parse.quantity import _remove_subranges, _UnitMatcher
 from chemdataextractor.model.units import QuantityModel
 from chemdataextractor.model.units.temperature import Temperature, Celsius, Kelvin
 from chemdataextractor.model.units.length import Length, Meter, Mile
@@ -180,3 +186,142 @@ class TestUnitClass(unittest.TestCase):
         expected = Joule() / Gram(magnitude=3.0)
         log.debug(extracted, expected)
         self.assertEqual(extracted, expected)
+
+
+class TestExtractUnitsCache(unittest.TestCase):
+
+    def setUp(self):
+        extract_units_cache.clear()
+
+    def test_cached_copies(self):
+        """Test repeated unit strings are found in the cache, and each call gets its own copy of the Unit."""
+        dimensions = Length()**2 / Time()
+        first = extract_units('mm2/s', dimensions, strict=True)
+        second = extract_units('mm2/s', dimensions, strict=True)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        first.magnitude = 3.0
+        self.assertEqual(extract_units('mm2/s', dimensions, strict=True), (Meter(magnitude=-3.0) ** 2.) / Second())
+        self.assertEqual(extract_units_cache.hits, 2)
+        self.assertEqual(extract_units_cache.misses, 1)
+
+    def test_strict(self):
+        """Test strict and non-strict results are cached separately, including errors."""
+        dimensions = Temperature()
+        self.assertEqual(extract_units('Kx', dimensions, strict=False), Kelvin())
+        with self.assertRaises(TypeError):
+            extract_units('Kx', dimensions, strict=True)
+        with self.assertRaises(TypeError):
+            extract_units('Kx', dimensions, strict=True)
+        self.assertEqual(extract_units_cache.hits, 1)
+
+
+def remove_subranges_per_pair(ranges):
+    """The original implementation of _remove_subranges, comparing every pair of ranges."""
+    should_remove_indices = []
+    for parent_index, parent in enumerate(ranges):
+        for child_index, child in enumerate(ranges):
+            if child_index != parent_index and child[1] >= parent[1] and child[2] <= parent[2]:
+                should_remove_indices.append(child_index)
+    return [r for index, r in enumerate(ranges) if index not in should_remove_indices]
+
+
+def finditer_per_pattern(units, string):
+    """The matches of each of the unit patterns, searched for one pattern at a time as before _UnitMatcher."""
+    return [
+        (match.group(0), match.start(), match.end(), unit)
+        for element, unit in units if unit is not None
+        for match in re.finditer(element.pattern, string)
+    ]
+
+
+class TestUnitMatcher(unittest.TestCase):
+
+    def test_remove_subranges(self):
+        """Test ranges within other ranges are removed, but overlapping and adjacent ranges are kept."""
+        nested = [('m', 1, 2), ('mm', 0, 2), ('m', 0, 1)]
+        self.assertEqual(_remove_subranges(nested), [('mm', 0, 2)])
+        overlapping = [('mA', 0, 2), ('Ah', 1, 3)]
+        self.assertEqual(_remove_subranges(overlapping), overlapping)
+        adjacent = [('K', 2, 3), ('m', 0, 1), ('s', 1, 2)]
+        self.assertEqual(_remove_subranges(adjacent), adjacent)
+        self.assertEqual(_remove_subranges([('K', 0, 1), ('K', 0, 1), ('s', 1, 2)]), [('s', 1, 2)])
+        self.assertEqual(_remove_subranges([]), [])
+
+    def test_remove_subranges_per_pair(self):
+        """Test the same ranges are kept as when comparing every pair of ranges."""
+        rng = random.Random(0)
+        for _ in range(500):
+            ranges = []
+            for _ in range(rng.randint(0, 8)):
+                start = rng.randint(0, 10)
+                ranges.append(('', start, start + rng.randint(0, 4)))
+            self.assertEqual(_remove_subranges(ranges), remove_subranges_per_pair(ranges))
+
+    def test_overlapping_patterns(self):
+        """Test patterns that match overlapping, nested and adjacent text are each found as by their own search."""
+        units = (
+            (R('m'), Meter()),
+            (R('mm'), Mile()),
+            (R('aa'), Second()),
+            (R('ma'), Hour()),
+            (R('x'), None),
+        )
+        matcher = _UnitMatcher(units)
+        self.assertIsNotNone(matcher.regex)
+        for string in ['mm', 'mmm', 'aaaa', 'mmaaa', 'x', 'm/s', '']:
+            self.assertEqual(matcher.finditer(string), finditer_per_pattern(units, string))
+        self.assertEqual(matcher.finditer('aaaaa'), [('aa', 0, 2, Second()), ('aa', 2, 4, Second())])
+
+    def test_backreferences(self):
+        """Test patterns with backreferences are searched for one at a time."""
+        units = ((R(r'(m)\1'), Meter()), (R('m'), Mile()))
+        matcher = _UnitMatcher(units)
+        self.assertIsNone(matcher.regex)
+        self.assertEqual(matcher.finditer('mmm'), finditer_per_pattern(units, 'mmm'))
+
+    def test_dimensions(self):
+        """Test the matches for the units of real dimensions are the same as searching for each pattern."""
+        strings = ['mm2/s', 'km', 'Kx', '°C', 'mK', 'kJmol-1', 'mA h', 'cm-1', 'ms', 'mgs']
+        for dimensions in [Length(), Temperature(), Length()**2 / Time(), Energy() / Mass(), ElectricalCurrent() * Time()]:
+            units = tuple(dimensions.units_dict.items())
+            matcher = _UnitMatcher(units)
+            for string in strings:
+                self.assertEqual(matcher.finditer(string), finditer_per_pattern(units, string))
+
+
+class TestConstructedElementCache(unittest.TestCase):
+
+    def setUp(self):
+        quantity_re_cache.clear()
+        unit_element_cache.clear()
+
+    def test_quantity_re_shared(self):
+        """Test models looking for the same units share a compiled quantity regex."""
+        class LengthModel(QuantityModel):
+            dimensions = Length()
+
+        class OtherLengthModel(QuantityModel):
+            dimensions = Length()
+
+        class TemperatureModel(QuantityModel):
+            dimensions = Temperature()
+
+        quantity_re = construct_quantity_re(LengthModel)
+        self.assertIs(construct_quantity_re(OtherLengthModel), quantity_re)
+        self.assertIsNot(construct_quantity_re(LengthModel, TemperatureModel), quantity_re)
+        self.assertEqual(quantity_re.match('31mm').group('split'), '31')
+        self.assertIsNone(construct_quantity_re())
+
+    def test_unit_element_copies(self):
+        """Test unit elements are built once per set of units, and each call gets its own copy."""
+        first = construct_unit_element(Length())
+        second = construct_unit_element(Length())
+        self.assertIsNot(first, second)
+        self.assertEqual(unit_element_cache.hits, 1)
+        self.assertEqual(unit_element_cache.misses, 1)
+        first.with_condition(lambda result: False)
+        self.assertIsNone(second.condition)
+        self.assertIsNone(construct_unit_element(Length()).condition)
+        construct_unit_element(Length(), max_power=3)
+        self.assertEqual(unit_element_cache.misses, 2)
@@ -16,6 +16,7 @@ import unittest
 
 from chemdataextractor.doc import Paragraph
 from chemdataextractor.reader import HtmlReader
+from chemdataextractor.reader.markup import _compile_css
 
 
 logging.basicConfig(level=logging.DEBUG)
@@ -66,6 +67,28 @@ class TestReaderHtml(unittest.TestCase):
         for el in d.elements:
             self.assertIsInstance(el, Paragraph)
 
+    def test_inline_fragments(self):
+        """Test inline elements and their tails are joined into a single paragraph."""
+        r = HtmlReader()
+        d = r.parse('<p>H<sub>2</sub>O and <i>Fe<sub>3</sub>O<sub>4</sub></i> <b id="b1">mixed</b>.<br/>Next line</p>')
+        self.assertEqual(len(d.elements), 2)
+        self.assertEqual(d.elements[0].text, 'H2O and Fe3O4 mixed.')
+        self.assertEqual(d.elements[0].id, 'b1')
+        self.assertEqual(d.elements[1].text, 'Next line')
+        for el in d.elements:
+            self.assertIsInstance(el, Paragraph)
+
+    def test_metadata(self):
+        """Test attribute selectors in the metadata CSS are compiled once and select attribute values."""
+        r = HtmlReader()
+        d = r.parse(
+            '<html><head><meta name="citation_doi" content="10.1039/c000000a">'
+            '<meta name="citation_title" content="A title"></head><body><p>Text</p></body></html>'
+        )
+        self.assertEqual(d.metadata.doi, '10.1039/c000000a')
+        self.assertEqual(d.metadata.title, 'A title')
+        self.assertIs(_compile_css(r.metadata_doi_css), _compile_css(HtmlReader.metadata_doi_css))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+test_reader_pdf
+~~~~~~~~~~~~~~~
+
+Test PDF reader.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from chemdataextractor.doc import Heading, Paragraph
+from chemdataextractor.reader import PdfReader
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+def make_pdf(pages):
+    """Return the bytes of a PDF with a page for each list of lines of text."""
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for lines in pages:
+        content = b'BT /F1 12 Tf 72 720 Td ' + b' 0 -200 Td '.join(b'(' + line.encode('ascii') + b') Tj' for line in lines) + b' ET'
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> '
+            b'/Contents %d 0 R >>' % (len(objects))
+        )
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [' + b' '.join(kids) + b'] /Count %d >>' % len(pages)
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for i, obj in enumerate(objects):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n' % (i + 1) + obj + b'\nendobj\n'
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return pdf
+
+
+PDF = make_pdf([
+    ['First page heading', 'First page text'],
+    ['Second page text'],
+    ['Third page heading', 'Third page text'],
+])
+
+
+class HeadingPdfReader(PdfReader):
+    """Reads text ending with 'heading' into headings."""
+
+    def _process_layout(self, layout):
+        return [
+            Heading(text) if text.endswith('heading') else Paragraph(text) for text in self._layout_texts(layout)
+        ]
+
+
+class TestPdfReader(unittest.TestCase):
+
+    maxDiff = None
+
+    def test_parse(self):
+        """Test PdfReader reads the text on each page into paragraphs."""
+        d = PdfReader().readstring(PDF)
+        self.assertEqual(
+            [el.text for el in d.elements],
+            ['First page heading', 'First page text', 'Second page text', 'Third page heading', 'Third page text']
+        )
+        for el in d.elements:
+            self.assertIsInstance(el, Paragraph)
+
+    def test_pages(self):
+        """Test PdfReader reads only the selected pages."""
+        d = PdfReader(pages=[0, 2]).readstring(PDF)
+        self.assertEqual(
+            [el.text for el in d.elements],
+            ['First page heading', 'First page text', 'Third page heading', 'Third page text']
+        )
+
+    def test_iterelements(self):
+        """Test PdfReader yields the same elements a page at a time."""
+        elements = PdfReader(pages=range(1, 3)).iterelements(PDF)
+        self.assertEqual(next(elements).text, 'Second page text')
+        self.assertEqual([el.text for el in elements], ['Third page heading', 'Third page text'])
+
+    def test_workers(self):
+        """Test PdfReader reads the same elements with the pages analysed in worker processes."""
+        expected = [el.text for el in PdfReader().readstring(PDF).elements]
+        d = PdfReader(workers=2).readstring(PDF)
+        self.assertEqual([el.text for el in d.elements], expected)
+        for el in d.elements:
+            self.assertIsInstance(el, Paragraph)
+
+    def test_workers_process_layout(self):
+        """Test the elements of a reader that overrides _process_layout are the same with worker processes."""
+        expected = [(type(el), el.text) for el in HeadingPdfReader().readstring(PDF).elements]
+        self.assertEqual(expected[0], (Heading, 'First page heading'))
+        d = HeadingPdfReader(workers=2).readstring(PDF)
+        self.assertEqual([(type(el), el.text) for el in d.elements], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+test_reader_registry
+~~~~~~~~~~~~~~~~~~~~
+
+Test choosing readers with the reader registry.
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from chemdataextractor.errors import ReaderError
+from chemdataextractor.reader import (
+    DEFAULT_READERS,
+    AcsHtmlReader,
+    HtmlReader,
+    PlainTextReader,
+    ReaderRegistry,
+    RscHtmlReader,
+    XmlReader,
+)
+from chemdataextractor.reader.springer import SpringerMaterialsHtmlReader
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class FailingHtmlReader(HtmlReader):
+    """An HTML reader that gives up after making its tree."""
+
+    def parse(self, fstring, trees=None):
+        self.root = self._make_shared_tree(fstring, trees)
+        self.root.find('.//p').text = 'Changed'
+        raise ReaderError
+
+
+class TestReaderRegistry(unittest.TestCase):
+
+    maxDiff = None
+
+    def test_sniff_markers(self):
+        """Test readers whose markers are found are tried before generic readers."""
+        registry = ReaderRegistry([HtmlReader(), AcsHtmlReader(), RscHtmlReader(), XmlReader()])
+        html = b'<html><head><meta content="Royal Society of Chemistry"></head><body><p>Text</p></body></html>'
+        readers = registry.sniff(html, fname='paper.HTML')
+        self.assertEqual([type(r) for r in readers], [RscHtmlReader, HtmlReader])
+
+    def test_sniff_size(self):
+        """Test markers after the start of the file are found, after the readers with markers near the start."""
+        html = b'<html><body><p>Text</p>' + b' ' * 100 + b'<meta content="Royal Society of Chemistry"></body></html>'
+        self.assertEqual(type(ReaderRegistry([RscHtmlReader(), HtmlReader()]).sniff(html)[0]), RscHtmlReader)
+        registry = ReaderRegistry([RscHtmlReader(), HtmlReader()], sniff_size=100)
+        self.assertEqual([type(r) for r in registry.sniff(html)], [RscHtmlReader, HtmlReader])
+        html = b'<meta name="dc.Identifier" scheme="doi" content="10.1021/jm000001">' + html
+        registry = ReaderRegistry([RscHtmlReader(), AcsHtmlReader(), HtmlReader()], sniff_size=100)
+        self.assertEqual([type(r) for r in registry.sniff(html)], [AcsHtmlReader, RscHtmlReader, HtmlReader])
+
+    def test_sniff_footer(self):
+        """Test markers in the footers of long pages are found, as by detect."""
+        html = (b'<html><body>' + b'<p>Text</p>' * 30000 +
+                b'<a class="footer-copyright_link" href="http://www.springernature.com">Springer</a></body></html>')
+        all_readers = [SpringerMaterialsHtmlReader()] + DEFAULT_READERS
+        readers = ReaderRegistry(all_readers).sniff(html, fname='paper.html')
+        self.assertEqual(type(readers[0]), SpringerMaterialsHtmlReader)
+        detected = [r for r in all_readers if r.detect(html, fname='paper.html')]
+        self.assertEqual([type(r) for r in readers], [type(r) for r in detected])
+
+    def test_sniff_custom_detect(self):
+        """Test readers that override detect are still asked."""
+        registry = ReaderRegistry([PlainTextReader()])
+        self.assertEqual(registry.sniff(b'Text', fname='paper.html'), [])
+        self.assertEqual(len(registry.sniff(b'Text', fname='paper.txt')), 1)
+
+    def test_default_readers(self):
+        """Test the default readers detect as before when used through a registry."""
+        html = b'<meta name="dc.Identifier" scheme="doi" content="10.1021/jm000001"><p>Text</p>'
+        readers = ReaderRegistry(DEFAULT_READERS).sniff(html, fname='paper.html')
+        self.assertEqual([type(r) for r in readers], [AcsHtmlReader, HtmlReader])
+        detected = [r for r in DEFAULT_READERS if r.detect(html, fname='paper.html')]
+        self.assertEqual([type(r) for r in readers], [type(r) for r in detected])
+
+    def test_register(self):
+        """Test registering readers in order of preference."""
+        registry = ReaderRegistry([HtmlReader()])
+        registry.register(PlainTextReader())
+        registry.register(XmlReader(), index=0)
+        self.assertEqual([type(r) for r in registry.readers], [XmlReader, HtmlReader, PlainTextReader])
+
+    def test_read_shared_tree(self):
+        """Test readers of the same markup format share an unmodified tree."""
+        html = b'<html><body><p>First para</p></body></html>'
+        trees = {}
+        with self.assertRaises(ReaderError):
+            FailingHtmlReader().parse(html, trees=trees)
+        d = HtmlReader().parse(html, trees=trees)
+        self.assertEqual(list(trees), [HtmlReader._make_tree])
+        self.assertEqual(trees[HtmlReader._make_tree].find('.//p').text, 'First para')
+        self.assertEqual(d.elements[0].text, 'First para')
+        d = ReaderRegistry([FailingHtmlReader(), HtmlReader()]).read(html, fname='paper.html')
+        self.assertEqual(d.elements[0].text, 'First para')
+
+    def test_read_failure(self):
+        """Test a ReaderError is raised when no reader can read the file."""
+        with self.assertRaises(ReaderError):
+            ReaderRegistry([FailingHtmlReader()]).read(b'<p>Text</p>', fname='paper.html')
+
+
+if __name__ == '__main__':
+    unittest.main()
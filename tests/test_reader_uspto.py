@@ -52,6 +52,20 @@ class TestUsptoReader(unittest.TestCase):
         d = Document.from_file(f, readers=[UsptoXmlReader()])
         self.assertEqual(len(d.elements), 112)
 
+    def test_iterread(self):
+        """Test UsptoXmlReader reading each patent in a bulk archive of concatenated patents."""
+        r = UsptoXmlReader()
+        fname = 'US06840965B2.xml'
+        f = io.open(os.path.join(os.path.dirname(__file__), 'data', 'uspto', fname), 'rb')
+        content = f.read()
+        f.close()
+        expected = [el.text for el in r.readstring(content).elements[:5]]
+        docs = list(r.iterread(io.BytesIO(content * 3)))
+        self.assertEqual(len(docs), 3)
+        for d in docs:
+            self.assertEqual(len(d.elements), 112)
+            self.assertEqual([el.text for el in d.elements[:5]], expected)
+
 
 if __name__ == '__main__':
     unittest.main()